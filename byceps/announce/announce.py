@@ -10,7 +10,6 @@ from datetime import datetime
 from http import HTTPStatus
 from typing import Any
 
-import httpx
 import structlog
 
 from byceps.events.base import _BaseEvent
@@ -18,19 +17,13 @@ from byceps.services.webhooks import webhook_service
 from byceps.services.webhooks.models import AnnouncementRequest, OutgoingWebhook
 from byceps.util.jobqueue import enqueue, enqueue_at
 
+from . import delivery
 from .connections import get_signals, registry
 
 
-DEFAULT_WEBHOOK_TIMEOUT = 15
-
-
 log = structlog.get_logger()
 
 
-class WebhookError(Exception):
-    pass
-
-
 def enable_announcements() -> None:
     for signal in get_signals():
         signal.connect(_receive_signal)
@@ -42,8 +35,8 @@ def _receive_signal(sender, *, event: _BaseEvent | None = None) -> None:
 
     event_name = get_name_for_event(event)
     webhooks = _get_webhooks(event_name)
-    for webhook in webhooks:
-        enqueue(_handle_event, event, webhook)
+    if webhooks:
+        enqueue(_handle_event, event, webhooks)
 
 
 def get_event_names() -> set[str]:
@@ -67,12 +60,14 @@ def _get_webhooks(event_name: str) -> list[OutgoingWebhook]:
     return webhooks
 
 
-def _handle_event(event: _BaseEvent, webhook: OutgoingWebhook) -> None:
-    announcement_request = build_announcement_request(event, webhook)
-    if announcement_request is None:
-        return
+def _handle_event(event: _BaseEvent, webhooks: list[OutgoingWebhook]) -> None:
+    announcement_requests = []
+    for webhook in webhooks:
+        announcement_request = build_announcement_request(event, webhook)
+        if announcement_request is not None:
+            announcement_requests.append(announcement_request)
 
-    announce(announcement_request)
+    announce_all(announcement_requests)
 
 
 def build_announcement_request(
@@ -109,6 +104,7 @@ def assemble_announcement_request(
         data=data,
         expected_response_status_code=expected_response_status_code,
         announce_at=announce_at,
+        format=webhook.format,
     )
 
 
@@ -149,33 +145,36 @@ def _assemble_request_data(
 
 
 def announce(announcement_request: AnnouncementRequest) -> None:
-    announce_at = announcement_request.announce_at
-    if announce_at is not None:
-        # Schedule job to announce later.
-        enqueue_at(announce_at, call_webhook, announcement_request)
-    else:
-        # Announce now.
-        call_webhook(announcement_request)
+    announce_all([announcement_request])
 
 
-def call_webhook(announcement_request: AnnouncementRequest) -> None:
-    """Send HTTP request to the webhook."""
-    response = httpx.post(
-        announcement_request.url,
-        json=announcement_request.data,
-        timeout=DEFAULT_WEBHOOK_TIMEOUT,
-    )
+def announce_all(announcement_requests: list[AnnouncementRequest]) -> None:
+    """Announce now or schedule for later, as requested.
 
-    expected_response_code = announcement_request.expected_response_status_code
-    if expected_response_code is None:
-        return
+    Requests to be announced now are sent concurrently. Those to
+    endpoints that accept multi-line messages might be deferred
+    (briefly) to be coalesced with others.
+    """
+    requests_to_deliver_now = []
+
+    for announcement_request in announcement_requests:
+        announce_at = announcement_request.announce_at
+        if announce_at is not None:
+            # Schedule job to announce later.
+            enqueue_at(announce_at, call_webhook, announcement_request)
+            continue
+
+        if delivery.defer_for_coalescing(announcement_request):
+            continue
+
+        requests_to_deliver_now.append(announcement_request)
 
-    actual_response_code = response.status_code
-    if actual_response_code != expected_response_code:
-        raise WebhookError(
-            f'Endpoint for webhook {announcement_request.webhook_id} '
-            f'returned unexpected status code {actual_response_code}'
-        )
+    delivery.deliver(requests_to_deliver_now)
+
+
+def call_webhook(announcement_request: AnnouncementRequest) -> None:
+    """Send HTTP request to the webhook."""
+    delivery.send(announcement_request)
 
 
 _EXPECTED_RESPONSE_STATUS_CODES = {
@@ -0,0 +1,387 @@
+"""
+byceps.announce.delivery
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Delivery of announcement requests to webhook endpoints
+
+Requests are sent through a shared, connection-pooling HTTP client.
+Requests to different endpoints are sent concurrently, requests to the
+same endpoint are rate-limited (across processes, via Redis).
+
+During bursts, announcements to endpoints that accept multi-line
+messages are buffered (in Redis) and coalesced into as few requests as
+the endpoints' maximum text lengths allow.
+
+Requests that fail are retried later, each in a job of its own, so that
+a retry does not resend requests that have succeeded.
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timedelta
+from functools import cache
+import hashlib
+import json
+import time
+from uuid import UUID
+
+from flask import current_app
+import httpx
+import structlog
+
+from byceps.services.webhooks import webhook_delivery_stats_service
+from byceps.services.webhooks.models import AnnouncementRequest, WebhookID
+from byceps.util.jobqueue import enqueue_at
+
+
+DEFAULT_WEBHOOK_TIMEOUT = 15
+
+# Announcements to an endpoint that has been called within this period
+# are buffered and sent together once it has passed.
+COALESCING_WINDOW = timedelta(seconds=2)
+
+# Failed requests are retried once after this period.
+RETRY_DELAY = timedelta(seconds=30)
+
+_MAX_CONCURRENT_REQUESTS = 8
+_MIN_SECONDS_BETWEEN_REQUESTS_PER_ENDPOINT = 0.5
+
+# Formats whose endpoints accept multi-line texts, mapped to the name
+# of the request data field that contains the text.
+_MULTI_LINE_TEXT_FIELD_NAMES = {
+    'discord': 'content',
+    'matrix': 'text',
+    'mattermost': 'text',
+}
+
+# Maximum text lengths (in characters) accepted by endpoints of these
+# formats
+_MAX_TEXT_LENGTHS = {
+    'discord': 2000,
+    'mattermost': 16383,
+}
+
+
+log = structlog.get_logger()
+
+
+class WebhookError(Exception):
+    pass
+
+
+# -------------------------------------------------------------------- #
+# sending
+
+
+@cache
+def _get_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client."""
+    return httpx.Client(
+        timeout=DEFAULT_WEBHOOK_TIMEOUT,
+        limits=httpx.Limits(
+            max_connections=_MAX_CONCURRENT_REQUESTS * 2,
+            max_keepalive_connections=_MAX_CONCURRENT_REQUESTS,
+        ),
+    )
+
+
+def deliver(announcement_requests: Iterable[AnnouncementRequest]) -> None:
+    """Send the announcement requests.
+
+    Requests to different endpoints are sent concurrently.
+
+    A single request that fails raises an exception. If multiple
+    requests are sent, those that fail are scheduled to be retried,
+    each on its own.
+    """
+    announcement_requests = list(announcement_requests)
+    if not announcement_requests:
+        return
+
+    if len(announcement_requests) == 1:
+        send(announcement_requests[0])
+        return
+
+    app = current_app._get_current_object()
+
+    def send_in_app_context(announcement_request: AnnouncementRequest) -> None:
+        with app.app_context():
+            send(announcement_request)
+
+    max_workers = min(len(announcement_requests), _MAX_CONCURRENT_REQUESTS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(send_in_app_context, announcement_request)
+            for announcement_request in announcement_requests
+        ]
+
+    for announcement_request, future in zip(
+        announcement_requests, futures, strict=True
+    ):
+        error = future.exception()
+        if error is None:
+            continue
+
+        log.warning(
+            'Webhook call failed, scheduling retry',
+            webhook_id=str(announcement_request.webhook_id),
+            error=str(error),
+        )
+        enqueue_at(datetime.utcnow() + RETRY_DELAY, send, announcement_request)
+
+
+def send(announcement_request: AnnouncementRequest) -> None:
+    """Send the announcement request to its endpoint."""
+    _wait_for_endpoint_slot(announcement_request.url)
+
+    started_at = time.monotonic()
+    failed = True
+    try:
+        response = _get_http_client().post(
+            announcement_request.url, json=announcement_request.data
+        )
+        _ensure_expected_status_code(announcement_request, response)
+        failed = False
+    finally:
+        duration = time.monotonic() - started_at
+        webhook_delivery_stats_service.record_call(
+            announcement_request.webhook_id, duration, failed
+        )
+        log.info(
+            'Webhook called',
+            webhook_id=str(announcement_request.webhook_id),
+            duration_ms=round(duration * 1000),
+            failed=failed,
+        )
+
+
+def _ensure_expected_status_code(
+    announcement_request: AnnouncementRequest, response: httpx.Response
+) -> None:
+    expected_response_code = announcement_request.expected_response_status_code
+    if expected_response_code is None:
+        return
+
+    actual_response_code = response.status_code
+    if actual_response_code != expected_response_code:
+        raise WebhookError(
+            f'Endpoint for webhook {announcement_request.webhook_id} '
+            f'returned unexpected status code {actual_response_code}'
+        )
+
+
+# -------------------------------------------------------------------- #
+# rate limiting
+
+
+def _wait_for_endpoint_slot(endpoint: str) -> None:
+    """Block until a request to the endpoint may be sent.
+
+    Slots are claimed in Redis so that the minimum interval between
+    requests to an endpoint is kept across jobs and worker processes.
+    """
+    interval_ms = int(_MIN_SECONDS_BETWEEN_REQUESTS_PER_ENDPOINT * 1000)
+    if interval_ms < 1:
+        return
+
+    redis_client = current_app.redis_client
+    key = _get_rate_limit_key(endpoint)
+
+    while not redis_client.set(key, 1, nx=True, px=interval_ms):
+        remaining_ms = redis_client.pttl(key)
+        if remaining_ms > 0:
+            time.sleep(remaining_ms / 1000)
+
+
+def _get_rate_limit_key(endpoint: str) -> str:
+    # Do not put the URL, which might contain credentials, into the key.
+    endpoint_hash = hashlib.sha256(endpoint.encode()).hexdigest()
+    return f'announce:endpoint:{endpoint_hash}:rate_limit'
+
+
+# -------------------------------------------------------------------- #
+# coalescing
+
+
+def is_coalescable(announcement_request: AnnouncementRequest) -> bool:
+    """Return `True` if the request's endpoint accepts multi-line texts."""
+    return announcement_request.format in _MULTI_LINE_TEXT_FIELD_NAMES
+
+
+def coalesce(
+    announcement_requests: Iterable[AnnouncementRequest],
+) -> list[AnnouncementRequest]:
+    """Merge consecutive requests to the same webhook into single
+    requests with multi-line texts, where the format allows that.
+
+    Merged texts do not exceed the format's maximum text length; a new
+    request is started instead.
+    """
+    coalesced: list[AnnouncementRequest] = []
+
+    for announcement_request in announcement_requests:
+        if coalesced and _can_merge(coalesced[-1], announcement_request):
+            coalesced[-1] = _merge(coalesced[-1], announcement_request)
+        else:
+            coalesced.append(announcement_request)
+
+    return coalesced
+
+
+def _can_merge(
+    request1: AnnouncementRequest, request2: AnnouncementRequest
+) -> bool:
+    if not is_coalescable(request1):
+        return False
+
+    text_field_name = _get_text_field_name(request1)
+
+    max_text_length = _MAX_TEXT_LENGTHS.get(request1.format or '')
+    if max_text_length is not None:
+        merged_text_length = (
+            len(request1.data[text_field_name])
+            + 1  # line break
+            + len(request2.data[text_field_name])
+        )
+        if merged_text_length > max_text_length:
+            return False
+
+    return (
+        (request1.webhook_id == request2.webhook_id)
+        and (request1.url == request2.url)
+        and (request1.format == request2.format)
+        and (
+            _data_without(request1.data, text_field_name)
+            == _data_without(request2.data, text_field_name)
+        )
+    )
+
+
+def _merge(
+    request1: AnnouncementRequest, request2: AnnouncementRequest
+) -> AnnouncementRequest:
+    text_field_name = _get_text_field_name(request1)
+    text = (
+        request1.data[text_field_name] + '\n' + request2.data[text_field_name]
+    )
+    return replace(request1, data={**request1.data, text_field_name: text})
+
+
+def _get_text_field_name(announcement_request: AnnouncementRequest) -> str:
+    return _MULTI_LINE_TEXT_FIELD_NAMES[announcement_request.format or '']
+
+
+def _data_without(data: dict, key: str) -> dict:
+    return {k: v for k, v in data.items() if k != key}
+
+
+def defer_for_coalescing(announcement_request: AnnouncementRequest) -> bool:
+    """Buffer the request if its endpoint accepts multi-line messages and
+    its webhook has been called recently.
+
+    Buffered requests to the same webhook are sent together, coalesced,
+    once the coalescing window has passed.
+
+    Return `True` if the request has been buffered, `False` if it should
+    be sent right away.
+    """
+    if not is_coalescable(announcement_request):
+        return False
+
+    webhook_id = announcement_request.webhook_id
+    redis_client = current_app.redis_client
+
+    window_ms = int(COALESCING_WINDOW.total_seconds() * 1000)
+
+    endpoint_was_idle = redis_client.set(
+        _get_cooldown_key(webhook_id), 1, nx=True, px=window_ms
+    )
+    if endpoint_was_idle:
+        return False
+
+    redis_client.rpush(
+        _get_buffer_key(webhook_id), _serialize(announcement_request)
+    )
+
+    # Schedule a flush unless one is already pending. The flag expires
+    # eventually in case the flush job gets lost.
+    flush_needs_scheduling = redis_client.set(
+        _get_flush_key(webhook_id), 1, nx=True, px=window_ms * 10
+    )
+    if flush_needs_scheduling:
+        enqueue_at(
+            datetime.utcnow() + COALESCING_WINDOW,
+            flush_deferred,
+            webhook_id,
+        )
+
+    return True
+
+
+def flush_deferred(webhook_id: WebhookID) -> None:
+    """Send the buffered requests to the webhook, coalesced."""
+    redis_client = current_app.redis_client
+
+    buffer_key = _get_buffer_key(webhook_id)
+
+    pipeline = redis_client.pipeline()
+    pipeline.lrange(buffer_key, 0, -1)
+    pipeline.delete(buffer_key)
+    # Remove the flag in the same transaction so that a request buffered
+    # right after this will schedule another flush.
+    pipeline.delete(_get_flush_key(webhook_id))
+    serialized_requests, _, _ = pipeline.execute()
+
+    if not serialized_requests:
+        return
+
+    # Keep buffering while announcements keep coming in.
+    window_ms = int(COALESCING_WINDOW.total_seconds() * 1000)
+    redis_client.set(_get_cooldown_key(webhook_id), 1, px=window_ms)
+
+    announcement_requests = _deserialize_all(serialized_requests)
+    deliver(coalesce(announcement_requests))
+
+
+def _get_cooldown_key(webhook_id: WebhookID) -> str:
+    return f'announce:webhook:{webhook_id}:cooldown'
+
+
+def _get_buffer_key(webhook_id: WebhookID) -> str:
+    return f'announce:webhook:{webhook_id}:buffer'
+
+
+def _get_flush_key(webhook_id: WebhookID) -> str:
+    return f'announce:webhook:{webhook_id}:flush_scheduled'
+
+
+def _serialize(announcement_request: AnnouncementRequest) -> str:
+    return json.dumps(
+        {
+            'webhook_id': str(announcement_request.webhook_id),
+            'url': announcement_request.url,
+            'data': announcement_request.data,
+            'expected_response_status_code': (
+                announcement_request.expected_response_status_code
+            ),
+            'format': announcement_request.format,
+        }
+    )
+
+
+def _deserialize_all(
+    serialized_requests: Iterable[bytes],
+) -> Iterator[AnnouncementRequest]:
+    for serialized_request in serialized_requests:
+        obj = json.loads(serialized_request)
+        yield AnnouncementRequest(
+            webhook_id=WebhookID(UUID(obj['webhook_id'])),
+            url=obj['url'],
+            data=obj['data'],
+            expected_response_status_code=obj['expected_response_status_code'],
+            format=obj['format'],
+        )
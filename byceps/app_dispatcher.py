@@ -8,9 +8,12 @@ Serve multiple apps together.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import os
 from pathlib import Path
 from threading import Lock
+import time
 from typing import Any
 from wsgiref.types import WSGIApplication
 
@@ -66,6 +69,28 @@ def _get_apps_config_filename() -> Result[Path, str]:
     return Ok(filename)
 
 
+def get_warm_up_worker_count() -> Result[int, str]:
+    """Return the number of applications to build in parallel at
+    startup, or zero if applications should be built lazily on the first
+    request to their host.
+    """
+    value = os.environ.get('BYCEPS_APPS_WARM_UP_WORKERS')
+    if not value:
+        return Ok(0)
+
+    try:
+        worker_count = int(value)
+    except ValueError:
+        worker_count = -1
+
+    if worker_count < 0:
+        return Err(
+            'Environment variable BYCEPS_APPS_WARM_UP_WORKERS must be set to a non-negative integer'
+        )
+
+    return Ok(worker_count)
+
+
 def _load_apps_config(path: Path) -> Result[AppsConfig, str]:
     if not path.exists():
         return Err(f'Applications configuration file "{path}" does not exist')
@@ -109,9 +134,22 @@ def create_dispatcher_app(
     apps_config: AppsConfig,
     *,
     config_overrides: dict[str, Any] | None = None,
+    warm_up_worker_count: int = 0,
 ) -> Flask:
+    """Create an application that dispatches requests to the configured
+    applications by host.
+
+    If a warm-up worker count is given, all applications are built right
+    away, that many in parallel. Otherwise, each application is built on
+    the first request to its host.
+    """
+    dispatcher = AppDispatcher(apps_config, config_overrides=config_overrides)
+
+    if warm_up_worker_count > 0:
+        dispatcher.mount_all(max_workers=warm_up_worker_count)
+
     app = Flask('dispatcher')
-    app.wsgi_app = AppDispatcher(apps_config, config_overrides=config_overrides)
+    app.wsgi_app = dispatcher
     return app
 
 
@@ -122,7 +160,10 @@ class AppDispatcher:
         *,
         config_overrides: dict[str, Any] | None = None,
     ) -> None:
-        self.lock = Lock()
+        # One lock per host, so that building one application does not
+        # block requests to other hosts.
+        self.locks_by_host: defaultdict[str, Lock] = defaultdict(Lock)
+        self.locks_by_host_lock = Lock()
         self.app_configs_by_host = {
             app_config.server_name: app_config
             for app_config in _get_all_app_configs(apps_config)
@@ -137,38 +178,74 @@ class AppDispatcher:
     def get_application(self, host_and_port) -> WSGIApplication:
         host = host_and_port.split(':')[0]
 
-        log_ctx = log.bind(host=host)
+        # Fast path: Applications are never unmounted, so no lock is
+        # required to look up one that is already mounted.
+        app = self.apps_by_host.get(host)
+        if app:
+            return app
 
-        with self.lock:
-            app = self.apps_by_host.get(host)
+        app_config = self.app_configs_by_host.get(host)
+        if not app_config:
+            log.debug('No application configured for host', host=host)
+            return NotFound()
 
+        with self._get_lock(host):
+            # Another thread might have mounted the application in the
+            # meantime.
+            app = self.apps_by_host.get(host)
             if app:
                 return app
 
-            app_config = self.app_configs_by_host.get(host)
-            if not app_config:
-                log_ctx.debug('No application configured for host')
-                return NotFound()
-
-            match _create_app(
-                app_config, config_overrides=self.config_overrides
-            ):
-                case Ok(app):
-                    self.apps_by_host[host] = app
-                    mode = app.byceps_app_mode
-                    if mode.is_site():
-                        log_ctx = log_ctx.bind(site_id=app.config['SITE_ID'])
-                    log_ctx.info('Application mounted', mode=mode.name)
-                    return app
-                case Err(e):
-                    log_ctx.error('Application creation failed', error=e)
-                    return InternalServerError(e)
-                case _:
-                    error_message = 'Unknown error'
-                    log_ctx.error(
-                        'Application creation failed', error=error_message
-                    )
-                    return InternalServerError(error_message)
+            return self._mount(host, app_config)
+
+    def mount_all(self, *, max_workers: int = 1) -> None:
+        """Build and mount the applications for all configured hosts,
+        up to `max_workers` of them in parallel.
+        """
+        started_at = time.monotonic()
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='app-warm-up'
+        ) as executor:
+            # Consume results to wait for all applications.
+            list(executor.map(self.get_application, self.app_configs_by_host))
+
+        log.info(
+            'All applications mounted',
+            app_count=len(self.apps_by_host),
+            duration_ms=round((time.monotonic() - started_at) * 1000),
+        )
+
+    def _get_lock(self, host: str) -> Lock:
+        with self.locks_by_host_lock:
+            return self.locks_by_host[host]
+
+    def _mount(self, host: str, app_config: AppConfig) -> WSGIApplication:
+        log_ctx = log.bind(host=host)
+
+        started_at = time.monotonic()
+
+        match _create_app(app_config, config_overrides=self.config_overrides):
+            case Ok(app):
+                self.apps_by_host[host] = app
+                mode = app.byceps_app_mode
+                if mode.is_site():
+                    log_ctx = log_ctx.bind(site_id=app.config['SITE_ID'])
+                log_ctx.info(
+                    'Application mounted',
+                    mode=mode.name,
+                    duration_ms=round((time.monotonic() - started_at) * 1000),
+                )
+                return app
+            case Err(e):
+                log_ctx.error('Application creation failed', error=e)
+                return InternalServerError(e)
+            case _:
+                error_message = 'Unknown error'
+                log_ctx.error(
+                    'Application creation failed', error=error_message
+                )
+                return InternalServerError(error_message)
 
 
 def _create_app(
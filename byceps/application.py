@@ -87,13 +87,20 @@ def create_cli_app(
     return _create_app(AppMode.cli, config_overrides=config_overrides)
 
 
-def create_metrics_app(database_uri: str) -> BycepsApp:
+def create_metrics_app(
+    database_uri: str, redis_url: str, *, jobs_async: bool = True
+) -> BycepsApp:
     app = BycepsApp(AppMode.metrics)
 
     app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+    app.config['JOBS_ASYNC'] = jobs_async
 
+    # Required only if jobs are run synchronously.
     db.init_app(app)
 
+    # Metrics are served from snapshots stored in Redis.
+    app.redis_client = Redis.from_url(redis_url)
+
     blueprint = get_blueprint('monitoring.metrics')
     app.register_blueprint(blueprint)
 
@@ -230,6 +237,7 @@ def _get_config_from_environment() -> dict[str, Any]:
         'REDIS_URL',
         'SECRET_KEY',
         'SESSION_COOKIE_SECURE',
+        'SHOP_ORDER_NUMBER_BLOCK_SIZE',
         'SITE_ID',
         'SQLALCHEMY_DATABASE_URI',
         'STYLE_GUIDE_ENABLED',
@@ -281,7 +289,11 @@ def _dispatch_apps_by_url_path(app: BycepsApp) -> None:
         and app.byceps_app_mode.is_admin()
     )
     if metrics_enabled:
-        metrics_app = create_metrics_app(app.config['SQLALCHEMY_DATABASE_URI'])
+        metrics_app = create_metrics_app(
+            app.config['SQLALCHEMY_DATABASE_URI'],
+            app.config['REDIS_URL'],
+            jobs_async=app.config.get('JOBS_ASYNC', True),
+        )
         mounts['/metrics'] = metrics_app
     app.byceps_feature_states['metrics'] = metrics_enabled
 
@@ -10,7 +10,10 @@ import structlog
 
 from byceps.services.authn import authn_service
 from byceps.services.authn.errors import AuthenticationFailedError
-from byceps.services.authn.session import authn_session_service
+from byceps.services.authn.session import (
+    authn_session_service,
+    current_user_cache,
+)
 from byceps.services.authn.session.authn_session_service import (
     UserLoggedInEvent,
 )
@@ -79,6 +82,7 @@ def log_in_user(
 
 def log_out_user(user: User) -> None:
     user_session.end()
+    current_user_cache.invalidate_user(user.id)
 
     log.info(
         'User logged out',
@@ -13,7 +13,7 @@ from flask import g, redirect, url_for
 import sentry_sdk
 
 from byceps.services.brand import brand_service
-from byceps.services.text_markup import text_markup_service
+from byceps.services.text_markup import rendered_html_cache
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.l10n import get_locales
 from byceps.util.user_session import get_current_user
@@ -22,7 +22,7 @@ from byceps.util.user_session import get_current_user
 blueprint = create_blueprint('core_admin', __name__)
 
 
-blueprint.add_app_template_filter(text_markup_service.render_html, 'bbcode')
+blueprint.add_app_template_filter(rendered_html_cache.get_html, 'bbcode')
 
 
 @blueprint.app_context_processor
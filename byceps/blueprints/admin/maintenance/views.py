@@ -15,6 +15,7 @@ from byceps.services.verification_token import verification_token_service
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_success
 from byceps.util.framework.templating import templated
+from byceps.util.templating import get_template_cache_stats
 from byceps.util.views import permission_required, respond_no_content
 
 
@@ -39,9 +40,12 @@ def index():
         verification_token_counts_by_purpose.values()
     )
 
+    template_cache_stats = get_template_cache_stats()
+
     return {
         'verification_token_counts_by_purpose_name': verification_token_counts_by_purpose_name,
         'verification_token_total': verification_token_total,
+        'template_cache_stats': template_cache_stats,
     }
 
 
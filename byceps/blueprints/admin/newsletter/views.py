@@ -6,10 +6,11 @@ byceps.blueprints.admin.newsletter.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass
-from operator import attrgetter
+import json
 
-from flask import abort
+from flask import abort, Response, stream_with_context
 from flask_babel import gettext
 
 from byceps.services.brand import brand_service
@@ -18,17 +19,12 @@ from byceps.services.newsletter import (
     newsletter_command_service,
     newsletter_service,
 )
-from byceps.services.newsletter.models import List, ListID
+from byceps.services.newsletter.models import List, ListID, Subscriber
 from byceps.services.user import user_stats_service
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_success
 from byceps.util.framework.templating import templated
-from byceps.util.views import (
-    jsonified,
-    permission_required,
-    redirect_to,
-    textified,
-)
+from byceps.util.views import permission_required, redirect_to, textified
 
 
 blueprint = create_blueprint('newsletter_admin', __name__)
@@ -109,18 +105,50 @@ def view_subscriptions(list_id):
 
 @blueprint.get('/lists/<list_id>/subscriptions/export')
 @permission_required('newsletter.export_subscribers')
-@jsonified
 def export_subscribers(list_id):
     """Export the screen names and email addresses of enabled users
     which are currently subscribed to that list as JSON.
+
+    The response is streamed as subscribers are fetched.
     """
     list_ = _get_list_or_404(list_id)
 
     subscribers = newsletter_service.get_subscribers_to_list(list_.id)
 
-    exports = list(map(assemble_subscriber_export, subscribers))
+    return Response(
+        stream_with_context(_generate_json(subscribers)),
+        mimetype='application/json',
+    )
+
 
-    return {'subscribers': exports}
+def _generate_json(subscribers: Iterator[Subscriber]) -> Iterator[str]:
+    yield '{"subscribers": ['
+    for i, subscriber in enumerate(subscribers):
+        if i > 0:
+            yield ', '
+        yield json.dumps(assemble_subscriber_export(subscriber))
+    yield ']}'
+
+
+@blueprint.get('/lists/<list_id>/subscriptions/export.ndjson')
+@permission_required('newsletter.export_subscribers')
+def export_subscribers_as_ndjson(list_id):
+    """Export the screen names and email addresses of enabled users
+    which are currently subscribed to that list as newline-delimited
+    JSON, with one subscriber per line.
+
+    The response is streamed as subscribers are fetched.
+    """
+    list_ = _get_list_or_404(list_id)
+
+    subscribers = newsletter_service.get_subscribers_to_list(list_.id)
+
+    lines = (
+        json.dumps(assemble_subscriber_export(subscriber)) + '\n'
+        for subscriber in subscribers
+    )
+
+    return Response(stream_with_context(lines), mimetype='application/x-ndjson')
 
 
 def assemble_subscriber_export(subscriber):
@@ -140,8 +168,17 @@ def export_subscriber_email_addresses(list_id):
     list_ = _get_list_or_404(list_id)
 
     subscribers = newsletter_service.get_subscribers_to_list(list_.id)
-    email_addresses = map(attrgetter('email_address'), subscribers)
-    return '\n'.join(email_addresses)
+
+    return _generate_email_addresses(subscribers)
+
+
+def _generate_email_addresses(
+    subscribers: Iterator[Subscriber],
+) -> Iterator[str]:
+    for i, subscriber in enumerate(subscribers):
+        if i > 0:
+            yield '\n'
+        yield subscriber.email_address
 
 
 def _get_brand_or_404(brand_id: BrandID) -> Brand:
@@ -6,7 +6,9 @@ byceps.blueprints.admin.shop.order.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import abort, g, request, Response
+from datetime import datetime
+
+from flask import abort, g, request, Response, stream_with_context
 from flask_babel import gettext
 
 from byceps.services.brand import brand_service
@@ -160,6 +162,34 @@ def export(order_id):
     )
 
 
+@blueprint.get('/for_shop/<shop_id>/export')
+@permission_required('shop_order.view')
+def export_for_shop(shop_id):
+    """Export the shop's orders as a single XML document.
+
+    The orders can be limited to those created within a period (with
+    dates in ISO 8601 format, the end being exclusive) and to those in
+    a payment state.
+    """
+    shop = _get_shop_or_404(shop_id)
+
+    created_from = _get_datetime_arg_or_400('created_from')
+    created_before = _get_datetime_arg_or_400('created_before')
+    only_payment_state = _get_payment_state_arg_or_400('only_payment_state')
+
+    xml = order_export_service.export_orders_for_shop_as_xml(
+        shop.id,
+        created_from=created_from,
+        created_before=created_before,
+        only_payment_state=only_payment_state,
+    )
+
+    return Response(
+        stream_with_context(xml),
+        content_type=order_export_service.CONTENT_TYPE,
+    )
+
+
 # -------------------------------------------------------------------- #
 # invoice
 
@@ -569,5 +599,27 @@ def _get_order_or_404(order_id):
     return order
 
 
+def _get_datetime_arg_or_400(name: str) -> datetime | None:
+    value = request.args.get(name)
+    if not value:
+        return None
+
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        abort(400, f'Invalid date "{value}" for argument "{name}"')
+
+
+def _get_payment_state_arg_or_400(name: str) -> PaymentState | None:
+    value = request.args.get(name)
+    if not value:
+        return None
+
+    try:
+        return PaymentState[value]
+    except KeyError:
+        abort(400, f'Unknown payment state "{value}"')
+
+
 def _find_order_payment_method_label(payment_method):
     return order_service.find_payment_method_label(payment_method)
@@ -14,6 +14,7 @@ from byceps.services.shop.order import order_service
 from byceps.services.ticketing import (
     ticket_bundle_service,
     ticket_category_service,
+    ticket_export_service,
     ticket_service,
     ticket_user_management_service,
 )
@@ -21,7 +22,7 @@ from byceps.services.ticketing.ticket_service import FilterMode
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_error, flash_success
 from byceps.util.framework.templating import templated
-from byceps.util.views import permission_required, redirect_to
+from byceps.util.views import permission_required, redirect_to, textified
 
 from . import service
 from .forms import SpecifyUserForm, UpdateCodeForm
@@ -104,6 +105,16 @@ def index_for_party(party_id, page):
     }
 
 
+@blueprint.get('/tickets/for_party/<party_id>/export')
+@permission_required('ticketing.view')
+@textified
+def export_tickets_for_party(party_id):
+    """Export the party's tickets as CSV."""
+    party = _get_party_or_404(party_id)
+
+    return ticket_export_service.export_tickets_for_party_as_csv(party.id)
+
+
 @blueprint.get('/tickets/<uuid:ticket_id>')
 @permission_required('ticketing.view')
 @templated
@@ -7,11 +7,15 @@ byceps.blueprints.api.decorators
 """
 
 from functools import wraps
+import time
 
 from flask import abort, request
 from werkzeug.datastructures import WWWAuthenticate
 
-from byceps.services.authn.api import authn_api_service
+from byceps.services.authn.api import (
+    api_token_usage_service,
+    authn_api_service,
+)
 
 
 def api_token_required(func):
@@ -21,7 +25,9 @@ def api_token_required(func):
     def wrapper(*args, **kwargs):
         request_token = _extract_token_from_request()
         if request_token:
-            api_token = authn_api_service.find_api_token_by_token(request_token)
+            api_token = authn_api_service.find_api_token_by_token_cached(
+                request_token
+            )
         else:
             api_token = None
 
@@ -34,7 +40,12 @@ def api_token_required(func):
             www_authenticate['error'] = 'invalid_token'
             abort(401, www_authenticate=www_authenticate)
 
-        return func(*args, **kwargs)
+        started_at = time.monotonic()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            duration = time.monotonic() - started_at
+            api_token_usage_service.record_request(api_token.id, duration)
 
     return wrapper
 
@@ -11,6 +11,9 @@ from typing import Any
 
 from flask import current_app, g, render_template
 
+from byceps.services.authn.password.password_hashing_executor import (
+    PasswordHashingOverloadedError,
+)
 from byceps.util.authz import (
     has_current_user_any_permission,
     has_current_user_permission,
@@ -32,6 +35,17 @@ def not_found(error) -> tuple[str, int]:
     return render_template('error/not_found.html'), 404
 
 
+@blueprint.app_errorhandler(PasswordHashingOverloadedError)
+def password_hashing_overloaded(
+    error,
+) -> tuple[str, int, dict[str, str]]:
+    return (
+        render_template('error/service_unavailable.html'),
+        503,
+        {'Retry-After': '5'},
+    )
+
+
 @blueprint.app_context_processor
 def inject_template_variables() -> dict[str, Any]:
     return {
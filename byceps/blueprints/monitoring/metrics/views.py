@@ -8,9 +8,11 @@ Metrics export for `Prometheus <https://prometheus.io/>`_
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from datetime import datetime
+
 from flask import Response
 
-from byceps.services.metrics import metrics_service
+from byceps.services.metrics import metrics_snapshot_service
 from byceps.util.framework.blueprint import create_blueprint
 
 
@@ -19,8 +21,18 @@ blueprint = create_blueprint('metrics', __name__)
 
 @blueprint.get('/')
 def metrics():
-    """Return metrics."""
-    metrics = metrics_service.collect_metrics()
-    lines = list(metrics_service.serialize(metrics))
+    """Return metrics from the latest snapshot."""
+    metrics_snapshot_service.request_refresh_if_stale()
+
+    snapshot = metrics_snapshot_service.find_snapshot()
+    if snapshot is None:
+        return Response([], status=200, mimetype='text/plain; version=0.0.4')
+
+    lines = snapshot.lines
+
+    age = datetime.utcnow() - snapshot.created_at
+    lines.append(
+        f'metrics_snapshot_age_seconds {round(age.total_seconds(), 3)}\n'
+    )
 
     return Response(lines, status=200, mimetype='text/plain; version=0.0.4')
@@ -12,7 +12,10 @@ import structlog
 
 from byceps.services.authn import authn_service
 from byceps.services.authn.errors import AuthenticationFailedError
-from byceps.services.authn.session import authn_session_service
+from byceps.services.authn.session import (
+    authn_session_service,
+    current_user_cache,
+)
 from byceps.services.authn.session.authn_session_service import (
     UserLoggedInEvent,
 )
@@ -92,6 +95,7 @@ def _is_consent_required(user_id: UserID, brand_id: BrandID) -> bool:
 
 def log_out_user(user: User, site: Site) -> None:
     user_session.end()
+    current_user_cache.invalidate_user(user.id)
 
     log.info(
         'User logged out',
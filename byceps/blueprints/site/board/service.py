@@ -26,6 +26,7 @@ from byceps.services.orga_team import orga_team_service
 from byceps.services.party import party_service
 from byceps.services.party.models import Party, PartyID
 from byceps.services.site import site_setting_service
+from byceps.services.text_markup import rendered_html_cache
 from byceps.services.ticketing import ticket_service
 from byceps.services.user import user_service
 from byceps.services.user.models.user import UserID
@@ -74,25 +75,23 @@ def add_unseen_postings_flag_to_categories(
     """Add flag to each category stating if it contains postings unseen
     by the user.
     """
-    categories_with_flag = []
+    categories = list(categories)
 
-    for category in categories:
-        contains_unseen_postings = (
-            user.authenticated
-            and board_last_view_service.contains_category_unseen_postings(
-                category, user.id
+    if user.authenticated:
+        category_ids_with_unseen_postings = (
+            board_last_view_service.get_categories_with_unseen_postings(
+                categories, user.id
             )
         )
+    else:
+        category_ids_with_unseen_postings = set()
 
-        category_with_flag = (
-            CategoryWithLastUpdateAndUnseenFlag.from_category_with_last_update(
-                category, contains_unseen_postings
-            )
+    return [
+        CategoryWithLastUpdateAndUnseenFlag.from_category_with_last_update(
+            category, category.id in category_ids_with_unseen_postings
         )
-
-        categories_with_flag.append(category_with_flag)
-
-    return categories_with_flag
+        for category in categories
+    ]
 
 
 def add_topic_creators(db_topics: Iterable[DbTopic]) -> None:
@@ -110,12 +109,20 @@ def add_topic_unseen_flag(
     db_topics: Iterable[DbTopic], user: CurrentUser
 ) -> None:
     """Add `unseen` flag to topics."""
+    db_topics = list(db_topics)
+
+    if user.authenticated:
+        topic_ids_with_unseen_postings = (
+            board_last_view_service.get_topics_with_unseen_postings(
+                db_topics, user.id
+            )
+        )
+    else:
+        topic_ids_with_unseen_postings = set()
+
     for db_topic in db_topics:
         db_topic.contains_unseen_postings = (
-            user.authenticated
-            and board_last_view_service.contains_topic_unseen_postings(
-                db_topic, user.id
-            )
+            db_topic.id in topic_ids_with_unseen_postings
         )
 
 
@@ -127,6 +134,18 @@ def add_unseen_flag_to_postings(
         db_posting.unseen = is_posting_unseen(db_posting, last_viewed_at)
 
 
+def add_body_html_to_postings(db_postings: Sequence[DbPosting]) -> None:
+    """Add the attribute 'body_html' (the body rendered as HTML) to each
+    posting.
+    """
+    bodies_html = rendered_html_cache.get_htmls(
+        [db_posting.body for db_posting in db_postings]
+    )
+
+    for db_posting, body_html in zip(db_postings, bodies_html, strict=True):
+        db_posting.body_html = body_html
+
+
 def is_posting_unseen(db_posting: DbPosting, last_viewed_at: datetime) -> bool:
     """Return `True` if the posting has not yet been seen by the current
     user.
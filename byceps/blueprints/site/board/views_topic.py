@@ -129,6 +129,7 @@ def topic_view(topic_id, page):
     )
 
     service.add_unseen_flag_to_postings(postings.items, last_viewed_at)
+    service.add_body_html_to_postings(postings.items)
 
     is_last_page = not postings.has_next
 
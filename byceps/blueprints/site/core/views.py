@@ -14,7 +14,7 @@ import sentry_sdk
 
 from byceps.services.party import party_service
 from byceps.services.site import site_service
-from byceps.services.text_markup import text_markup_service
+from byceps.services.text_markup import rendered_html_cache
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.l10n import get_locales
 from byceps.util.user_session import get_current_user
@@ -23,7 +23,7 @@ from byceps.util.user_session import get_current_user
 blueprint = create_blueprint('core_site', __name__)
 
 
-blueprint.add_app_template_filter(text_markup_service.render_html, 'bbcode')
+blueprint.add_app_template_filter(rendered_html_cache.get_html, 'bbcode')
 
 
 @blueprint.app_template_global()
@@ -40,7 +40,7 @@ def url_for_site_file(filename, **kwargs) -> str | None:
 @blueprint.before_app_request
 def prepare_request_globals() -> None:
     site_id = current_app.config['SITE_ID']
-    site = site_service.get_site(site_id)
+    site = site_service.get_site_cached(site_id)
     g.site = site
     g.site_id = site.id
     sentry_sdk.set_tag('site_id', g.site_id)
@@ -51,7 +51,7 @@ def prepare_request_globals() -> None:
     party = None
     party_id = site.party_id
     if party_id is not None:
-        party = party_service.get_party(party_id)
+        party = party_service.get_party_cached(party_id)
         party_id = party.id
     g.party = party
     g.party_id = party_id
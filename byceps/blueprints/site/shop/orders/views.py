@@ -552,7 +552,7 @@ def _send_refund_request_confirmation_email(
 
     screen_name = g.user.screen_name or 'User'
 
-    brand = brand_service.get_brand(g.brand_id)
+    brand = brand_service.get_brand_cached(g.brand_id)
     language_code = get_user_locale(g.user)
 
     footer_result = email_footer_service.get_footer(brand, language_code)
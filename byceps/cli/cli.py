@@ -11,6 +11,8 @@ Command-line interface
 import click
 from flask.cli import AppGroup
 
+from .commands.aggregate_attendances import aggregate_attendances
+from .commands.aggregate_board import aggregate_board
 from .commands.create_database_tables import create_database_tables
 from .commands.create_superuser import create_superuser
 from .commands.export_roles import export_roles
@@ -29,6 +31,8 @@ def cli():
 
 
 for func in [
+    aggregate_attendances,
+    aggregate_board,
     create_database_tables,
     create_superuser,
     export_roles,
@@ -0,0 +1,30 @@
+"""
+byceps.cli.command.aggregate_attendances
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Recalculate the numbers of a brand's parties attended by users.
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from byceps.services.brand import brand_service
+from byceps.services.brand.models import BrandID
+from byceps.services.ticketing import ticket_attendance_service
+
+
+@click.command()
+@click.argument('brand_id')
+@with_appcontext
+def aggregate_attendances(brand_id: BrandID) -> None:
+    """Recalculate users' attendance counts for a brand."""
+    brand = brand_service.find_brand(brand_id)
+    if brand is None:
+        raise click.BadParameter(f'Unknown brand ID "{brand_id}"')
+
+    click.echo(f'Aggregating attendances for brand "{brand.id}" ... ', nl=False)
+    ticket_attendance_service.recalculate_attendance_counts_for_brand(brand.id)
+    click.secho('done.', fg='green')
@@ -11,6 +11,7 @@ Import seats from JSON lines.
 from collections import defaultdict
 from collections.abc import Iterable, Iterator
 from pathlib import Path
+import time
 
 import click
 from flask.cli import with_appcontext
@@ -27,8 +28,13 @@ from byceps.util.result import Err, Ok, Result
 @click.argument(
     'data_file', type=click.Path(exists=True, dir_okay=False, path_type=Path)
 )
+@click.option(
+    '--bulk',
+    is_flag=True,
+    help='Import all seats and seat groups at once, in a single transaction',
+)
 @with_appcontext
-def import_seats(party_id: PartyID, data_file: Path) -> None:
+def import_seats(party_id: PartyID, data_file: Path, bulk: bool) -> None:
     """Import seats."""
     with data_file.open() as f:
         lines = iter(f)
@@ -45,6 +51,15 @@ def import_seats(party_id: PartyID, data_file: Path) -> None:
         return
 
     line_numbers_and_seats_to_import = parse_result.unwrap()
+
+    if bulk:
+        seats_to_import = [
+            seat_to_import
+            for _, seat_to_import in line_numbers_and_seats_to_import
+        ]
+        _import_seats_in_bulk(party_id, seats_to_import)
+        return
+
     imported_seats_and_group_titles = list(
         _import_seats(line_numbers_and_seats_to_import)
     )
@@ -79,6 +94,30 @@ def _parse_seats(
     return Ok(line_numbers_and_seats_to_import)
 
 
+def _import_seats_in_bulk(
+    party_id: PartyID, seats_to_import: list[SeatToImport]
+) -> None:
+    """Import seats and seat groups into database in one go."""
+    start = time.perf_counter()
+    import_result = seat_import_service.import_seats(party_id, seats_to_import)
+    duration = time.perf_counter() - start
+
+    if import_result.is_err():
+        error_str = import_result.unwrap_err()
+        click.secho(f'Import of seats failed: {error_str}', fg='red')
+        return
+
+    summary = import_result.unwrap()
+    rows_per_second = summary.seat_count / duration if duration > 0 else 0
+
+    click.secho(
+        f'Imported {summary.seat_count} seats and '
+        f'{summary.seat_group_count} seat groups in {duration:.2f} seconds '
+        f'({rows_per_second:.0f} seats per second).',
+        fg='green',
+    )
+
+
 def _import_seats(
     line_numbers_and_seats_to_import: list[tuple[int, SeatToImport]],
 ) -> Iterator[tuple[Seat, str | None]]:
@@ -8,7 +8,9 @@ Import user accounts from JSON lines.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+import json
 from pathlib import Path
+import time
 
 import click
 from flask.cli import with_appcontext
@@ -20,9 +22,25 @@ from byceps.services.user import user_import_service
 @click.argument(
     'data_file', type=click.Path(exists=True, dir_okay=False, path_type=Path)
 )
+@click.option(
+    '--pipeline',
+    is_flag=True,
+    help='Import users in batches and print a summary as JSON',
+)
+@click.option(
+    '--hashing-workers',
+    type=click.IntRange(min=1),
+    help='Number of processes to hash passwords in (default: number of CPUs)',
+)
 @with_appcontext
-def import_users(data_file: Path) -> None:
+def import_users(
+    data_file: Path, pipeline: bool, hashing_workers: int | None
+) -> None:
     """Import user accounts."""
+    if pipeline:
+        _import_users_in_batches(data_file, hashing_workers)
+        return
+
     with data_file.open() as f:
         lines = user_import_service.parse_lines(f)
         for line_number, line in enumerate(lines, start=1):
@@ -37,3 +55,31 @@ def import_users(data_file: Path) -> None:
                 click.secho(
                     f'[line {line_number}] Could not import user: {e}', fg='red'
                 )
+
+
+def _import_users_in_batches(
+    data_file: Path, hashing_worker_count: int | None
+) -> None:
+    start = time.perf_counter()
+
+    with data_file.open() as f:
+        lines = user_import_service.parse_lines(f)
+        summary = user_import_service.import_users(
+            lines, hashing_worker_count=hashing_worker_count
+        )
+
+    duration = time.perf_counter() - start
+    users_per_second = summary.imported_count / duration if duration > 0 else 0
+
+    output = {
+        'imported': summary.imported_count,
+        'failed': len(summary.errors),
+        'duration_seconds': round(duration, 3),
+        'users_per_second': round(users_per_second, 1),
+        'errors': [
+            {'line': error.line_number, 'message': error.message}
+            for error in summary.errors
+        ],
+    }
+
+    click.echo(json.dumps(output, indent=2))
@@ -15,12 +15,19 @@ from byceps.application import create_worker_app
 from byceps.config.integration import (
     read_configuration_from_file_given_in_env_var,
 )
-from byceps.util.jobqueue import get_queue
+from byceps.util.jobqueue import AppContextPerJobWorker, get_queue
 from byceps.util.sentry import configure_sentry_from_env
 
 
 @click.command()
-def worker() -> None:
+@click.option(
+    '--no-fork',
+    is_flag=True,
+    help='Run jobs in the worker process itself instead of forking for '
+    'each job. This keeps connections (e.g. to the SMTP server) open '
+    'across jobs.',
+)
+def worker(no_fork: bool) -> None:
     """Start a worker."""
     configure_sentry_from_env('worker')
 
@@ -31,5 +38,8 @@ def worker() -> None:
     with app.app_context():
         queues = [get_queue(app)]
 
-        worker = Worker(queues)
+        if no_fork:
+            worker = AppContextPerJobWorker(app, queues)
+        else:
+            worker = Worker(queues)
         worker.work(with_scheduler=True)
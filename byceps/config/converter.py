@@ -41,6 +41,11 @@ def _generate_entries(config: BycepsConfig) -> Iterator[tuple[str, Any]]:
 
     yield 'METRICS_ENABLED', config.metrics.enabled
 
+    password_hashing = config.password_hashing
+    yield 'PASSWORD_HASHING_MAX_CONCURRENCY', password_hashing.max_concurrency
+    yield 'PASSWORD_HASHING_QUEUE_TIMEOUT', password_hashing.queue_timeout
+    yield 'PASSWORD_HASHING_WORKERS', password_hashing.workers
+
     yield 'PROPAGATE_EXCEPTIONS', config.propagate_exceptions
 
     yield 'REDIS_URL', config.redis.url
@@ -55,6 +55,7 @@ class BycepsConfig:
     discord: DiscordConfig | None
     jobs: JobsConfig
     metrics: MetricsConfig
+    password_hashing: PasswordHashingConfig
     payment_gateways: PaymentGatewaysConfig | None
     redis: RedisConfig
     smtp: SmtpConfig
@@ -120,6 +121,13 @@ class MetricsConfig:
     enabled: bool
 
 
+@dataclass(frozen=True, slots=True)
+class PasswordHashingConfig:
+    workers: int
+    max_concurrency: int
+    queue_timeout: int
+
+
 @dataclass(frozen=True, slots=True)
 class PaymentGatewaysConfig:
     paypal: PaypalConfig | None
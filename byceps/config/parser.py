@@ -28,6 +28,7 @@ from .models import (
     DiscordConfig,
     JobsConfig,
     MetricsConfig,
+    PasswordHashingConfig,
     PaymentGatewaysConfig,
     PaypalConfig,
     RedisConfig,
@@ -68,6 +69,7 @@ class Field:
     key: str
     type_: ValueType = ValueType.String
     default: Value | None = None
+    min_value: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -185,6 +187,31 @@ _SECTION_DEFINITIONS = [
             enabled=False,
         ),
     ),
+    Section(
+        name='password_hashing',
+        fields=[
+            Field('workers', type_=ValueType.Integer, default=0, min_value=0),
+            Field(
+                'max_concurrency',
+                type_=ValueType.Integer,
+                default=4,
+                min_value=1,
+            ),
+            Field(
+                'queue_timeout',
+                type_=ValueType.Integer,
+                default=10,
+                min_value=0,
+            ),
+        ],
+        config_class=PasswordHashingConfig,
+        required=False,
+        default=PasswordHashingConfig(
+            workers=0,
+            max_concurrency=4,
+            queue_timeout=10,
+        ),
+    ),
     Section(
         name='payment_gateways',
         subsections=[
@@ -356,6 +383,7 @@ def _parse_section_fields(
             field.key,
             field.type_,
             default=field.default,
+            min_value=field.min_value,
         )
         match section_value:
             case Ok(value):
@@ -412,6 +440,7 @@ def _get_section_value(
     type_: ValueType,
     *,
     default: Value | None = None,
+    min_value: int | None = None,
 ) -> Result[Value, str]:
     value = section_data.get(key, default)
 
@@ -429,6 +458,10 @@ def _get_section_value(
                 return Err(
                     f'Value "{value!r}" for key "{key}" in section "{section_name}" is not of type integer'
                 )
+            if (min_value is not None) and (value < min_value):
+                return Err(
+                    f'Value "{value!r}" for key "{key}" in section "{section_name}" must be at least {min_value}'
+                )
         case ValueType.String:
             if not isinstance(value, str):
                 return Err(
@@ -8,7 +8,7 @@ Database utilities.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Callable, Iterable
+from collections.abc import Callable
 from typing import Any, TypeVar
 
 from flask_sqlalchemy import SQLAlchemy
@@ -78,20 +78,6 @@ def upsert(
     db.session.commit()
 
 
-def upsert_many(
-    table: Table,
-    identifiers: Iterable[dict[str, Any]],
-    replacement: dict[str, Any],
-) -> None:
-    """Insert or update the record identified by `identifier` with value
-    `replacement`.
-    """
-    for identifier in identifiers:
-        execute_upsert(table, identifier, replacement)
-
-    db.session.commit()
-
-
 def execute_upsert(
     table: Table, identifier: dict[str, Any], replacement: dict[str, Any]
 ) -> None:
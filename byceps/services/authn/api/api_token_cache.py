@@ -0,0 +1,132 @@
+"""
+byceps.services.authn.api.api_token_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cache of API tokens, keyed by (a hash of) the token.
+
+Stored in Redis to be shared across processes, so that suspending or
+deleting a token (usually done in the admin application) takes effect
+in the API application right away. Entries also expire after a short
+while.
+
+Each invalidation also advances a generation counter per token. An
+entry is only stored if the generation has not advanced since before
+the token was loaded, so that a token loaded before a concurrent change
+(e.g. its suspension) is not cached after it.
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+from hashlib import sha256
+import json
+from uuid import UUID
+
+from flask import current_app
+from redis.client import Pipeline
+
+from byceps.services.authz.models import PermissionID
+from byceps.services.user.models.user import UserID
+
+from .models import ApiToken
+
+
+_CACHE_TTL = timedelta(minutes=1)
+_KEY_PREFIX = 'authn:api_token:'
+_GENERATION_KEY_PREFIX = 'authn:api_token_generation:'
+
+
+def find(token: str) -> ApiToken | None:
+    """Return the cached API token, if any."""
+    cached_value = current_app.redis_client.get(_get_key(token))
+    if cached_value is None:
+        return None
+
+    return _deserialize(token, cached_value)
+
+
+def get_generation(token: str) -> str:
+    """Return the current generation of the token's cache entry.
+
+    To be obtained before loading the API token to store.
+    """
+    value = current_app.redis_client.get(_get_generation_key(token))
+    return _to_generation(value)
+
+
+def store(api_token: ApiToken, generation: str) -> None:
+    """Cache the API token, unless its entry has been invalidated since
+    the generation has been obtained.
+    """
+    key = _get_key(api_token.token)
+    value = _serialize(api_token)
+    generation_key = _get_generation_key(api_token.token)
+
+    def store_if_generation_unchanged(pipeline: Pipeline) -> None:
+        if _to_generation(pipeline.get(generation_key)) != generation:
+            return
+
+        pipeline.multi()
+        pipeline.set(key, value, ex=_CACHE_TTL)
+
+    # Fails (and is retried) if the generation changes after having been
+    # checked.
+    current_app.redis_client.transaction(
+        store_if_generation_unchanged, generation_key
+    )
+
+
+def invalidate(token: str) -> None:
+    """Remove the cached entry for the token."""
+    pipeline = current_app.redis_client.pipeline()
+    pipeline.incr(_get_generation_key(token))
+    pipeline.delete(_get_key(token))
+    pipeline.execute()
+
+
+def _get_key(token: str) -> str:
+    return f'{_KEY_PREFIX}{_hash_token(token)}'
+
+
+def _get_generation_key(token: str) -> str:
+    return f'{_GENERATION_KEY_PREFIX}{_hash_token(token)}'
+
+
+def _hash_token(token: str) -> str:
+    # Do not store tokens in plain text.
+    return sha256(token.encode()).hexdigest()
+
+
+def _to_generation(value: bytes | None) -> str:
+    return (value or b'0').decode()
+
+
+def _serialize(api_token: ApiToken) -> str:
+    # The token itself is omitted on purpose.
+    return json.dumps(
+        {
+            'id': str(api_token.id),
+            'created_at': api_token.created_at.isoformat(),
+            'creator_id': str(api_token.creator_id),
+            'permissions': sorted(api_token.permissions),
+            'description': api_token.description,
+            'suspended': api_token.suspended,
+        }
+    )
+
+
+def _deserialize(token: str, value: bytes) -> ApiToken:
+    obj = json.loads(value)
+
+    return ApiToken(
+        id=UUID(obj['id']),
+        created_at=datetime.fromisoformat(obj['created_at']),
+        creator_id=UserID(UUID(obj['creator_id'])),
+        token=token,
+        permissions=frozenset(
+            PermissionID(permission) for permission in obj['permissions']
+        ),
+        description=obj['description'],
+        suspended=obj['suspended'],
+    )
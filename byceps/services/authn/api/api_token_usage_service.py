@@ -0,0 +1,118 @@
+"""
+byceps.services.authn.api.api_token_usage_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Number and duration of requests per API token, stored in Redis to be
+collected as metrics
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from flask import current_app
+
+
+# Upper bounds (in seconds) of the request duration histogram buckets
+DURATION_BUCKET_BOUNDS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_KEY_PREFIX = 'authn:api_token_usage:'
+
+_FIELD_COUNT = 'count'
+_FIELD_SUM = 'sum'
+
+
+@dataclass(frozen=True)
+class ApiTokenUsage:
+    api_token_id: UUID
+    request_count: int
+    duration_sum: float
+    # cumulative request counts per bucket upper bound
+    duration_bucket_counts: list[tuple[float, int]]
+
+
+def record_request(api_token_id: UUID, duration: float) -> None:
+    """Record a request made with the API token and its duration (in
+    seconds).
+    """
+    key = _get_key(api_token_id)
+
+    pipeline = current_app.redis_client.pipeline(transaction=False)
+    pipeline.hincrby(key, _FIELD_COUNT, 1)
+    pipeline.hincrbyfloat(key, _FIELD_SUM, duration)
+
+    # Only count the request in the first matching bucket; counts are
+    # accumulated when retrieved.
+    for bound in DURATION_BUCKET_BOUNDS:
+        if duration <= bound:
+            pipeline.hincrby(key, _get_bucket_field(bound), 1)
+            break
+
+    pipeline.execute()
+
+
+def get_usages() -> list[ApiTokenUsage]:
+    """Return the recorded usage of all API tokens."""
+    redis_client = current_app.redis_client
+
+    keys = list(redis_client.scan_iter(match=f'{_KEY_PREFIX}*'))
+    if not keys:
+        return []
+
+    pipeline = redis_client.pipeline(transaction=False)
+    for key in keys:
+        pipeline.hgetall(key)
+    values = pipeline.execute()
+
+    return [
+        _to_usage(key.decode(), fields)
+        for key, fields in zip(keys, values, strict=True)
+        if fields
+    ]
+
+
+def delete_usage(api_token_id: UUID) -> None:
+    """Delete the recorded usage of the API token."""
+    current_app.redis_client.delete(_get_key(api_token_id))
+
+
+def _get_key(api_token_id: UUID) -> str:
+    return f'{_KEY_PREFIX}{api_token_id}'
+
+
+def _get_bucket_field(bound: float) -> str:
+    return f'le:{bound}'
+
+
+def _to_usage(key: str, fields: dict[bytes, bytes]) -> ApiTokenUsage:
+    api_token_id = UUID(key.removeprefix(_KEY_PREFIX))
+
+    def get_field(name: str) -> bytes:
+        return fields.get(name.encode(), b'0')
+
+    duration_bucket_counts = []
+    cumulative_count = 0
+    for bound in DURATION_BUCKET_BOUNDS:
+        cumulative_count += int(get_field(_get_bucket_field(bound)))
+        duration_bucket_counts.append((bound, cumulative_count))
+
+    return ApiTokenUsage(
+        api_token_id=api_token_id,
+        request_count=int(get_field(_FIELD_COUNT)),
+        duration_sum=float(get_field(_FIELD_SUM)),
+        duration_bucket_counts=duration_bucket_counts,
+    )
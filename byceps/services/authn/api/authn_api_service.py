@@ -14,7 +14,11 @@ from byceps.database import db
 from byceps.services.authz.models import PermissionID
 from byceps.services.user.models.user import UserID
 
-from . import authn_api_domain_service
+from . import (
+    api_token_cache,
+    api_token_usage_service,
+    authn_api_domain_service,
+)
 from .dbmodels import DbApiToken
 from .models import ApiToken
 
@@ -61,6 +65,24 @@ def find_api_token_by_token(token: str) -> ApiToken | None:
     return _db_entity_to_api_token(db_api_token)
 
 
+def find_api_token_by_token_cached(token: str) -> ApiToken | None:
+    """Return the API token for that token, or nothing if not found.
+
+    The API token is served from the cache if possible.
+    """
+    api_token = api_token_cache.find(token)
+    if api_token is not None:
+        return api_token
+
+    cache_generation = api_token_cache.get_generation(token)
+
+    api_token = find_api_token_by_token(token)
+    if api_token is not None:
+        api_token_cache.store(api_token, cache_generation)
+
+    return api_token
+
+
 def get_all_api_tokens() -> list[ApiToken]:
     """Return all API tokens."""
     db_api_tokens = db.session.scalars(select(DbApiToken)).unique().all()
@@ -76,6 +98,8 @@ def suspend_api_token(api_token_id: UUID) -> None:
     db_api_token.suspended = True
     db.session.commit()
 
+    api_token_cache.invalidate(db_api_token.token)
+
 
 def unsuspend_api_token(api_token_id: UUID) -> None:
     """Unsuspend the API token."""
@@ -83,6 +107,8 @@ def unsuspend_api_token(api_token_id: UUID) -> None:
     db_api_token.suspended = False
     db.session.commit()
 
+    api_token_cache.invalidate(db_api_token.token)
+
 
 def _get_db_api_token(api_token_id: UUID) -> DbApiToken:
     db_api_token = db.session.get(DbApiToken, api_token_id)
@@ -95,6 +121,12 @@ def _get_db_api_token(api_token_id: UUID) -> DbApiToken:
 
 def delete_api_token(api_token_id: UUID) -> None:
     """Delete the API token."""
+    db_api_token = db.session.get(DbApiToken, api_token_id)
+    if db_api_token is None:
+        return
+
+    token = db_api_token.token
+
     db.session.execute(
         delete(DbApiToken)
         .where(DbApiToken.id == api_token_id)
@@ -102,6 +134,9 @@ def delete_api_token(api_token_id: UUID) -> None:
     )
     db.session.commit()
 
+    api_token_cache.invalidate(token)
+    api_token_usage_service.delete_usage(api_token_id)
+
 
 def _db_entity_to_api_token(db_api_token: DbApiToken) -> ApiToken:
     return ApiToken(
@@ -6,6 +6,9 @@ byceps.services.authn.password.authn_password_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Callable
+from typing import Any, TypeVar
+
 from sqlalchemy import delete
 
 from byceps.database import db
@@ -15,15 +18,21 @@ from byceps.services.user import user_log_service
 from byceps.services.user.models.log import UserLogEntry
 from byceps.services.user.models.user import User, UserID
 
-from . import authn_password_domain_service
+from . import authn_password_domain_service, password_hashing_executor
 from .dbmodels import DbCredential
 from .models import Credential
 
 
+T = TypeVar('T')
+
+
 def create_password_hash(user_id: UserID, password: str) -> None:
     """Create a password-based credential and a session token for the user."""
-    credential = authn_password_domain_service.create_password_hash(
-        user_id, password
+    credential = _run_hashing(
+        'hash',
+        authn_password_domain_service.create_password_hash,
+        user_id,
+        password,
     )
 
     db_credential = DbCredential(
@@ -39,12 +48,12 @@ def update_password_hash(
     """Update the password hash and set a newly-generated authentication
     token for the user.
     """
-    (
-        credential,
-        event,
-        log_entry,
-    ) = authn_password_domain_service.update_password_hash(
-        user, password, initiator
+    credential, event, log_entry = _run_hashing(
+        'hash',
+        authn_password_domain_service.update_password_hash,
+        user,
+        password,
+        initiator,
     )
 
     _persist_password_hash_update(credential, log_entry)
@@ -78,8 +87,11 @@ def is_password_valid_for_user(user_id: UserID, password: str) -> bool:
         # no password stored for user
         return False
 
-    return authn_password_domain_service.check_password_hash(
-        db_credential.password_hash, password
+    return _run_hashing(
+        'check',
+        authn_password_domain_service.check_password_hash,
+        db_credential.password_hash,
+        password,
     )
 
 
@@ -92,8 +104,11 @@ def migrate_password_hash_if_outdated(user_id: UserID, password: str) -> None:
     ):
         return
 
-    credential = authn_password_domain_service.create_password_hash(
-        user_id, password
+    credential = _run_hashing(
+        'hash',
+        authn_password_domain_service.create_password_hash,
+        user_id,
+        password,
     )
 
     db_credential.password_hash = credential.password_hash
@@ -101,6 +116,12 @@ def migrate_password_hash_if_outdated(user_id: UserID, password: str) -> None:
     db.session.commit()
 
 
+def _run_hashing(operation: str, func: Callable[..., T], *args: Any) -> T:
+    """Run the hashing operation with bounded concurrency."""
+    executor = password_hashing_executor.get_executor()
+    return executor.run(operation, func, *args)
+
+
 def _find_credential_for_user(user_id: UserID) -> DbCredential | None:
     """Return the credential for the user, if found."""
     return db.session.get(DbCredential, user_id)
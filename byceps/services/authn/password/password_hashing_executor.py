@@ -0,0 +1,172 @@
+"""
+byceps.services.authn.password.password_hashing_executor
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Run password hashing, which is expensive on purpose, with bounded
+concurrency and (optionally) in a pool of worker processes.
+
+Only so many hashing operations run at once per (web server) process.
+Further ones wait in line, up to a timeout, and are then rejected. That
+way a burst of logins degrades into slower (or failed) logins instead
+of starving all other requests of CPU and memory.
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
+import threading
+import time
+from typing import Any, TypeVar
+
+from flask import current_app
+import structlog
+from . import password_hashing_stats_service
+
+
+log = structlog.get_logger()
+
+
+T = TypeVar('T')
+
+
+class PasswordHashingOverloadedError(Exception):
+    """No password hashing capacity became available in time."""
+
+
+class PasswordHashingExecutor:
+    """Run password hashing operations, limited to a maximum number at
+    once.
+
+    With a worker count of zero, operations run in the calling thread.
+    """
+
+    def __init__(
+        self, worker_count: int, max_concurrency: int, queue_timeout: float
+    ) -> None:
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        self._queue_timeout = queue_timeout
+
+        self._worker_count = worker_count
+        self._pool_lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = (
+            self._create_pool() if worker_count > 0 else None
+        )
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        # Do not fork the (possibly multi-threaded) web server process
+        # itself.
+        mp_context = multiprocessing.get_context('forkserver')
+        return ProcessPoolExecutor(
+            max_workers=self._worker_count, mp_context=mp_context
+        )
+
+    def run(self, operation: str, func: Callable[..., T], *args: Any) -> T:
+        """Run the hashing operation once capacity is available.
+
+        Raise `PasswordHashingOverloadedError` if none became available
+        within the queue timeout.
+        """
+        queued_at = time.perf_counter()
+
+        if not self._semaphore.acquire(timeout=self._queue_timeout):
+            log.warning(
+                'Password hashing capacity exhausted', operation=operation
+            )
+            password_hashing_stats_service.record_rejection(operation)
+            raise PasswordHashingOverloadedError
+
+        try:
+            started_at = time.perf_counter()
+
+            pool = self._pool
+            if pool is None:
+                result = func(*args)
+            else:
+                result = self._run_in_pool(pool, func, *args)
+
+            finished_at = time.perf_counter()
+        finally:
+            self._semaphore.release()
+
+        password_hashing_stats_service.record_operation(
+            operation,
+            queue_wait=started_at - queued_at,
+            duration=finished_at - started_at,
+        )
+
+        return result
+
+    def _run_in_pool(
+        self, pool: ProcessPoolExecutor, func: Callable[..., T], *args: Any
+    ) -> T:
+        """Run the operation in a worker process.
+
+        If the pool has broken (e.g. because a worker process has been
+        killed), replace it and try once more.
+        """
+        try:
+            return pool.submit(func, *args).result()
+        except BrokenProcessPool:
+            log.warning('Password hashing process pool broken, replacing it')
+            pool = self._replace_pool(pool)
+            return pool.submit(func, *args).result()
+
+    def _replace_pool(
+        self, broken_pool: ProcessPoolExecutor
+    ) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            pool = self._pool
+
+            # Another thread might have replaced it already.
+            if (pool is None) or (pool is broken_pool):
+                broken_pool.shutdown(wait=False)
+                pool = self._create_pool()
+                self._pool = pool
+
+            return pool
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, if any."""
+        if self._pool is not None:
+            self._pool.shutdown()
+
+
+_executors_by_pid: dict[int, PasswordHashingExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor() -> PasswordHashingExecutor:
+    """Return this process's executor, configured by the current
+    application.
+
+    It is created on first use (again in processes forked off after
+    that) so that worker processes are not shared between processes.
+    """
+    pid = os.getpid()
+
+    with _executors_lock:
+        executor = _executors_by_pid.get(pid)
+
+        if executor is None:
+            executor = _create_executor()
+            _executors_by_pid.clear()
+            _executors_by_pid[pid] = executor
+
+        return executor
+
+
+def _create_executor() -> PasswordHashingExecutor:
+    config = current_app.config
+
+    return PasswordHashingExecutor(
+        worker_count=config.get('PASSWORD_HASHING_WORKERS', 0),
+        max_concurrency=config.get('PASSWORD_HASHING_MAX_CONCURRENCY', 4),
+        queue_timeout=config.get('PASSWORD_HASHING_QUEUE_TIMEOUT', 10),
+    )
@@ -0,0 +1,128 @@
+"""
+byceps.services.authn.password.password_hashing_stats_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Number and duration of password hashing operations, stored in Redis to
+be collected as metrics
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+
+from flask import current_app
+
+
+# Upper bounds (in seconds) of the hashing duration histogram buckets
+DURATION_BUCKET_BOUNDS = (
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_KEY_PREFIX = 'authn:password_hashing:'
+
+_FIELD_COUNT = 'count'
+_FIELD_SUM = 'sum'
+_FIELD_QUEUE_WAIT_SUM = 'queue_wait_sum'
+_FIELD_REJECTED_COUNT = 'rejected'
+
+
+@dataclass(frozen=True)
+class PasswordHashingStats:
+    operation: str
+    count: int
+    duration_sum: float
+    # cumulative operation counts per bucket upper bound
+    duration_bucket_counts: list[tuple[float, int]]
+    queue_wait_sum: float
+    rejected_count: int
+
+
+def record_operation(
+    operation: str, queue_wait: float, duration: float
+) -> None:
+    """Record a hashing operation, the time (in seconds) it waited to
+    be run, and its duration (in seconds).
+    """
+    key = _get_key(operation)
+
+    pipeline = current_app.redis_client.pipeline(transaction=False)
+    pipeline.hincrby(key, _FIELD_COUNT, 1)
+    pipeline.hincrbyfloat(key, _FIELD_SUM, duration)
+    pipeline.hincrbyfloat(key, _FIELD_QUEUE_WAIT_SUM, queue_wait)
+
+    # Only count the operation in the first matching bucket; counts are
+    # accumulated when retrieved.
+    for bound in DURATION_BUCKET_BOUNDS:
+        if duration <= bound:
+            pipeline.hincrby(key, _get_bucket_field(bound), 1)
+            break
+
+    pipeline.execute()
+
+
+def record_rejection(operation: str) -> None:
+    """Record that a hashing operation was rejected because no capacity
+    became available in time.
+    """
+    current_app.redis_client.hincrby(
+        _get_key(operation), _FIELD_REJECTED_COUNT, 1
+    )
+
+
+def get_stats() -> list[PasswordHashingStats]:
+    """Return the recorded statistics of all hashing operations."""
+    redis_client = current_app.redis_client
+
+    keys = sorted(redis_client.scan_iter(match=f'{_KEY_PREFIX}*'))
+    if not keys:
+        return []
+
+    pipeline = redis_client.pipeline(transaction=False)
+    for key in keys:
+        pipeline.hgetall(key)
+    values = pipeline.execute()
+
+    return [
+        _to_stats(key.decode(), fields)
+        for key, fields in zip(keys, values, strict=True)
+        if fields
+    ]
+
+
+def _get_key(operation: str) -> str:
+    return f'{_KEY_PREFIX}{operation}'
+
+
+def _get_bucket_field(bound: float) -> str:
+    return f'le:{bound}'
+
+
+def _to_stats(key: str, fields: dict[bytes, bytes]) -> PasswordHashingStats:
+    operation = key.removeprefix(_KEY_PREFIX)
+
+    def get_field(name: str) -> bytes:
+        return fields.get(name.encode(), b'0')
+
+    duration_bucket_counts = []
+    cumulative_count = 0
+    for bound in DURATION_BUCKET_BOUNDS:
+        cumulative_count += int(get_field(_get_bucket_field(bound)))
+        duration_bucket_counts.append((bound, cumulative_count))
+
+    return PasswordHashingStats(
+        operation=operation,
+        count=int(get_field(_FIELD_COUNT)),
+        duration_sum=float(get_field(_FIELD_SUM)),
+        duration_bucket_counts=duration_bucket_counts,
+        queue_wait_sum=float(get_field(_FIELD_QUEUE_WAIT_SUM)),
+        rejected_count=int(get_field(_FIELD_REJECTED_COUNT)),
+    )
@@ -20,6 +20,7 @@ from byceps.services.user import user_log_service
 from byceps.services.user.dbmodels.log import DbUserLogEntry
 from byceps.services.user.models.user import User, UserID
 
+from . import current_user_cache
 from .dbmodels import DbRecentLogin, DbSessionToken
 from .models import CurrentUser
 
@@ -51,6 +52,8 @@ def delete_session_tokens_for_user(user_id: UserID) -> None:
     )
     db.session.commit()
 
+    current_user_cache.invalidate_user(user_id)
+
 
 def delete_all_session_tokens() -> int:
     """Delete all users' session tokens.
@@ -60,6 +63,8 @@ def delete_all_session_tokens() -> int:
     result = db.session.execute(delete(DbSessionToken))
     db.session.commit()
 
+    current_user_cache.invalidate_all()
+
     num_deleted = result.rowcount
     return num_deleted
 
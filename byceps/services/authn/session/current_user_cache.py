@@ -0,0 +1,171 @@
+"""
+byceps.services.authn.session.current_user_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cache of authenticated users and their permissions, keyed by user and
+authentication token.
+
+Stored in Redis to be shared across processes. Entries expire after a
+few minutes and are removed early when the user's account, roles, or
+session tokens change.
+
+Each invalidation also advances a generation counter (per user, and one
+for all users). An entry is only stored if the generation has not
+advanced since before the user and permissions were loaded, so that
+data loaded before a concurrent change is not cached after it.
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from hashlib import sha256
+import json
+from uuid import UUID
+
+from flask import current_app
+from redis.client import Pipeline
+
+from byceps.services.user.models.user import User, UserID
+
+
+_CACHE_TTL = timedelta(minutes=5)
+_KEY_PREFIX = 'authn:current_user:'
+_GENERATION_KEY_PREFIX = 'authn:current_user_generation:'
+_GLOBAL_GENERATION_KEY = 'authn:current_user_generation'
+
+
+@dataclass(frozen=True)
+class CachedCurrentUser:
+    user: User
+    permissions: frozenset[str]
+
+
+def find(user_id: UserID, auth_token: str) -> CachedCurrentUser | None:
+    """Return the cached user and permissions, if any."""
+    cached_value = current_app.redis_client.hget(
+        _get_key(user_id), _get_field(auth_token)
+    )
+    if cached_value is None:
+        return None
+
+    return _deserialize(cached_value)
+
+
+def get_generation(user_id: UserID) -> str:
+    """Return the current generation of the user's cache entries.
+
+    To be obtained before loading the user and permissions to store.
+    """
+    values = current_app.redis_client.mget(_get_generation_keys(user_id))
+    return _to_generation(values)
+
+
+def store(
+    auth_token: str,
+    user: User,
+    permissions: frozenset[str],
+    generation: str,
+) -> None:
+    """Cache the user and permissions for the authentication token,
+    unless the user's entries have been invalidated since the generation
+    has been obtained.
+    """
+    key = _get_key(user.id)
+    field = _get_field(auth_token)
+    value = _serialize(CachedCurrentUser(user=user, permissions=permissions))
+    generation_keys = _get_generation_keys(user.id)
+
+    def store_if_generation_unchanged(pipeline: Pipeline) -> None:
+        if _to_generation(pipeline.mget(generation_keys)) != generation:
+            return
+
+        pipeline.multi()
+        pipeline.hset(key, field, value)
+        pipeline.expire(key, _CACHE_TTL)
+
+    # Fails (and is retried) if a generation changes after having been
+    # checked.
+    current_app.redis_client.transaction(
+        store_if_generation_unchanged, *generation_keys
+    )
+
+
+def invalidate_user(user_id: UserID) -> None:
+    """Remove the cached entries for the user."""
+    pipeline = current_app.redis_client.pipeline()
+    pipeline.incr(_get_generation_key(user_id))
+    pipeline.delete(_get_key(user_id))
+    pipeline.execute()
+
+
+def invalidate_all() -> None:
+    """Remove all cached entries.
+
+    Intended for rare changes that affect many users at once, e.g.
+    changes to the permissions of a role.
+    """
+    redis_client = current_app.redis_client
+
+    redis_client.incr(_GLOBAL_GENERATION_KEY)
+
+    keys = list(redis_client.scan_iter(match=f'{_KEY_PREFIX}*'))
+    if keys:
+        redis_client.delete(*keys)
+
+
+def _get_key(user_id: UserID) -> str:
+    return f'{_KEY_PREFIX}{user_id}'
+
+
+def _get_generation_key(user_id: UserID) -> str:
+    return f'{_GENERATION_KEY_PREFIX}{user_id}'
+
+
+def _get_generation_keys(user_id: UserID) -> list[str]:
+    return [_GLOBAL_GENERATION_KEY, _get_generation_key(user_id)]
+
+
+def _to_generation(values: list[bytes | None]) -> str:
+    return ':'.join((value or b'0').decode() for value in values)
+
+
+def _get_field(auth_token: str) -> str:
+    # Do not store authentication tokens in plain text.
+    return sha256(auth_token.encode()).hexdigest()
+
+
+def _serialize(cached_current_user: CachedCurrentUser) -> str:
+    user = cached_current_user.user
+
+    return json.dumps(
+        {
+            'id': str(user.id),
+            'screen_name': user.screen_name,
+            'initialized': user.initialized,
+            'suspended': user.suspended,
+            'deleted': user.deleted,
+            'locale': user.locale,
+            'avatar_url': user.avatar_url,
+            'permissions': sorted(cached_current_user.permissions),
+        }
+    )
+
+
+def _deserialize(value: bytes) -> CachedCurrentUser:
+    obj = json.loads(value)
+
+    user = User(
+        id=UserID(UUID(obj['id'])),
+        screen_name=obj['screen_name'],
+        initialized=obj['initialized'],
+        suspended=obj['suspended'],
+        deleted=obj['deleted'],
+        locale=obj['locale'],
+        avatar_url=obj['avatar_url'],
+    )
+
+    return CachedCurrentUser(
+        user=user, permissions=frozenset(obj['permissions'])
+    )
@@ -17,6 +17,7 @@ from byceps.events.authz import (
     RoleAssignedToUserEvent,
     RoleDeassignedFromUserEvent,
 )
+from byceps.services.authn.session import current_user_cache
 from byceps.services.user import user_log_service, user_service
 from byceps.services.user.models.log import UserLogEntry
 from byceps.services.user.models.user import User, UserID
@@ -50,6 +51,8 @@ def delete_role(role_id: RoleID) -> None:
     db.session.execute(delete(DbRole).where(DbRole.id == role_id))
     db.session.commit()
 
+    current_user_cache.invalidate_all()
+
 
 def find_role(role_id: RoleID) -> Role | None:
     """Return the role with that id, or `None` if not found."""
@@ -94,6 +97,8 @@ def assign_permission_to_role(
     db.session.add(db_role_permission)
     db.session.commit()
 
+    current_user_cache.invalidate_all()
+
 
 def deassign_permission_from_role(
     permission_id: PermissionID, role_id: RoleID
@@ -109,6 +114,8 @@ def deassign_permission_from_role(
     db.session.delete(db_role_permission)
     db.session.commit()
 
+    current_user_cache.invalidate_all()
+
     return Ok(None)
 
 
@@ -140,6 +147,8 @@ def _persist_role_assignment_to_user(
 
     db.session.commit()
 
+    current_user_cache.invalidate_user(user.id)
+
 
 def deassign_role_from_user(
     role_id: RoleID, user: User, *, initiator: User | None = None
@@ -162,6 +171,8 @@ def deassign_role_from_user(
 def _persist_role_deassignment_from_user(
     db_user_role: DbUserRole, log_entry: UserLogEntry
 ) -> None:
+    user_id = db_user_role.user_id
+
     db.session.delete(db_user_role)
 
     db_log_entry = user_log_service.to_db_entry(log_entry)
@@ -169,15 +180,22 @@ def _persist_role_deassignment_from_user(
 
     db.session.commit()
 
+    current_user_cache.invalidate_user(user_id)
+
 
 def deassign_all_roles_from_user(
     user: User, *, initiator: User | None = None, commit: bool = True
 ) -> None:
-    """Deassign all roles from the user."""
+    """Deassign all roles from the user.
+
+    If not committed here, the caller has to invalidate the user's
+    cached permissions after committing.
+    """
     db.session.execute(delete(DbUserRole).where(DbUserRole.user_id == user.id))
 
     if commit:
         db.session.commit()
+        current_user_cache.invalidate_user(user.id)
 
 
 def _is_role_assigned_to_user(role_id: RoleID, user_id: UserID) -> bool:
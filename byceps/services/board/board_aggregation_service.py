@@ -2,6 +2,13 @@
 byceps.services.board.board_aggregation_service
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+Topics and categories carry denormalized counts as well as the time and
+author of their latest posting.
+
+These are updated incrementally (by applying deltas) whenever postings
+and topics are created, hidden, un-hidden, or moved. A full
+re-aggregation is available to reconcile them should they ever drift.
+
 :Copyright: 2014-2025 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
@@ -9,7 +16,7 @@ byceps.services.board.board_aggregation_service
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from byceps.database import db
 from byceps.services.user.models.user import UserID
@@ -17,7 +24,7 @@ from byceps.services.user.models.user import UserID
 from .dbmodels.category import DbBoardCategory
 from .dbmodels.posting import DbPosting
 from .dbmodels.topic import DbTopic
-from .models import BoardCategoryID, TopicID
+from .models import BoardCategoryID, BoardID, TopicID
 
 
 @dataclass(frozen=True)
@@ -26,7 +33,272 @@ class LatestPostingInfo:
     creator_id: UserID
 
 
-def aggregate_category(db_category: DbBoardCategory) -> None:
+# -------------------------------------------------------------------- #
+# incremental aggregation
+
+
+def apply_topic_created(
+    db_topic: DbTopic, db_initial_posting: DbPosting
+) -> None:
+    """Account for a newly created topic and its initial posting.
+
+    The topic and posting must have been flushed to the database.
+    """
+    latest_posting_info = _to_latest_posting_info(db_initial_posting)
+
+    _change_topic_posting_count(db_topic.id, 1)
+    _set_topic_latest_posting(db_topic.id, latest_posting_info)
+
+    _change_category_counts(
+        db_topic.category_id, topic_delta=1, posting_delta=1
+    )
+    _advance_category_latest_posting(db_topic.category_id, latest_posting_info)
+
+
+def apply_posting_created(db_posting: DbPosting) -> None:
+    """Account for a newly created posting.
+
+    The posting must have been flushed to the database.
+    """
+    _add_posting(db_posting)
+
+
+def apply_posting_hidden(db_posting: DbPosting) -> None:
+    """Account for a posting that has been hidden."""
+    db_topic = db_posting.topic
+
+    _change_topic_posting_count(db_topic.id, -1)
+    if db_topic.last_updated_at == db_posting.created_at:
+        _recalculate_topic_latest_posting(db_topic.id)
+
+    if db_topic.hidden:
+        return
+
+    _change_category_counts(db_topic.category_id, posting_delta=-1)
+    if db_topic.category.last_posting_updated_at == db_posting.created_at:
+        _recalculate_category_latest_posting(db_topic.category_id)
+
+
+def apply_posting_unhidden(db_posting: DbPosting) -> None:
+    """Account for a posting that has been un-hidden."""
+    _add_posting(db_posting)
+
+
+def _add_posting(db_posting: DbPosting) -> None:
+    db_topic = db_posting.topic
+    latest_posting_info = _to_latest_posting_info(db_posting)
+
+    _change_topic_posting_count(db_topic.id, 1)
+    _advance_topic_latest_posting(db_topic.id, latest_posting_info)
+
+    if db_topic.hidden:
+        return
+
+    _change_category_counts(db_topic.category_id, posting_delta=1)
+    _advance_category_latest_posting(db_topic.category_id, latest_posting_info)
+
+
+def apply_topic_hidden(db_topic: DbTopic) -> None:
+    """Account for a topic that has been hidden."""
+    _remove_topic_from_category(db_topic, db_topic.category)
+
+
+def apply_topic_unhidden(db_topic: DbTopic) -> None:
+    """Account for a topic that has been un-hidden."""
+    _add_topic_to_category(db_topic, db_topic.category_id)
+
+
+def apply_topic_moved(
+    db_topic: DbTopic,
+    db_old_category: DbBoardCategory,
+    db_new_category: DbBoardCategory,
+) -> None:
+    """Account for a topic that has been moved to another category."""
+    if db_topic.hidden:
+        return
+
+    _remove_topic_from_category(db_topic, db_old_category)
+    _add_topic_to_category(db_topic, db_new_category.id)
+
+
+def _add_topic_to_category(
+    db_topic: DbTopic, category_id: BoardCategoryID
+) -> None:
+    _change_category_counts(
+        category_id, topic_delta=1, posting_delta=db_topic.posting_count
+    )
+
+    if (db_topic.last_updated_at is not None) and (
+        db_topic.last_updated_by_id is not None
+    ):
+        _advance_category_latest_posting(
+            category_id,
+            LatestPostingInfo(
+                created_at=db_topic.last_updated_at,
+                creator_id=db_topic.last_updated_by_id,
+            ),
+        )
+
+
+def _remove_topic_from_category(
+    db_topic: DbTopic, db_category: DbBoardCategory
+) -> None:
+    _change_category_counts(
+        db_category.id, topic_delta=-1, posting_delta=-db_topic.posting_count
+    )
+
+    if db_category.last_posting_updated_at == db_topic.last_updated_at:
+        _recalculate_category_latest_posting(db_category.id)
+
+
+def _change_topic_posting_count(topic_id: TopicID, delta: int) -> None:
+    db.session.execute(
+        update(DbTopic)
+        .filter_by(id=topic_id)
+        .values(posting_count=DbTopic.posting_count + delta)
+    )
+
+
+def _advance_topic_latest_posting(
+    topic_id: TopicID, latest_posting_info: LatestPostingInfo
+) -> None:
+    """Set the topic's latest posting unless it already has a later one."""
+    db.session.execute(
+        update(DbTopic)
+        .filter_by(id=topic_id)
+        .filter(
+            db.or_(
+                DbTopic.last_updated_at.is_(None),
+                DbTopic.last_updated_at <= latest_posting_info.created_at,
+            )
+        )
+        .values(
+            last_updated_at=latest_posting_info.created_at,
+            last_updated_by_id=latest_posting_info.creator_id,
+        )
+    )
+
+
+def _recalculate_topic_latest_posting(topic_id: TopicID) -> None:
+    latest_posting_info = _get_topic_latest_posting_info(topic_id)
+    _set_topic_latest_posting(topic_id, latest_posting_info)
+
+
+def _set_topic_latest_posting(
+    topic_id: TopicID, latest_posting_info: LatestPostingInfo | None
+) -> None:
+    db.session.execute(
+        update(DbTopic)
+        .filter_by(id=topic_id)
+        .values(
+            last_updated_at=(
+                latest_posting_info.created_at if latest_posting_info else None
+            ),
+            last_updated_by_id=(
+                latest_posting_info.creator_id if latest_posting_info else None
+            ),
+        )
+    )
+
+
+def _change_category_counts(
+    category_id: BoardCategoryID,
+    *,
+    topic_delta: int = 0,
+    posting_delta: int = 0,
+) -> None:
+    db.session.execute(
+        update(DbBoardCategory)
+        .filter_by(id=category_id)
+        .values(
+            topic_count=DbBoardCategory.topic_count + topic_delta,
+            posting_count=DbBoardCategory.posting_count + posting_delta,
+        )
+    )
+
+
+def _advance_category_latest_posting(
+    category_id: BoardCategoryID, latest_posting_info: LatestPostingInfo
+) -> None:
+    """Set the category's latest posting unless it already has a later
+    one.
+    """
+    db.session.execute(
+        update(DbBoardCategory)
+        .filter_by(id=category_id)
+        .filter(
+            db.or_(
+                DbBoardCategory.last_posting_updated_at.is_(None),
+                DbBoardCategory.last_posting_updated_at
+                <= latest_posting_info.created_at,
+            )
+        )
+        .values(
+            last_posting_updated_at=latest_posting_info.created_at,
+            last_posting_updated_by_id=latest_posting_info.creator_id,
+        )
+    )
+
+
+def _recalculate_category_latest_posting(category_id: BoardCategoryID) -> None:
+    """Determine the category's latest posting from the (already
+    aggregated) latest postings of its visible topics instead of from
+    all of its postings.
+    """
+    row = db.session.execute(
+        select(DbTopic.last_updated_at, DbTopic.last_updated_by_id)
+        .filter_by(category_id=category_id)
+        .filter_by(hidden=False)
+        .filter(DbTopic.last_updated_at.is_not(None))
+        .order_by(DbTopic.last_updated_at.desc())
+        .limit(1)
+    ).one_or_none()
+
+    db.session.execute(
+        update(DbBoardCategory)
+        .filter_by(id=category_id)
+        .values(
+            last_posting_updated_at=row[0] if row else None,
+            last_posting_updated_by_id=row[1] if row else None,
+        )
+    )
+
+
+def _to_latest_posting_info(db_posting: DbPosting) -> LatestPostingInfo:
+    return LatestPostingInfo(
+        created_at=db_posting.created_at,
+        creator_id=db_posting.creator_id,
+    )
+
+
+# -------------------------------------------------------------------- #
+# full aggregation
+
+
+def aggregate_board(board_id: BoardID) -> None:
+    """Recalculate the count and latest fields of all topics and
+    categories of the board from scratch.
+    """
+    db_categories = db.session.scalars(
+        select(DbBoardCategory).filter_by(board_id=board_id)
+    ).all()
+
+    for db_category in db_categories:
+        db_topics = db.session.scalars(
+            select(DbTopic).filter_by(category_id=db_category.id)
+        ).all()
+
+        for db_topic in db_topics:
+            aggregate_topic(db_topic, commit=False)
+
+        aggregate_category(db_category, commit=False)
+
+    db.session.commit()
+
+
+def aggregate_category(
+    db_category: DbBoardCategory, *, commit: bool = True
+) -> None:
     """Update the category's count and latest fields."""
     topic_count = _get_category_topic_count(db_category.id)
     posting_count = _get_category_posting_count(db_category.id)
@@ -41,7 +313,8 @@ def aggregate_category(db_category: DbBoardCategory) -> None:
         latest_posting_info.creator_id if latest_posting_info else None
     )
 
-    db.session.commit()
+    if commit:
+        db.session.commit()
 
 
 def _get_category_topic_count(category_id: BoardCategoryID) -> int:
@@ -67,26 +340,29 @@ def _get_category_posting_count(category_id: BoardCategoryID) -> int:
 def _get_category_latest_posting_info(
     category_id: BoardCategoryID,
 ) -> LatestPostingInfo | None:
-    db_latest_posting = db.session.scalars(
-        select(DbPosting)
+    row = db.session.execute(
+        select(DbPosting.created_at, DbPosting.creator_id)
         .filter(DbPosting.hidden == False)  # noqa: E712
         .join(DbTopic)
         .filter(DbTopic.category_id == category_id)
         .filter(DbTopic.hidden == False)  # noqa: E712
         .order_by(DbPosting.created_at.desc())
+        .limit(1)
     ).first()
 
-    if not db_latest_posting:
+    if row is None:
         return None
 
-    return LatestPostingInfo(
-        created_at=db_latest_posting.created_at,
-        creator_id=db_latest_posting.creator_id,
-    )
+    created_at, creator_id = row
+
+    return LatestPostingInfo(created_at=created_at, creator_id=creator_id)
+
 
+def aggregate_topic(db_topic: DbTopic, *, commit: bool = True) -> None:
+    """Update the topic's count and latest fields.
 
-def aggregate_topic(db_topic: DbTopic) -> None:
-    """Update the topic's count and latest fields."""
+    This does not update the topic's category.
+    """
     posting_count = _get_topic_posting_count(db_topic.id)
     latest_posting_info = _get_topic_latest_posting_info(db_topic.id)
 
@@ -98,9 +374,8 @@ def aggregate_topic(db_topic: DbTopic) -> None:
         latest_posting_info.creator_id if latest_posting_info else None
     )
 
-    db.session.commit()
-
-    aggregate_category(db_topic.category)
+    if commit:
+        db.session.commit()
 
 
 def _get_topic_posting_count(topic_id: TopicID) -> int:
@@ -115,17 +390,17 @@ def _get_topic_posting_count(topic_id: TopicID) -> int:
 def _get_topic_latest_posting_info(
     topic_id: TopicID,
 ) -> LatestPostingInfo | None:
-    db_latest_posting = db.session.scalars(
-        select(DbPosting)
+    row = db.session.execute(
+        select(DbPosting.created_at, DbPosting.creator_id)
         .filter_by(topic_id=topic_id)
         .filter_by(hidden=False)
         .order_by(DbPosting.created_at.desc())
+        .limit(1)
     ).first()
 
-    if not db_latest_posting:
+    if row is None:
         return None
 
-    return LatestPostingInfo(
-        created_at=db_latest_posting.created_at,
-        creator_id=db_latest_posting.creator_id,
-    )
+    created_at, creator_id = row
+
+    return LatestPostingInfo(created_at=created_at, creator_id=creator_id)
@@ -6,20 +6,37 @@ byceps.services.board.board_last_view_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from datetime import datetime
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from uuid import UUID
 
-from sqlalchemy import delete, select
+from flask import current_app
+from sqlalchemy import delete, literal, select
+from sqlalchemy.dialects.postgresql import insert
 
-from byceps.database import db, upsert, upsert_many
+from byceps.database import db, upsert
 from byceps.services.user.models.user import UserID
 
-from . import board_topic_query_service
+from .dbmodels.last_all_topics_view import DbLastAllTopicsView
 from .dbmodels.last_category_view import DbLastCategoryView
 from .dbmodels.last_topic_view import DbLastTopicView
 from .dbmodels.topic import DbTopic
 from .models import BoardCategoryID, BoardCategoryWithLastUpdate, TopicID
 
 
+# Users' last view timestamps are cached in Redis, in one hash per user
+# and kind of object.
+#
+# Marking objects as viewed writes the new timestamps to the cache, and
+# filling in timestamps fetched from the database never overwrites
+# cached ones. That way, timestamps fetched before a concurrent view was
+# recorded cannot replace the newer one in the cache.
+_CACHE_TTL = timedelta(hours=1)
+
+# Marks an object as not yet viewed by the user.
+_CACHE_VALUE_NOT_VIEWED = ''
+
+
 # -------------------------------------------------------------------- #
 # categories
 
@@ -30,15 +47,50 @@ def contains_category_unseen_postings(
     """Return `True` if the category contains postings created after the
     last time the user viewed it.
     """
-    if category.last_posting_updated_at is None:
-        return False
+    return category.id in get_categories_with_unseen_postings(
+        [category], user_id
+    )
+
 
-    db_last_view = find_last_category_view(user_id, category.id)
+def get_categories_with_unseen_postings(
+    categories: Iterable[BoardCategoryWithLastUpdate], user_id: UserID
+) -> set[BoardCategoryID]:
+    """Return the IDs of those categories that contain postings created
+    after the last time the user viewed them.
+    """
+    categories = [
+        category
+        for category in categories
+        if category.last_posting_updated_at is not None
+    ]
+
+    last_viewed_at_by_category_id = _get_last_viewed_at(
+        'categories',
+        user_id,
+        {category.id for category in categories},
+        _find_last_category_views,
+    )
 
-    if db_last_view is None:
-        return True
+    return {
+        category.id
+        for category in categories
+        if _is_unseen(
+            category.last_posting_updated_at,
+            last_viewed_at_by_category_id.get(category.id),
+        )
+    }
 
-    return category.last_posting_updated_at > db_last_view.occurred_at
+
+def _find_last_category_views(
+    user_id: UserID, category_ids: set[UUID]
+) -> dict[UUID, datetime]:
+    rows = db.session.execute(
+        select(DbLastCategoryView.category_id, DbLastCategoryView.occurred_at)
+        .filter_by(user_id=user_id)
+        .filter(DbLastCategoryView.category_id.in_(category_ids))
+    ).all()
+
+    return dict(rows)
 
 
 def find_last_category_view(
@@ -58,17 +110,23 @@ def mark_category_as_just_viewed(
     """Mark the category as last viewed by the user (if logged in) at
     the current time.
     """
+    now = datetime.utcnow()
+
     table = DbLastCategoryView.__table__
     identifier = {
         'user_id': user_id,
         'category_id': category_id,
     }
     replacement = {
-        'occurred_at': datetime.utcnow(),
+        'occurred_at': now,
     }
 
     upsert(table, identifier, replacement)
 
+    _cache_last_viewed_at(
+        'categories', user_id, {category_id: now}, overwrite=True
+    )
+
 
 def delete_last_category_views(category_id: BoardCategoryID) -> None:
     """Delete the category's last views."""
@@ -86,8 +144,49 @@ def contains_topic_unseen_postings(db_topic: DbTopic, user_id: UserID) -> bool:
     """Return `True` if the topic contains postings created after the
     last time the user viewed it.
     """
-    last_viewed_at = find_topic_last_viewed_at(db_topic.id, user_id)
-    return last_viewed_at is None or db_topic.last_updated_at > last_viewed_at
+    return db_topic.id in get_topics_with_unseen_postings([db_topic], user_id)
+
+
+def get_topics_with_unseen_postings(
+    db_topics: Iterable[DbTopic], user_id: UserID
+) -> set[TopicID]:
+    """Return the IDs of those topics that contain postings created after
+    the last time the user viewed them.
+    """
+    db_topics = list(db_topics)
+
+    last_viewed_at_by_topic_id = _get_last_viewed_at(
+        'topics',
+        user_id,
+        {db_topic.id for db_topic in db_topics},
+        _find_last_topic_views,
+    )
+
+    all_topics_last_viewed_at = _get_all_topics_last_viewed_at(user_id)
+
+    return {
+        db_topic.id
+        for db_topic in db_topics
+        if _is_unseen(
+            db_topic.last_updated_at,
+            _max_or_none(
+                last_viewed_at_by_topic_id.get(db_topic.id),
+                all_topics_last_viewed_at,
+            ),
+        )
+    }
+
+
+def _find_last_topic_views(
+    user_id: UserID, topic_ids: set[UUID]
+) -> dict[UUID, datetime]:
+    rows = db.session.execute(
+        select(DbLastTopicView.topic_id, DbLastTopicView.occurred_at)
+        .filter_by(user_id=user_id)
+        .filter(DbLastTopicView.topic_id.in_(topic_ids))
+    ).all()
+
+    return dict(rows)
 
 
 def find_topic_last_viewed_at(
@@ -100,60 +199,226 @@ def find_topic_last_viewed_at(
         select(DbLastTopicView).filter_by(user_id=user_id, topic_id=topic_id)
     ).first()
 
-    return db_last_view.occurred_at if (db_last_view is not None) else None
+    last_viewed_at = (
+        db_last_view.occurred_at if (db_last_view is not None) else None
+    )
+
+    return _max_or_none(last_viewed_at, _get_all_topics_last_viewed_at(user_id))
+
+
+def _get_all_topics_last_viewed_at(user_id: UserID) -> datetime | None:
+    """Return the time the user last marked all topics as viewed (or
+    nothing, if the user hasn't done so yet).
+    """
+    redis_client = current_app.redis_client
+    key = _get_cache_key('all_topics', user_id)
+
+    cached_value = redis_client.get(key)
+    if cached_value is not None:
+        if cached_value == _CACHE_VALUE_NOT_VIEWED.encode():
+            return None
+        return datetime.fromisoformat(cached_value.decode())
+
+    last_viewed_at = db.session.scalar(
+        select(DbLastAllTopicsView.occurred_at).filter_by(user_id=user_id)
+    )
+
+    cache_value = (
+        last_viewed_at.isoformat()
+        if (last_viewed_at is not None)
+        else _CACHE_VALUE_NOT_VIEWED
+    )
+    # Do not replace a timestamp cached by a concurrent
+    # `mark_all_topics_as_viewed`.
+    redis_client.set(key, cache_value, ex=_CACHE_TTL, nx=True)
+
+    return last_viewed_at
 
 
 def mark_topic_as_just_viewed(topic_id: TopicID, user_id: UserID) -> None:
     """Mark the topic as last viewed by the user (if logged in) at the
     current time.
     """
+    now = datetime.utcnow()
+
     table = DbLastTopicView.__table__
     identifier = {
         'user_id': user_id,
         'topic_id': topic_id,
     }
     replacement = {
-        'occurred_at': datetime.utcnow(),
+        'occurred_at': now,
     }
 
     upsert(table, identifier, replacement)
 
+    _cache_last_viewed_at('topics', user_id, {topic_id: now}, overwrite=True)
+
 
 def mark_all_topics_as_viewed(user_id: UserID) -> None:
-    """Mark all topics as viewed by the current user."""
-    topic_ids = board_topic_query_service.get_all_topic_ids()
+    """Mark all topics as viewed by the current user.
+
+    Instead of recording a view for each topic, a single timestamp is
+    recorded before which all topics count as viewed.
+    """
+    now = datetime.utcnow()
+
+    table = DbLastAllTopicsView.__table__
+    identifier = {
+        'user_id': user_id,
+    }
+    replacement = {
+        'occurred_at': now,
+    }
 
-    _mark_topics_as_viewed(topic_ids, user_id)
+    upsert(table, identifier, replacement)
+
+    current_app.redis_client.set(
+        _get_cache_key('all_topics', user_id), now.isoformat(), ex=_CACHE_TTL
+    )
 
 
 def mark_all_topics_in_category_as_viewed(
     category_id: BoardCategoryID, user_id: UserID
 ) -> None:
     """Mark all topics in the category as viewed by the current user."""
-    topic_ids = board_topic_query_service.get_all_topic_ids_in_category(
-        category_id
-    )
-
-    _mark_topics_as_viewed(topic_ids, user_id)
-
+    now = datetime.utcnow()
 
-def _mark_topics_as_viewed(topic_ids: set[TopicID], user_id: UserID) -> None:
-    if not topic_ids:
-        return
+    topics_in_category = select(
+        literal(user_id, db.Uuid), DbTopic.id, literal(now, db.DateTime)
+    ).filter(DbTopic.category_id == category_id)
 
-    table = DbLastTopicView.__table__
-    replacement = {
-        'occurred_at': datetime.utcnow(),
-    }
+    insert_query = insert(DbLastTopicView).from_select(
+        ['user_id', 'topic_id', 'occurred_at'], topics_in_category
+    )
+    upsert_query = insert_query.on_conflict_do_update(
+        constraint=DbLastTopicView.__table__.primary_key,
+        set_={'occurred_at': insert_query.excluded.occurred_at},
+    ).returning(DbLastTopicView.topic_id)
 
-    identifiers = [
-        {'user_id': user_id, 'topic_id': topic_id} for topic_id in topic_ids
-    ]
+    topic_ids = db.session.scalars(upsert_query).all()
+    db.session.commit()
 
-    upsert_many(table, identifiers, replacement)
+    _cache_last_viewed_at(
+        'topics',
+        user_id,
+        dict.fromkeys(topic_ids, now),
+        overwrite=True,
+    )
 
 
 def delete_last_topic_views(topic_id: TopicID) -> None:
     """Delete the topic's last views."""
     db.session.execute(delete(DbLastTopicView).filter_by(topic_id=topic_id))
     db.session.commit()
+
+
+# -------------------------------------------------------------------- #
+# helpers
+
+
+def _is_unseen(
+    last_updated_at: datetime | None, last_viewed_at: datetime | None
+) -> bool:
+    if last_updated_at is None:
+        return False
+
+    return last_viewed_at is None or last_updated_at > last_viewed_at
+
+
+def _max_or_none(*values: datetime | None) -> datetime | None:
+    return max(filter(None, values), default=None)
+
+
+def _get_last_viewed_at(
+    kind: str,
+    user_id: UserID,
+    object_ids: set[UUID],
+    find_last_views: Callable[[UserID, set[UUID]], dict[UUID, datetime]],
+) -> dict[UUID, datetime]:
+    """Return the times the user last viewed the objects.
+
+    Look up the cache first, then fetch missing values from the database
+    with a single query and add them to the cache.
+    """
+    if not object_ids:
+        return {}
+
+    redis_client = current_app.redis_client
+    key = _get_cache_key(kind, user_id)
+
+    ordered_object_ids = list(object_ids)
+    cached_values = redis_client.hmget(
+        key, [str(object_id) for object_id in ordered_object_ids]
+    )
+
+    last_viewed_at_by_object_id = {}
+    missing_object_ids = set()
+    for object_id, cached_value in zip(
+        ordered_object_ids, cached_values, strict=True
+    ):
+        if cached_value is None:
+            missing_object_ids.add(object_id)
+        elif cached_value != _CACHE_VALUE_NOT_VIEWED.encode():
+            last_viewed_at_by_object_id[object_id] = datetime.fromisoformat(
+                cached_value.decode()
+            )
+
+    if missing_object_ids:
+        fetched = find_last_views(user_id, missing_object_ids)
+        last_viewed_at_by_object_id.update(fetched)
+
+        _cache_last_viewed_at(
+            kind,
+            user_id,
+            {
+                object_id: fetched.get(object_id)
+                for object_id in missing_object_ids
+            },
+            overwrite=False,
+        )
+
+    return last_viewed_at_by_object_id
+
+
+def _cache_last_viewed_at(
+    kind: str,
+    user_id: UserID,
+    last_viewed_at_by_object_id: dict[UUID, datetime | None],
+    *,
+    overwrite: bool,
+) -> None:
+    """Cache the times the user last viewed the objects.
+
+    Unless `overwrite` is set, already cached times are kept.
+    """
+    if not last_viewed_at_by_object_id:
+        return
+
+    redis_client = current_app.redis_client
+    key = _get_cache_key(kind, user_id)
+
+    pipeline = redis_client.pipeline()
+    for object_id, last_viewed_at in last_viewed_at_by_object_id.items():
+        field = str(object_id)
+        value = (
+            last_viewed_at.isoformat()
+            if (last_viewed_at is not None)
+            else _CACHE_VALUE_NOT_VIEWED
+        )
+        if overwrite:
+            pipeline.hset(key, field, value)
+        else:
+            pipeline.hsetnx(key, field, value)
+    pipeline.ttl(key)
+    ttl = pipeline.execute()[-1]
+
+    # Only let a newly created hash expire. Extending the expiry
+    # whenever fields are added would keep the other fields cached
+    # for longer than intended. (`EXPIRE … NX` requires Redis 7.)
+    if ttl == -1:
+        redis_client.expire(key, _CACHE_TTL)
+
+
+def _get_cache_key(kind: str, user_id: UserID) -> str:
+    return f'board:last_views:{kind}:{user_id}'
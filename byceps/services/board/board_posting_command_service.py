@@ -19,6 +19,7 @@ from byceps.events.board import (
     BoardPostingUpdatedEvent,
 )
 from byceps.services.brand import brand_service
+from byceps.services.text_markup import rendered_html_cache
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User, UserID
 from byceps.util.result import Err, Ok, Result
@@ -49,9 +50,13 @@ def create_posting(
 
     db_posting = DbPosting(posting_id, db_topic.id, creator.id, body)
     db.session.add(db_posting)
+    db.session.flush()
+
+    board_aggregation_service.apply_posting_created(db_posting)
+
     db.session.commit()
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    rendered_html_cache.populate(db_posting.body)
 
     db_category = db_topic.category
     brand = brand_service.get_brand(db_category.board.brand_id)
@@ -87,6 +92,8 @@ def update_posting(
     if commit:
         db.session.commit()
 
+    rendered_html_cache.populate(db_posting.body)
+
     brand = brand_service.get_brand(db_posting.topic.category.board.brand_id)
     posting_creator = _get_user(db_posting.creator_id)
     return BoardPostingUpdatedEvent(
@@ -111,12 +118,17 @@ def hide_posting(
 
     now = datetime.utcnow()
 
+    was_hidden = db_posting.hidden
+
     db_posting.hidden = True
     db_posting.hidden_at = now
     db_posting.hidden_by_id = moderator.id
-    db.session.commit()
+    db.session.flush()
 
-    board_aggregation_service.aggregate_topic(db_posting.topic)
+    if not was_hidden:
+        board_aggregation_service.apply_posting_hidden(db_posting)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_posting.topic.category.board.brand_id)
     posting_creator = _get_user(db_posting.creator_id)
@@ -144,13 +156,18 @@ def unhide_posting(
 
     now = datetime.utcnow()
 
+    was_hidden = db_posting.hidden
+
     # TODO: Store who un-hid the posting.
     db_posting.hidden = False
     db_posting.hidden_at = None
     db_posting.hidden_by_id = None
-    db.session.commit()
+    db.session.flush()
 
-    board_aggregation_service.aggregate_topic(db_posting.topic)
+    if was_hidden:
+        board_aggregation_service.apply_posting_unhidden(db_posting)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_posting.topic.category.board.brand_id)
     posting_creator = _get_user(db_posting.creator_id)
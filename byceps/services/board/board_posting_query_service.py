@@ -13,7 +13,6 @@ from sqlalchemy import select
 from byceps.database import db, paginate, Pagination
 from byceps.services.user import user_service
 from byceps.services.user.dbmodels.user import DbUser
-from byceps.util.iterables import index_of
 
 from .dbmodels.category import DbBoardCategory
 from .dbmodels.posting import DbPosting, DbPostingReaction
@@ -110,18 +109,23 @@ def _get_reactions_by_kind(
 def calculate_posting_page_number(
     db_posting: DbPosting, include_hidden: bool, postings_per_page: int
 ) -> int:
-    """Return the number of the page the posting should appear on."""
-    stmt = select(DbPosting).filter_by(topic_id=db_posting.topic_id)
+    """Return the number of the page the posting should appear on.
 
-    if not include_hidden:
-        stmt = stmt.filter_by(hidden=False)
+    The page is derived from the number of postings that precede the
+    posting in its topic, without loading any of them.
+    """
+    if db_posting.hidden and not include_hidden:
+        return 1  # Posting is not shown on any page.
 
-    stmt = stmt.order_by(DbPosting.created_at.asc())
+    stmt = (
+        select(db.func.count(DbPosting.id))
+        .filter_by(topic_id=db_posting.topic_id)
+        .filter(DbPosting.created_at < db_posting.created_at)
+    )
 
-    db_topic_postings = db.session.scalars(stmt).all()
+    if not include_hidden:
+        stmt = stmt.filter_by(hidden=False)
 
-    index = index_of(db_topic_postings, lambda p: p == db_posting)
-    if index is None:
-        return 1  # Shouldn't happen.
+    index = db.session.scalar(stmt) or 0
 
     return divmod(index, postings_per_page)[0] + 1
@@ -24,6 +24,7 @@ from byceps.events.board import (
     BoardTopicUpdatedEvent,
 )
 from byceps.services.brand import brand_service
+from byceps.services.text_markup import rendered_html_cache
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User, UserID
 from byceps.util.uuid import generate_uuid7
@@ -55,9 +56,13 @@ def create_topic(
     db.session.add(db_topic)
     db.session.add(db_posting)
     db.session.add(db_initial_topic_posting_association)
+    db.session.flush()
+
+    board_aggregation_service.apply_topic_created(db_topic, db_posting)
+
     db.session.commit()
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    rendered_html_cache.populate(db_posting.body)
 
     db_category = db_topic.category
     brand = brand_service.get_brand(db_category.board.brand_id)
@@ -112,12 +117,17 @@ def hide_topic(topic_id: TopicID, moderator: User) -> BoardTopicHiddenEvent:
 
     now = datetime.utcnow()
 
+    was_hidden = db_topic.hidden
+
     db_topic.hidden = True
     db_topic.hidden_at = now
     db_topic.hidden_by_id = moderator.id
-    db.session.commit()
+    db.session.flush()
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    if not was_hidden:
+        board_aggregation_service.apply_topic_hidden(db_topic)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
@@ -140,13 +150,18 @@ def unhide_topic(topic_id: TopicID, moderator: User) -> BoardTopicUnhiddenEvent:
 
     now = datetime.utcnow()
 
+    was_hidden = db_topic.hidden
+
     # TODO: Store who un-hid the topic.
     db_topic.hidden = False
     db_topic.hidden_at = None
     db_topic.hidden_by_id = None
-    db.session.commit()
+    db.session.flush()
+
+    if was_hidden:
+        board_aggregation_service.apply_topic_unhidden(db_topic)
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    db.session.commit()
 
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
@@ -281,10 +296,13 @@ def move_topic(
     db_new_category = db.session.get(DbBoardCategory, new_category_id)
 
     db_topic.category = db_new_category
-    db.session.commit()
+    db.session.flush()
 
-    for db_category in db_old_category, db_new_category:
-        board_aggregation_service.aggregate_category(db_category)
+    board_aggregation_service.apply_topic_moved(
+        db_topic, db_old_category, db_new_category
+    )
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
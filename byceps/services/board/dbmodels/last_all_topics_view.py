@@ -0,0 +1,42 @@
+"""
+byceps.services.board.dbmodels.last_all_topics_view
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from byceps.database import db
+from byceps.services.user.models.user import UserID
+from byceps.util.instances import ReprBuilder
+
+
+class DbLastAllTopicsView(db.Model):
+    """The last time a user marked all topics as viewed.
+
+    Topics not updated since then count as viewed by the user,
+    regardless of their individual last views.
+    """
+
+    __tablename__ = 'board_all_topics_lastviews'
+
+    user_id: Mapped[UserID] = mapped_column(
+        db.Uuid, db.ForeignKey('users.id'), primary_key=True
+    )
+    occurred_at: Mapped[datetime]
+
+    def __init__(self, user_id: UserID, occurred_at: datetime) -> None:
+        self.user_id = user_id
+        self.occurred_at = occurred_at
+
+    def __repr__(self) -> str:
+        return (
+            ReprBuilder(self)
+            .add_with_lookup('user_id')
+            .add_with_lookup('occurred_at')
+            .build()
+        )
@@ -6,15 +6,22 @@ byceps.services.brand.brand_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from datetime import timedelta
+
 from sqlalchemy import delete, select
 
 from byceps.database import db
 from byceps.services.brand.models import BrandID
+from byceps.util.cache import TtlCache
 
 from .dbmodels import DbBrand, DbBrandSetting
 from .models import Brand
 
 
+# Brands
+_brand_cache: TtlCache[BrandID, Brand] = TtlCache(timedelta(minutes=1))
+
+
 def create_brand(brand_id: BrandID, title: str) -> Brand:
     """Create a brand."""
     db_brand = DbBrand(brand_id, title)
@@ -43,6 +50,8 @@ def update_brand(
 
     db.session.commit()
 
+    _brand_cache.delete(brand_id)
+
     return _db_entity_to_brand(db_brand)
 
 
@@ -54,6 +63,8 @@ def delete_brand(brand_id: BrandID) -> None:
     db.session.execute(delete(DbBrand).where(DbBrand.id == brand_id))
     db.session.commit()
 
+    _brand_cache.delete(brand_id)
+
 
 def find_brand(brand_id: BrandID) -> Brand | None:
     """Return the brand with that id, or `None` if not found."""
@@ -90,6 +101,15 @@ def get_brand(brand_id: BrandID) -> Brand:
     return brand
 
 
+def get_brand_cached(brand_id: BrandID) -> Brand:
+    """Return the brand with that id, or raise an exception.
+
+    The brand is served from a short-lived, process-local cache if
+    possible.
+    """
+    return _brand_cache.get_or_set(brand_id, lambda: get_brand(brand_id))
+
+
 def get_all_brands() -> list[Brand]:
     """Return all brands, ordered by title."""
     db_brands = db.session.scalars(
@@ -6,10 +6,11 @@ byceps.services.email.email_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
 from email.message import EmailMessage
 from email.utils import parseaddr
-from smtplib import SMTP, SMTP_SSL
+from itertools import islice
+import time
 
 from flask import current_app
 import structlog
@@ -17,21 +18,19 @@ import structlog
 from byceps.util.jobqueue import enqueue
 from byceps.util.result import Err, Ok, Result
 
+from . import smtp_client
 from .models import Message, NameAndAddress
+from .smtp_client import SmtpConfig
 
 
 log = structlog.get_logger()
 
 
-@dataclass(frozen=True)
-class SmtpConfig:
-    host: str
-    port: int
-    starttls: bool
-    use_ssl: bool
-    username: str | None
-    password: str | None
-    suppress_send: bool
+# The number of messages to send in a single job
+BATCH_SIZE = 100
+
+
+Email = tuple[str, list[str], str, str]
 
 
 def parse_address(address_str: str) -> Result[NameAndAddress, str]:
@@ -62,6 +61,33 @@ def enqueue_email(
     enqueue(send_email, sender_str, recipients, subject, body)
 
 
+def enqueue_messages(messages: Iterable[Message]) -> None:
+    """Enqueue e-mails to be sent asynchronously, in batches.
+
+    Each batch is sent over a single SMTP connection.
+    """
+    emails = (
+        (
+            message.sender.format(),
+            message.recipients,
+            message.subject,
+            message.body,
+        )
+        for message in messages
+    )
+
+    for batch in _split_into_batches(emails, BATCH_SIZE):
+        enqueue(send_emails, batch)
+
+
+def _split_into_batches(
+    emails: Iterable[Email], batch_size: int
+) -> Iterator[list[Email]]:
+    iterator = iter(emails)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
 def send_email(
     sender: str, recipients: list[str], subject: str, body: str
 ) -> None:
@@ -69,6 +95,27 @@ def send_email(
     send(sender, recipients, subject, body)
 
 
+def send_emails(emails: list[Email]) -> None:
+    """Send e-mails.
+
+    Raise an exception after all e-mails have been attempted if any of
+    them failed.
+    """
+    failure_count = 0
+
+    for sender, recipients, subject, body in emails:
+        try:
+            send(sender, recipients, subject, body)
+        except Exception:
+            log.exception('Sending email failed')
+            failure_count += 1
+
+    if failure_count:
+        raise RuntimeError(
+            f'Sending {failure_count} of {len(emails)} emails failed.'
+        )
+
+
 def send(sender: str, recipients: list[str], subject: str, body: str) -> None:
     """Assemble and send e-mail."""
     smtp_config = _load_smtp_config()
@@ -80,7 +127,14 @@ def send(sender: str, recipients: list[str], subject: str, body: str) -> None:
     message = _build_message(sender, recipients, subject, body)
 
     log.debug('Sending email.')
-    _send_via_smtp(smtp_config, message)
+
+    started_at = time.monotonic()
+    smtp_client.get_client(smtp_config).send_message(message)
+    log.info(
+        'Email sent',
+        recipient_count=len(recipients),
+        duration_ms=round((time.monotonic() - started_at) * 1000),
+    )
 
 
 def _load_smtp_config() -> SmtpConfig:
@@ -107,36 +161,3 @@ def _build_message(
     message['Subject'] = subject
     message.set_content(body)
     return message
-
-
-def _send_via_smtp(smtp_config: SmtpConfig, message: EmailMessage) -> None:
-    """Send email via SMTP."""
-    if smtp_config.use_ssl:
-        _send_via_smtp_with_ssl(smtp_config, message)
-    else:
-        _send_via_smtp_without_ssl(smtp_config, message)
-
-
-def _send_via_smtp_with_ssl(
-    smtp_config: SmtpConfig, message: EmailMessage
-) -> None:
-    """Send email via SMTP with SSL."""
-    with SMTP_SSL(smtp_config.host, smtp_config.port) as smtp:
-        if smtp_config.username and smtp_config.password:
-            smtp.login(smtp_config.username, smtp_config.password)
-
-        smtp.send_message(message)
-
-
-def _send_via_smtp_without_ssl(
-    smtp_config: SmtpConfig, message: EmailMessage
-) -> None:
-    """Send email via SMTP without SSL (but potentially with STARTTLS)."""
-    with SMTP(smtp_config.host, smtp_config.port) as smtp:
-        if smtp_config.starttls:
-            smtp.starttls()
-
-        if smtp_config.username and smtp_config.password:
-            smtp.login(smtp_config.username, smtp_config.password)
-
-        smtp.send_message(message)
@@ -0,0 +1,140 @@
+"""
+byceps.services.email.smtp_client
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Persistent SMTP connections
+
+Establishing a connection (including TLS handshake and login) takes
+much longer than sending a message over it. Thus a connection is kept
+open and reused for subsequent messages (within the same process),
+and re-established should it have been lost.
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from email.message import EmailMessage
+from functools import cache
+from smtplib import (
+    SMTP,
+    SMTP_SSL,
+    SMTPResponseException,
+    SMTPServerDisconnected,
+)
+import time
+
+import structlog
+
+
+log = structlog.get_logger()
+
+
+# Servers tend to close idle connections after a while. Rather than
+# having the next message run into that, reconnect right away.
+MAXIMUM_IDLE_SECONDS = 60
+
+# SMTP code with which a server announces that it closes the connection
+_SERVICE_NOT_AVAILABLE_CODE = 421
+
+
+@dataclass(frozen=True)
+class SmtpConfig:
+    host: str
+    port: int
+    starttls: bool
+    use_ssl: bool
+    username: str | None
+    password: str | None
+    suppress_send: bool
+
+
+class SmtpClient:
+    """Send messages over a persistent connection to an SMTP server."""
+
+    def __init__(self, config: SmtpConfig) -> None:
+        self._config = config
+        self._connection: SMTP | None = None
+        self._last_used_at = 0.0
+
+    def send_message(self, message: EmailMessage) -> None:
+        """Send the message.
+
+        Reconnect and retry once if the connection turns out to have
+        been closed.
+        """
+        try:
+            self._get_connection().send_message(message)
+        except SMTPServerDisconnected:
+            self._reconnect_and_send(message)
+        except SMTPResponseException as e:
+            if e.smtp_code != _SERVICE_NOT_AVAILABLE_CODE:
+                self.close()
+                raise
+            self._reconnect_and_send(message)
+        except Exception:
+            # Do not reuse a connection in an unknown state.
+            self.close()
+            raise
+
+        self._last_used_at = time.monotonic()
+
+    def _reconnect_and_send(self, message: EmailMessage) -> None:
+        log.info('SMTP connection lost, reconnecting')
+        self.close()
+        self._get_connection().send_message(message)
+
+    def close(self) -> None:
+        """Close the connection, if open."""
+        connection = self._connection
+        if connection is None:
+            return
+
+        self._connection = None
+
+        try:
+            connection.quit()
+        except (SMTPServerDisconnected, OSError):
+            connection.close()
+
+    def _get_connection(self) -> SMTP:
+        idle_seconds = time.monotonic() - self._last_used_at
+        if (self._connection is not None) and (
+            idle_seconds > MAXIMUM_IDLE_SECONDS
+        ):
+            self.close()
+
+        if self._connection is None:
+            self._connection = self._connect()
+
+        return self._connection
+
+    def _connect(self) -> SMTP:
+        config = self._config
+
+        started_at = time.monotonic()
+
+        connection: SMTP
+        if config.use_ssl:
+            connection = SMTP_SSL(config.host, config.port)
+        else:
+            connection = SMTP(config.host, config.port)
+            if config.starttls:
+                connection.starttls()
+
+        if config.username and config.password:
+            connection.login(config.username, config.password)
+
+        log.info(
+            'SMTP connection established',
+            host=config.host,
+            duration_ms=round((time.monotonic() - started_at) * 1000),
+        )
+
+        return connection
+
+
+@cache
+def get_client(config: SmtpConfig) -> SmtpClient:
+    """Return the process-wide client for that configuration."""
+    return SmtpClient(config)
@@ -7,14 +7,21 @@ byceps.services.image.image_service
 """
 
 from collections.abc import Iterable
+from pathlib import Path
 from typing import BinaryIO
 
-from byceps.util.image import read_dimensions
+from byceps.util import upload
+from byceps.util.image import create_thumbnails, read_dimensions
 from byceps.util.image.models import Dimensions, ImageType
 from byceps.util.image.typeguess import guess_type
 from byceps.util.result import Err, Ok, Result
 
 
+# Reject images with more pixels than this before decoding them, as
+# decoding takes time and memory proportional to the pixel count.
+MAXIMUM_PIXEL_COUNT = 25_000_000
+
+
 def get_image_type_names(types: Iterable[ImageType]) -> frozenset[str]:
     """Return the names of the image types."""
     return frozenset(t.name.upper() for t in types)
@@ -49,3 +56,96 @@ def determine_dimensions(stream: BinaryIO) -> Dimensions:
     dimensions = read_dimensions(stream)
     stream.seek(0)
     return dimensions
+
+
+def check_pixel_count(
+    dimensions: Dimensions, *, maximum_pixel_count: int = MAXIMUM_PIXEL_COUNT
+) -> Result[None, str]:
+    """Return an error if the image has too many pixels to process."""
+    if dimensions.pixel_count > maximum_pixel_count:
+        return Err(
+            f'Image must not have more than {maximum_pixel_count:,} pixels.'
+        )
+
+    return Ok(None)
+
+
+def needs_thumbnail(
+    dimensions: Dimensions,
+    maximum_dimensions: Dimensions,
+    *,
+    force_square: bool = False,
+) -> bool:
+    """Return `True` if the image has to be shrunk (or, if forced, cropped
+    to be square).
+    """
+    image_too_large = dimensions > maximum_dimensions
+    return image_too_large or (force_square and not dimensions.is_square)
+
+
+def get_unprocessed_path(path: Path) -> Path:
+    """Return the path to store an uploaded image at until it has been
+    processed and stored at the given path.
+    """
+    return path.with_name(f'.{path.name}.unprocessed')
+
+
+def create_thumbnail_files(
+    source_path: Path,
+    target_path: Path,
+    image_type: ImageType,
+    maximum_dimensions: Dimensions,
+    variant_dimensions: Iterable[Dimensions],
+    *,
+    force_square: bool = False,
+) -> None:
+    """Store a version of the image, shrunk to the maximum dimensions, at
+    the target path, and smaller variants as well as WebP versions next
+    to it.
+
+    If source and target path are the same, the image is only replaced
+    if it has to be shrunk (or cropped).
+
+    The image is decoded only once. Intended to be run as a background
+    job as this is expensive for large images.
+    """
+    with source_path.open('rb') as f:
+        dimensions = determine_dimensions(f)
+
+        thumbnails = create_thumbnails(
+            f,
+            image_type,
+            [maximum_dimensions, *variant_dimensions],
+            force_square=force_square,
+            additional_image_types=[ImageType.webp],
+        )
+
+    for thumbnail in thumbnails:
+        if thumbnail.maximum_dimensions == maximum_dimensions and (
+            thumbnail.image_type == image_type
+        ):
+            if (source_path != target_path) or needs_thumbnail(
+                dimensions, maximum_dimensions, force_square=force_square
+            ):
+                upload.replace(thumbnail.stream, target_path)
+        else:
+            thumbnail_path = get_thumbnail_path(
+                target_path, thumbnail.maximum_dimensions, thumbnail.image_type
+            )
+            upload.replace(thumbnail.stream, thumbnail_path)
+
+
+def get_thumbnail_path(
+    path: Path, maximum_dimensions: Dimensions, image_type: ImageType
+) -> Path:
+    """Return the path of the image's thumbnail of that size and type."""
+    width, height = maximum_dimensions
+    return path.with_name(f'{path.stem}-{width}x{height}.{image_type.name}')
+
+
+def delete_thumbnail_files(path: Path) -> None:
+    """Delete the image's thumbnails, of whatever sizes and types they
+    have been created in.
+    """
+    for thumbnail_path in path.parent.glob(f'{path.stem}-*x*.*'):
+        upload.delete(thumbnail_path)
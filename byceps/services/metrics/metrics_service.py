@@ -6,8 +6,11 @@ byceps.metrics.metrics_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
+import time
 
+from byceps.services.authn.api import api_token_usage_service
+from byceps.services.authn.password import password_hashing_stats_service
 from byceps.services.board import (
     board_posting_query_service,
     board_service,
@@ -26,6 +29,7 @@ from byceps.services.shop.shop import shop_service
 from byceps.services.shop.shop.models import Shop, ShopID
 from byceps.services.ticketing import ticket_service
 from byceps.services.user import user_stats_service
+from byceps.services.webhooks import webhook_delivery_stats_service
 
 
 def serialize(metrics: Iterator[Metric]) -> Iterator[str]:
@@ -35,6 +39,7 @@ def serialize(metrics: Iterator[Metric]) -> Iterator[str]:
 
 
 def collect_metrics() -> Iterator[Metric]:
+    """Collect all metrics, followed by the time each collector took."""
     brand_ids = [brand.id for brand in brand_service.get_all_brands()]
 
     active_parties = party_service.get_active_parties()
@@ -43,16 +48,65 @@ def collect_metrics() -> Iterator[Metric]:
     active_shops = shop_service.get_active_shops()
     active_shop_ids = {shop.id for shop in active_shops}
 
-    yield from _collect_board_metrics(brand_ids)
-    yield from _collect_consent_metrics()
-    yield from _collect_shop_ordered_product_metrics(active_shop_ids)
-    yield from _collect_shop_order_metrics(active_shops)
-    # Copy and uncomment the following line to add all orders with the
-    # given order number prefix (usually one per party) to the metrics.
-    #yield from _collect_shop_order_metrics_for_order_number_prefix('LAN23-B')
-    yield from _collect_seating_metrics(active_party_ids)
-    yield from _collect_ticket_metrics(active_parties)
-    yield from _collect_user_metrics()
+    collectors: list[tuple[str, Callable[[], Iterator[Metric]]]] = [
+        ('api_token', _collect_api_token_metrics),
+        ('board', lambda: _collect_board_metrics(brand_ids)),
+        ('consent', _collect_consent_metrics),
+        ('password_hashing', _collect_password_hashing_metrics),
+        (
+            'shop_ordered_product',
+            lambda: _collect_shop_ordered_product_metrics(active_shop_ids),
+        ),
+        ('shop_order', lambda: _collect_shop_order_metrics(active_shops)),
+        # Copy and uncomment the following line to add all orders with the
+        # given order number prefix (usually one per party) to the metrics.
+        # (
+        #     'shop_order_LAN23-B',
+        #     lambda: _collect_shop_order_metrics_for_order_number_prefix(
+        #         'LAN23-B'
+        #     ),
+        # ),
+        ('seating', lambda: _collect_seating_metrics(active_party_ids)),
+        ('ticket', lambda: _collect_ticket_metrics(active_parties)),
+        ('user', _collect_user_metrics),
+        ('webhook_delivery', _collect_webhook_delivery_metrics),
+    ]
+
+    durations_by_collector = {}
+
+    for name, collect in collectors:
+        started_at = time.monotonic()
+        yield from collect()
+        durations_by_collector[name] = time.monotonic() - started_at
+
+    # Metrics with the same name have to be grouped together.
+    for name, duration in durations_by_collector.items():
+        yield Metric(
+            'metrics_collector_duration_seconds',
+            round(duration, 6),
+            labels=[Label('collector', name)],
+        )
+
+
+def _collect_api_token_metrics() -> Iterator[Metric]:
+    """Provide a histogram of request durations per API token."""
+    name = 'api_request_duration_seconds'
+
+    for usage in api_token_usage_service.get_usages():
+        token_label = Label('api_token_id', str(usage.api_token_id))
+
+        for bound, count in usage.duration_bucket_counts:
+            yield Metric(
+                f'{name}_bucket', count, [token_label, Label('le', str(bound))]
+            )
+        yield Metric(
+            f'{name}_bucket',
+            usage.request_count,
+            [token_label, Label('le', '+Inf')],
+        )
+
+        yield Metric(f'{name}_sum', round(usage.duration_sum, 6), [token_label])
+        yield Metric(f'{name}_count', usage.request_count, [token_label])
 
 
 def _collect_board_metrics(brand_ids: list[BrandID]) -> Iterator[Metric]:
@@ -84,6 +138,48 @@ def _collect_consent_metrics() -> Iterator[Metric]:
         )
 
 
+def _collect_password_hashing_metrics() -> Iterator[Metric]:
+    """Provide a histogram of password hashing durations, plus time
+    spent waiting and rejections, per operation.
+    """
+    all_stats = password_hashing_stats_service.get_stats()
+
+    name = 'password_hashing_duration_seconds'
+    for stats in all_stats:
+        operation_label = Label('operation', stats.operation)
+
+        for bound, count in stats.duration_bucket_counts:
+            yield Metric(
+                f'{name}_bucket',
+                count,
+                [operation_label, Label('le', str(bound))],
+            )
+        yield Metric(
+            f'{name}_bucket',
+            stats.count,
+            [operation_label, Label('le', '+Inf')],
+        )
+
+        yield Metric(
+            f'{name}_sum', round(stats.duration_sum, 6), [operation_label]
+        )
+        yield Metric(f'{name}_count', stats.count, [operation_label])
+
+    for stats in all_stats:
+        yield Metric(
+            'password_hashing_queue_wait_seconds_total',
+            round(stats.queue_wait_sum, 6),
+            [Label('operation', stats.operation)],
+        )
+
+    for stats in all_stats:
+        yield Metric(
+            'password_hashing_rejections_total',
+            stats.rejected_count,
+            [Label('operation', stats.operation)],
+        )
+
+
 def _collect_shop_ordered_product_metrics(
     shop_ids: set[ShopID],
 ) -> Iterator[Metric]:
@@ -206,3 +302,38 @@ def _collect_user_metrics() -> Iterator[Metric]:
     yield Metric('users_suspended_count', users_suspended)
     yield Metric('users_deleted_count', users_deleted)
     yield Metric('users_total_count', users_total)
+
+
+def _collect_webhook_delivery_metrics() -> Iterator[Metric]:
+    """Provide a histogram of webhook call durations, plus failures, per
+    webhook.
+    """
+    all_stats = webhook_delivery_stats_service.get_stats()
+
+    name = 'webhook_call_duration_seconds'
+    for stats in all_stats:
+        webhook_label = Label('webhook_id', str(stats.webhook_id))
+
+        for bound, count in stats.duration_bucket_counts:
+            yield Metric(
+                f'{name}_bucket',
+                count,
+                [webhook_label, Label('le', str(bound))],
+            )
+        yield Metric(
+            f'{name}_bucket',
+            stats.count,
+            [webhook_label, Label('le', '+Inf')],
+        )
+
+        yield Metric(
+            f'{name}_sum', round(stats.duration_sum, 6), [webhook_label]
+        )
+        yield Metric(f'{name}_count', stats.count, [webhook_label])
+
+    for stats in all_stats:
+        yield Metric(
+            'webhook_call_failures_total',
+            stats.failed_count,
+            [Label('webhook_id', str(stats.webhook_id))],
+        )
@@ -0,0 +1,93 @@
+"""
+byceps.services.metrics.metrics_snapshot_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Snapshots of collected metrics, stored in Redis
+
+Collecting the metrics takes quite a few (partially expensive) database
+queries. Thus the metrics are collected by a job in the background
+worker and scrapes are served the latest snapshot.
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import time
+
+from flask import current_app
+
+from byceps.util.jobqueue import enqueue
+
+from . import metrics_service
+
+
+# Scraping a snapshot older than this requests a new one.
+SNAPSHOT_MAX_AGE = timedelta(minutes=1)
+
+_SNAPSHOT_KEY = 'metrics:snapshot'
+_REFRESH_REQUESTED_KEY = 'metrics:snapshot:refresh_requested'
+
+# Allow another refresh to be requested should a requested one never
+# have finished.
+_REFRESH_REQUEST_TIMEOUT = timedelta(minutes=5)
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    created_at: datetime
+    lines: list[str]
+
+
+def refresh_snapshot() -> None:
+    """Collect the metrics and store them as the latest snapshot."""
+    started_at = time.monotonic()
+
+    metrics = metrics_service.collect_metrics()
+    text = ''.join(metrics_service.serialize(metrics))
+
+    duration = time.monotonic() - started_at
+    text += f'metrics_collection_duration_seconds {round(duration, 6)}\n'
+
+    redis_client = current_app.redis_client
+    redis_client.hset(
+        _SNAPSHOT_KEY,
+        mapping={
+            'created_at': datetime.utcnow().isoformat(),
+            'text': text,
+        },
+    )
+    redis_client.delete(_REFRESH_REQUESTED_KEY)
+
+
+def request_refresh_if_stale() -> None:
+    """Have the snapshot be refreshed in the background if it is missing
+    or older than the maximum age.
+    """
+    snapshot = find_snapshot()
+    if (snapshot is not None) and (
+        datetime.utcnow() - snapshot.created_at < SNAPSHOT_MAX_AGE
+    ):
+        return
+
+    # Request only one refresh at a time.
+    refresh_not_yet_requested = current_app.redis_client.set(
+        _REFRESH_REQUESTED_KEY, 1, nx=True, ex=_REFRESH_REQUEST_TIMEOUT
+    )
+    if refresh_not_yet_requested:
+        enqueue(refresh_snapshot)
+
+
+def find_snapshot() -> MetricsSnapshot | None:
+    """Return the latest snapshot, if any."""
+    values = current_app.redis_client.hmget(_SNAPSHOT_KEY, 'created_at', 'text')
+
+    created_at_bytes, text_bytes = values
+    if (created_at_bytes is None) or (text_bytes is None):
+        return None
+
+    return MetricsSnapshot(
+        created_at=datetime.fromisoformat(created_at_bytes.decode()),
+        lines=text_bytes.decode().splitlines(keepends=True),
+    )
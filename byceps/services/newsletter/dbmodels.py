@@ -44,6 +44,13 @@ class DbSubscription(db.Model):
     """A user's subscription to a list."""
 
     __tablename__ = 'newsletter_subscriptions'
+    __table_args__ = (
+        # Covers selecting a list's subscribers (the primary key starts
+        # with the user ID).
+        db.Index(
+            'ix_newsletter_subscriptions_list_id_user_id', 'list_id', 'user_id'
+        ),
+    )
 
     user_id: Mapped[UserID] = mapped_column(
         db.Uuid, db.ForeignKey('users.id'), primary_key=True
@@ -8,7 +8,7 @@ byceps.services.newsletter.newsletter_service
 
 from collections.abc import Iterator, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 
 from byceps.database import db
 from byceps.services.user.dbmodels.user import DbUser
@@ -20,6 +20,9 @@ from .errors import UnknownListIdError
 from .models import List, ListID, Subscriber
 
 
+_SUBSCRIBERS_FETCH_CHUNK_SIZE = 1000
+
+
 def find_list(list_id: ListID) -> List | None:
     """Return the list with that ID, or `None` if not found."""
     db_list = db.session.get(DbList, list_id)
@@ -49,20 +52,7 @@ def get_all_lists() -> list[List]:
 
 def count_subscribers_to_list(list_id: ListID) -> int:
     """Return the number of users that are currently subscribed to that list."""
-    return (
-        db.session.scalar(
-            select(db.func.count())
-            .select_from(DbUser)
-            .join(DbSubscription)
-            .filter(DbSubscription.list_id == list_id)
-            .filter(DbUser.email_address.is_not(None))
-            .filter(DbUser.initialized == True)  # noqa: E712
-            .filter(DbUser.email_address_verified == True)  # noqa: E712
-            .filter(DbUser.suspended == False)  # noqa: E712
-            .filter(DbUser.deleted == False)  # noqa: E712
-        )
-        or 0
-    )
+    return db.session.scalar(_select_subscribers(list_id, db.func.count())) or 0
 
 
 def get_subscribers_to_list(list_id: ListID) -> Iterator[Subscriber]:
@@ -74,12 +64,29 @@ def get_subscribers_to_list(list_id: ListID) -> Iterator[Subscriber]:
     - have no or an unverified email address,
     - are suspended, or
     - have been deleted.
+
+    Subscribers are fetched in chunks (using a server-side cursor) as
+    they are consumed, so that large lists are not loaded into memory
+    at once.
     """
     rows = db.session.execute(
-        select(
-            DbUser.screen_name,
-            DbUser.email_address,
+        _select_subscribers(list_id, DbUser.screen_name, DbUser.email_address)
+        .order_by(DbUser.created_at)
+        .execution_options(yield_per=_SUBSCRIBERS_FETCH_CHUNK_SIZE)
+    )
+
+    for row in rows:
+        yield Subscriber(
+            screen_name=row.screen_name,
+            email_address=row.email_address,
         )
+
+
+def _select_subscribers(list_id: ListID, *columns) -> Select:
+    """Select users that are currently subscribed to the list."""
+    return (
+        select(*columns)
+        .select_from(DbUser)
         .join(DbSubscription)
         .filter(DbSubscription.list_id == list_id)
         .filter(DbUser.email_address.is_not(None))
@@ -87,13 +94,7 @@ def get_subscribers_to_list(list_id: ListID) -> Iterator[Subscriber]:
         .filter(DbUser.email_address_verified == True)  # noqa: E712
         .filter(DbUser.suspended == False)  # noqa: E712
         .filter(DbUser.deleted == False)  # noqa: E712
-    ).all()
-
-    for row in rows:
-        yield Subscriber(
-            screen_name=row.screen_name,
-            email_address=row.email_address,
-        )
+    )
 
 
 def get_subscription_updates_for_user(
@@ -17,6 +17,7 @@ from byceps.services.brand import brand_service
 from byceps.services.brand.dbmodels import DbBrand
 from byceps.services.brand.models import Brand, BrandID
 from byceps.services.party.models import PartyID
+from byceps.util.cache import TtlCache
 
 from .dbmodels import DbParty, DbPartySetting
 from .models import Party, PartyWithBrand
@@ -26,6 +27,10 @@ class UnknownPartyIdError(Exception):
     pass
 
 
+# Parties, looked up on every request to a site application
+_party_cache: TtlCache[PartyID, Party] = TtlCache(timedelta(minutes=1))
+
+
 def create_party(
     party_id: PartyID,
     brand: Brand,
@@ -85,6 +90,8 @@ def update_party(
 
     db.session.commit()
 
+    _party_cache.delete(party_id)
+
     return _db_entity_to_party(db_party)
 
 
@@ -96,6 +103,8 @@ def delete_party(party_id: PartyID) -> None:
     db.session.execute(delete(DbParty).where(DbParty.id == party_id))
     db.session.commit()
 
+    _party_cache.delete(party_id)
+
 
 def count_parties() -> int:
     """Return the number of parties (of all brands)."""
@@ -132,6 +141,15 @@ def get_party(party_id: PartyID) -> Party:
     return party
 
 
+def get_party_cached(party_id: PartyID) -> Party:
+    """Return the party with that id.
+
+    The party is served from a short-lived, process-local cache if
+    possible.
+    """
+    return _party_cache.get_or_set(party_id, lambda: get_party(party_id))
+
+
 def get_all_parties() -> list[Party]:
     """Return all parties."""
     db_parties = db.session.scalars(select(DbParty)).all()
@@ -75,3 +75,9 @@ class SeatToImport:
     label: str | None = None
     type_: str | None = None
     group_title: str | None = None
+
+
+@dataclass(frozen=True)
+class SeatImportSummary:
+    seat_count: int
+    seat_group_count: int
@@ -8,18 +8,35 @@ byceps.services.seating.seat_import_service
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
 import json
+from typing import Any
 
 from pydantic import ValidationError
+from sqlalchemy import insert
 
+from byceps.database import db
 from byceps.services.party.models import PartyID
 from byceps.services.ticketing import ticket_category_service
 from byceps.services.ticketing.models.ticket import TicketCategoryID
 from byceps.util.result import Err, Ok, Result
+from byceps.util.uuid import generate_uuid7
 
 from . import seat_group_service, seat_service, seating_area_service
-from .models import Seat, SeatingAreaID, SeatToImport, SerializableSeatToImport
+from .dbmodels.seat import DbSeat
+from .dbmodels.seat_group import DbSeatGroup, DbSeatGroupAssignment
+from .models import (
+    Seat,
+    SeatID,
+    SeatImportSummary,
+    SeatingAreaID,
+    SeatToImport,
+    SerializableSeatToImport,
+)
+
+
+BULK_IMPORT_CHUNK_SIZE = 1000
 
 
 def serialize_seat_to_import(
@@ -179,3 +196,96 @@ def import_seat(seat_to_import: SeatToImport) -> Result[Seat, str]:
         return Ok(imported_seat)
     except Exception as e:
         return Err(str(e))
+
+
+def import_seats(
+    party_id: PartyID,
+    seats_to_import: Sequence[SeatToImport],
+    *,
+    chunk_size: int = BULK_IMPORT_CHUNK_SIZE,
+) -> Result[SeatImportSummary, str]:
+    """Import seats, and create the seat groups they are assigned to, in
+    a single transaction.
+
+    Rows are inserted in chunks of multiple rows each. Either all seats
+    and seat groups are imported, or none.
+    """
+    seat_rows = []
+    seat_ids_by_group_title: dict[str, list[SeatID]] = defaultdict(list)
+    category_ids_by_group_title: dict[str, TicketCategoryID] = {}
+
+    for seat_to_import in seats_to_import:
+        seat_id = SeatID(generate_uuid7())
+
+        seat_rows.append(
+            {
+                'id': seat_id,
+                'area_id': seat_to_import.area_id,
+                'coord_x': seat_to_import.coord_x,
+                'coord_y': seat_to_import.coord_y,
+                'rotation': seat_to_import.rotation,
+                'category_id': seat_to_import.category_id,
+                'label': seat_to_import.label,
+                'type_': seat_to_import.type_,
+            }
+        )
+
+        group_title = seat_to_import.group_title
+        if group_title is None:
+            continue
+
+        group_category_id = category_ids_by_group_title.setdefault(
+            group_title, seat_to_import.category_id
+        )
+        if seat_to_import.category_id != group_category_id:
+            return Err(
+                f'Seats of group "{group_title}" belong to different '
+                'ticket categories.'
+            )
+
+        seat_ids_by_group_title[group_title].append(seat_id)
+
+    group_rows = []
+    assignment_rows = []
+
+    for group_title, seat_ids in seat_ids_by_group_title.items():
+        group_id = generate_uuid7()
+
+        group_rows.append(
+            {
+                'id': group_id,
+                'party_id': party_id,
+                'ticket_category_id': category_ids_by_group_title[group_title],
+                'seat_quantity': len(seat_ids),
+                'title': group_title,
+            }
+        )
+
+        assignment_rows.extend(
+            {'id': generate_uuid7(), 'group_id': group_id, 'seat_id': seat_id}
+            for seat_id in seat_ids
+        )
+
+    try:
+        _insert_in_chunks(DbSeat, seat_rows, chunk_size)
+        _insert_in_chunks(DbSeatGroup, group_rows, chunk_size)
+        _insert_in_chunks(DbSeatGroupAssignment, assignment_rows, chunk_size)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return Err(str(e))
+
+    summary = SeatImportSummary(
+        seat_count=len(seat_rows),
+        seat_group_count=len(group_rows),
+    )
+    return Ok(summary)
+
+
+def _insert_in_chunks(
+    model: type[db.Model], rows: list[dict[str, Any]], chunk_size: int
+) -> None:
+    """Insert rows with one multi-row statement per chunk."""
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start : start + chunk_size]
+        db.session.execute(insert(model), chunk)
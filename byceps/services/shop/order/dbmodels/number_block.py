@@ -0,0 +1,55 @@
+"""
+byceps.services.shop.order.dbmodels.number_block
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from byceps.database import db
+from byceps.services.shop.order.models.number import OrderNumberSequenceID
+from byceps.util.instances import ReprBuilder
+
+
+class DbOrderNumberBlock(db.Model):
+    """A block of consecutive order numbers reserved by a single worker
+    process.
+    """
+
+    __tablename__ = 'shop_order_number_blocks'
+
+    id: Mapped[UUID] = mapped_column(db.Uuid, primary_key=True)
+    sequence_id: Mapped[OrderNumberSequenceID] = mapped_column(
+        db.Uuid, db.ForeignKey('shop_order_number_sequences.id'), index=True
+    )
+    reserved_at: Mapped[datetime]
+    first_value: Mapped[int]
+    last_value: Mapped[int]
+
+    def __init__(
+        self,
+        block_id: UUID,
+        sequence_id: OrderNumberSequenceID,
+        reserved_at: datetime,
+        first_value: int,
+        last_value: int,
+    ) -> None:
+        self.id = block_id
+        self.sequence_id = sequence_id
+        self.reserved_at = reserved_at
+        self.first_value = first_value
+        self.last_value = last_value
+
+    def __repr__(self) -> str:
+        return (
+            ReprBuilder(self)
+            .add_with_lookup('sequence_id')
+            .add_with_lookup('first_value')
+            .add_with_lookup('last_value')
+            .build()
+        )
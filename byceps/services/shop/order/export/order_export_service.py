@@ -6,20 +6,27 @@ byceps.services.shop.order.export.order_export_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime, UTC
 from decimal import Decimal
+from functools import cache
 from typing import Any
 from zoneinfo import ZoneInfo
 
 from flask import current_app
+from jinja2 import Template
 
 from byceps.services.shop.order import order_service
 from byceps.services.shop.order.models.detailed_order import DetailedOrder
-from byceps.services.shop.order.models.order import OrderID
+from byceps.services.shop.order.models.order import OrderID, PaymentState
+from byceps.services.shop.shop.models import ShopID
 from byceps.services.user import user_service
 from byceps.util.templating import load_template
 
 
+CONTENT_TYPE = 'application/xml; charset=iso-8859-1'
+
+
 def export_order_as_xml(order_id: OrderID) -> dict[str, str] | None:
     """Export the order as an XML document."""
     order = order_service.find_order_with_details(order_id)
@@ -27,28 +34,68 @@ def export_order_as_xml(order_id: OrderID) -> dict[str, str] | None:
     if order is None:
         return None
 
-    context = _assemble_context(order)
-    xml = _render_template(context)
+    email_address = user_service.get_email_address(order.placed_by.id)
+
+    context = _assemble_context([(order, email_address)])
+    xml = _get_template().render(**context)
 
     return {
         'content': xml,
-        'content_type': 'application/xml; charset=iso-8859-1',
+        'content_type': CONTENT_TYPE,
     }
 
 
-def _assemble_context(order: DetailedOrder) -> dict[str, Any]:
-    """Assemble template context."""
-    email_address = user_service.get_email_address(order.placed_by.id)
+def export_orders_for_shop_as_xml(
+    shop_id: ShopID,
+    *,
+    created_from: datetime | None = None,
+    created_before: datetime | None = None,
+    only_payment_state: PaymentState | None = None,
+) -> Iterator[str]:
+    """Export the shop's orders (optionally only those created within the
+    given period) as a single XML document.
+
+    The document is generated piece by piece as orders are loaded, in
+    batches.
+    """
+    order_batches = order_service.get_orders_with_details_for_shop_in_batches(
+        shop_id,
+        created_from=created_from,
+        created_before=created_before,
+        only_payment_state=only_payment_state,
+    )
+
+    orders_and_email_addresses = _add_email_addresses(order_batches)
 
+    context = _assemble_context(orders_and_email_addresses)
+    return _get_template().generate(**context)
+
+
+def _add_email_addresses(
+    order_batches: Iterable[list[DetailedOrder]],
+) -> Iterator[tuple[DetailedOrder, str | None]]:
+    """Look up the orderers' email addresses, one batch at a time."""
+    for orders in order_batches:
+        orderer_ids = {order.placed_by.id for order in orders}
+        email_addresses_by_user_id = dict(
+            user_service.get_email_addresses(orderer_ids)
+        )
+
+        for order in orders:
+            yield order, email_addresses_by_user_id.get(order.placed_by.id)
+
+
+def _assemble_context(
+    orders_and_email_addresses: Iterable[tuple[DetailedOrder, str | None]],
+) -> dict[str, Any]:
+    """Assemble template context."""
     now = datetime.utcnow()
 
     return {
-        'order': order,
-        'email_address': email_address,
-        'line_items': order.line_items,
+        'orders': orders_and_email_addresses,
         'now': now,
         'format_export_amount': _format_export_amount,
-        'format_export_datetime': _format_export_datetime,
+        'format_export_datetime': _create_export_datetime_formatter(),
     }
 
 
@@ -62,19 +109,25 @@ def _format_export_amount(amount: Decimal) -> str:
     return f'{quantized:.2f}'
 
 
-def _format_export_datetime(dt: datetime) -> str:
-    """Format date and time as required by the export format specification."""
+def _create_export_datetime_formatter() -> Callable[[datetime], str]:
+    """Return a function that formats date and time as required by the
+    export format specification.
+    """
     export_tz = ZoneInfo(current_app.config['SHOP_ORDER_EXPORT_TIMEZONE'])
-    dt_utc = dt.replace(tzinfo=UTC)
-    dt_local = dt_utc.astimezone(export_tz)
-    return dt_local.isoformat()
+
+    def format_export_datetime(dt: datetime) -> str:
+        dt_utc = dt.replace(tzinfo=UTC)
+        dt_local = dt_utc.astimezone(export_tz)
+        return dt_local.isoformat()
+
+    return format_export_datetime
 
 
-def _render_template(context: dict[str, Any]) -> str:
-    """Load and render export template."""
+@cache
+def _get_template() -> Template:
+    """Load and compile the export template (once per process)."""
     path = 'services/shop/order/export/templates/export.xml'
     with current_app.open_resource(path, 'r') as f:
         source = f.read()
 
-    template = load_template(source)
-    return template.render(**context)
+    return load_template(source)
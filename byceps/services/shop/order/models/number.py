@@ -24,4 +24,12 @@ class OrderNumberSequence:
     value: int
 
 
+@dataclass(frozen=True)
+class OrderNumberBlock:
+    sequence_id: OrderNumberSequenceID
+    prefix: str
+    first_value: int
+    last_value: int
+
+
 OrderNumber = NewType('OrderNumber', str)
@@ -6,9 +6,11 @@ byceps.services.shop.order.order_checkout_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import defaultdict
 from collections.abc import Iterator
 from datetime import datetime
 
+from flask import current_app
 from sqlalchemy.exc import IntegrityError
 import structlog
 
@@ -17,6 +19,7 @@ from byceps.events.base import EventUser
 from byceps.events.shop import ShopOrderPlacedEvent
 from byceps.services.shop.cart.models import Cart
 from byceps.services.shop.product import product_service
+from byceps.services.shop.product.models import ProductID
 from byceps.services.shop.shop import shop_service
 from byceps.services.shop.storefront.models import Storefront
 from byceps.util.result import Err, Ok, Result
@@ -30,7 +33,7 @@ from . import (
 from .dbmodels.line_item import DbLineItem
 from .dbmodels.order import DbOrder
 from .models.checkout import IncomingLineItem, IncomingOrder
-from .models.number import OrderNumber
+from .models.number import OrderNumber, OrderNumberSequenceID
 from .models.order import Order, Orderer
 
 
@@ -44,21 +47,12 @@ def place_order(
     *,
     created_at: datetime | None = None,
 ) -> Result[tuple[Order, ShopOrderPlacedEvent], None]:
-    """Place an order for one or more products."""
-    shop = shop_service.get_shop(storefront.shop_id)
+    """Place an order for one or more products.
 
-    order_number_sequence = order_sequence_service.get_order_number_sequence(
-        storefront.order_number_sequence_id
-    )
-    order_number_generation_result = (
-        order_sequence_service.generate_order_number(order_number_sequence.id)
-    )
-    if order_number_generation_result.is_err():
-        error_message = order_number_generation_result.unwrap_err()
-        log.error('Order placement failed', error_message=error_message)
-        return Err(None)
-
-    order_number = order_number_generation_result.unwrap()
+    Product stock, order number, order, line items, and log entry are
+    all persisted in a single transaction.
+    """
+    shop = shop_service.get_shop_cached(storefront.shop_id)
 
     if created_at is None:
         created_at = datetime.utcnow()
@@ -73,6 +67,21 @@ def place_order(
 
     incoming_order, log_entry = place_order_result.unwrap()
 
+    _reduce_product_stock(incoming_order)
+
+    # Obtain the order number as late as possible to keep the
+    # sequence's row locked only briefly.
+    order_number_generation_result = _generate_order_number(
+        storefront.order_number_sequence_id
+    )
+    if order_number_generation_result.is_err():
+        error_message = order_number_generation_result.unwrap_err()
+        log.error('Order placement failed', error_message=error_message)
+        db.session.rollback()
+        return Err(None)
+
+    order_number = order_number_generation_result.unwrap()
+
     db_order = _build_db_order(incoming_order, order_number)
 
     db_line_items = list(
@@ -82,12 +91,14 @@ def place_order(
     db.session.add(db_order)
     db.session.add_all(db_line_items)
 
-    _reduce_product_stock(incoming_order)
-
     db_log_entry = order_log_service.to_db_entry(log_entry)
-    db.session.add(db_log_entry)
 
     try:
+        # The log entry is not related to the order via the ORM, so make
+        # sure the order is inserted first.
+        db.session.flush()
+        db.session.add(db_log_entry)
+
         db.session.commit()
     except IntegrityError as e:
         log.error('Order placement failed', order_number=order_number, exc=e)
@@ -111,6 +122,23 @@ def place_order(
     return Ok((order, event))
 
 
+def _generate_order_number(
+    sequence_id: OrderNumberSequenceID,
+) -> Result[OrderNumber, str]:
+    """Generate an order number, from a block of numbers reserved by this
+    process if configured.
+    """
+    block_size = current_app.config.get('SHOP_ORDER_NUMBER_BLOCK_SIZE', 1)
+    if block_size > 1:
+        return order_sequence_service.generate_order_number_from_reserved_block(
+            sequence_id, block_size
+        )
+    else:
+        return order_sequence_service.generate_order_number(
+            sequence_id, commit=False
+        )
+
+
 def _build_db_order(
     incoming_order: IncomingOrder, order_number: OrderNumber
 ) -> DbOrder:
@@ -158,7 +186,8 @@ def _build_db_line_items(
 
 def _reduce_product_stock(incoming_order: IncomingOrder) -> None:
     """Reduce product stock according to what is in the cart."""
+    quantities: defaultdict[ProductID, int] = defaultdict(int)
     for line_item in incoming_order.line_items:
-        product_service.decrease_quantity(
-            line_item.product_id, line_item.quantity, commit=False
-        )
+        quantities[line_item.product_id] += line_item.quantity
+
+    product_service.decrease_quantities(quantities, commit=False)
@@ -6,22 +6,48 @@ byceps.services.shop.order.order_sequence_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+
 from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+import structlog
 
 from byceps.database import db
 from byceps.services.shop.shop.models import ShopID
 from byceps.util.result import Err, Ok, Result
 from byceps.util.uuid import generate_uuid7
 
+from .dbmodels.number_block import DbOrderNumberBlock
 from .dbmodels.number_sequence import DbOrderNumberSequence
+from .dbmodels.order import DbOrder
 from .models.number import (
     OrderNumber,
+    OrderNumberBlock,
     OrderNumberSequence,
     OrderNumberSequenceID,
 )
 
 
+log = structlog.get_logger()
+
+
+@dataclass
+class _ReservedBlock:
+    block: OrderNumberBlock
+    next_value: int
+
+    def is_exhausted(self) -> bool:
+        return self.next_value > self.block.last_value
+
+
+# Order number blocks reserved by this process, by sequence
+_reserved_blocks: dict[OrderNumberSequenceID, _ReservedBlock] = {}
+_reserved_blocks_lock = Lock()
+
+
 def create_order_number_sequence(
     shop_id: ShopID, prefix: str, *, value: int = 0
 ) -> Result[OrderNumberSequence, None]:
@@ -45,9 +71,15 @@ def create_order_number_sequence(
 
 def delete_order_number_sequence(sequence_id: OrderNumberSequenceID) -> None:
     """Delete the order number sequence."""
+    db.session.execute(
+        delete(DbOrderNumberBlock).filter_by(sequence_id=sequence_id)
+    )
     db.session.execute(delete(DbOrderNumberSequence).filter_by(id=sequence_id))
     db.session.commit()
 
+    with _reserved_blocks_lock:
+        _reserved_blocks.pop(sequence_id, None)
+
 
 def get_order_number_sequence(
     sequence_id: OrderNumberSequenceID,
@@ -76,10 +108,13 @@ def get_order_number_sequences_for_shop(
 
 
 def generate_order_number(
-    sequence_id: OrderNumberSequenceID,
+    sequence_id: OrderNumberSequenceID, *, commit: bool = True
 ) -> Result[OrderNumber, str]:
     """Generate and reserve an unused, unique order number from this
     sequence.
+
+    Without committing, the sequence's row stays locked until the
+    caller's transaction ends.
     """
     row = db.session.execute(
         update(DbOrderNumberSequence)
@@ -87,17 +122,152 @@ def generate_order_number(
         .values(value=DbOrderNumberSequence.value + 1)
         .returning(DbOrderNumberSequence.prefix, DbOrderNumberSequence.value)
     ).one_or_none()
-    db.session.commit()
+
+    if commit:
+        db.session.commit()
 
     if row is None:
         return Err(f'No order number sequence found for ID "{sequence_id}".')
 
     prefix, value = row
-    order_number = OrderNumber(f'{prefix}{value:05d}')
+    order_number = _format_order_number(prefix, value)
+
+    return Ok(order_number)
+
+
+def generate_order_number_from_reserved_block(
+    sequence_id: OrderNumberSequenceID, block_size: int
+) -> Result[OrderNumber, str]:
+    """Hand out the next order number from the block of numbers this
+    process has reserved for the sequence.
+
+    A new block is reserved once the current one is used up, so only one
+    in `block_size` calls has to lock and update the sequence's row.
+
+    Numbers are unique, but orders placed through different processes
+    are not numbered in chronological order. Numbers left in a block
+    when the process ends are never handed out (see
+    `get_unused_order_numbers`).
+    """
+    with _reserved_blocks_lock:
+        reserved_block = _reserved_blocks.get(sequence_id)
+
+        if reserved_block is None or reserved_block.is_exhausted():
+            reservation_result = reserve_order_number_block(
+                sequence_id, block_size
+            )
+            if reservation_result.is_err():
+                return Err(reservation_result.unwrap_err())
+
+            block = reservation_result.unwrap()
+            reserved_block = _ReservedBlock(block, block.first_value)
+            _reserved_blocks[sequence_id] = reserved_block
+
+        value = reserved_block.next_value
+        reserved_block.next_value += 1
+
+    order_number = _format_order_number(reserved_block.block.prefix, value)
 
     return Ok(order_number)
 
 
+def reserve_order_number_block(
+    sequence_id: OrderNumberSequenceID, size: int
+) -> Result[OrderNumberBlock, str]:
+    """Reserve a block of consecutive, unused order numbers from this
+    sequence.
+    """
+    if size < 1:
+        raise ValueError('Order number block size must be at least 1.')
+
+    # Use a separate transaction to neither commit nor roll back what
+    # is pending in the caller's session.
+    with Session(db.engine) as session, session.begin():
+        row = session.execute(
+            update(DbOrderNumberSequence)
+            .filter_by(id=sequence_id)
+            .values(value=DbOrderNumberSequence.value + size)
+            .returning(
+                DbOrderNumberSequence.prefix, DbOrderNumberSequence.value
+            )
+        ).one_or_none()
+
+        if row is None:
+            return Err(
+                f'No order number sequence found for ID "{sequence_id}".'
+            )
+
+        prefix, last_value = row
+        first_value = last_value - size + 1
+
+        db_block = DbOrderNumberBlock(
+            generate_uuid7(),
+            sequence_id,
+            datetime.utcnow(),
+            first_value,
+            last_value,
+        )
+        session.add(db_block)
+
+    log.info(
+        'Order number block reserved',
+        sequence_id=str(sequence_id),
+        first_value=first_value,
+        last_value=last_value,
+    )
+
+    block = OrderNumberBlock(
+        sequence_id=sequence_id,
+        prefix=prefix,
+        first_value=first_value,
+        last_value=last_value,
+    )
+
+    return Ok(block)
+
+
+def get_unused_order_numbers(
+    sequence_id: OrderNumberSequenceID,
+) -> list[OrderNumber]:
+    """Return the numbers from reserved blocks of this sequence that have
+    not been assigned to an order, i.e. the gaps in the sequence.
+    """
+    sequence = get_order_number_sequence(sequence_id)
+
+    db_blocks = db.session.scalars(
+        select(DbOrderNumberBlock)
+        .filter_by(sequence_id=sequence_id)
+        .order_by(DbOrderNumberBlock.first_value)
+    ).all()
+
+    reserved_order_numbers = [
+        _format_order_number(sequence.prefix, value)
+        for db_block in db_blocks
+        for value in range(db_block.first_value, db_block.last_value + 1)
+    ]
+
+    if not reserved_order_numbers:
+        return []
+
+    used_order_numbers = set(
+        db.session.scalars(
+            select(DbOrder.order_number)
+            .filter_by(shop_id=sequence.shop_id)
+            .filter(DbOrder.order_number.in_(reserved_order_numbers))
+        ).all()
+    )
+
+    return [
+        order_number
+        for order_number in reserved_order_numbers
+        if order_number not in used_order_numbers
+    ]
+
+
+def _format_order_number(prefix: str, value: int) -> OrderNumber:
+    return OrderNumber(f'{prefix}{value:05d}')
+
+
 def _db_entity_to_order_number_sequence(
     db_sequence: DbOrderNumberSequence,
 ) -> OrderNumberSequence:
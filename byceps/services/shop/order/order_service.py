@@ -6,7 +6,7 @@ byceps.services.shop.order.order_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 
@@ -267,6 +267,63 @@ def get_orders(order_ids: frozenset[OrderID]) -> list[Order]:
     return _db_orders_to_transfer_objects_with_orderer_users(db_orders)
 
 
+def get_orders_with_details_for_shop_in_batches(
+    shop_id: ShopID,
+    *,
+    created_from: datetime | None = None,
+    created_before: datetime | None = None,
+    only_payment_state: PaymentState | None = None,
+    batch_size: int = 100,
+) -> Iterator[list[DetailedOrder]]:
+    """Yield the shop's orders, with details, in batches, ordered by
+    creation date.
+
+    Each batch is loaded with a fixed number of queries, regardless of
+    its size.
+    """
+    stmt = (
+        select(DbOrder.id)
+        .filter_by(shop_id=shop_id)
+        .order_by(DbOrder.created_at, DbOrder.id)
+    )
+
+    if created_from is not None:
+        stmt = stmt.filter(DbOrder.created_at >= created_from)
+
+    if created_before is not None:
+        stmt = stmt.filter(DbOrder.created_at < created_before)
+
+    if only_payment_state is not None:
+        stmt = stmt.filter_by(_payment_state=only_payment_state.name)
+
+    order_ids = db.session.scalars(stmt).all()
+
+    for i in range(0, len(order_ids), batch_size):
+        batch_order_ids = order_ids[i : i + batch_size]
+        yield _get_orders_with_details(batch_order_ids)
+
+
+def _get_orders_with_details(
+    order_ids: Sequence[OrderID],
+) -> list[DetailedOrder]:
+    db_orders = db.session.scalars(
+        select(DbOrder)
+        .options(db.selectinload(DbOrder.line_items))
+        .filter(DbOrder.id.in_(order_ids))
+        .order_by(DbOrder.created_at, DbOrder.id)
+    ).all()
+
+    orderer_ids = {db_order.placed_by_id for db_order in db_orders}
+    orderers_by_id = user_service.get_users_indexed_by_id(
+        orderer_ids, include_avatars=True
+    )
+
+    return [
+        to_detailed_order(db_order, orderers_by_id[db_order.placed_by_id])
+        for db_order in db_orders
+    ]
+
+
 def get_orders_for_shop_paginated(
     shop_id: ShopID,
     page: int,
@@ -128,13 +128,12 @@ def get_product_quantity(product_number: ProductNumber, order: Order) -> int:
     return product_line_item.quantity
 
 
-def export_sold_products_as_csv(report: SoldProductsReport) -> str:
+def export_sold_products_as_csv(report: SoldProductsReport) -> Iterator[str]:
     header_row = _assemble_csv_header_row(report)
     data_rows = _assemble_csv_data_rows(report)
     all_rows = [header_row] + data_rows
 
-    lines = serialize_tuples_to_csv(all_rows)
-    return ''.join(lines)
+    return serialize_tuples_to_csv(all_rows)
 
 
 def _assemble_csv_header_row(report: SoldProductsReport) -> CsvRow:
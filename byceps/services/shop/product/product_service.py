@@ -11,7 +11,7 @@ from datetime import datetime
 from decimal import Decimal
 
 from moneyed import Money
-from sqlalchemy import delete, select, update
+from sqlalchemy import case, delete, select, update
 from sqlalchemy.sql import Select
 
 from byceps.database import db, paginate, Pagination
@@ -299,6 +299,40 @@ def decrease_quantity(
         db.session.commit()
 
 
+def decrease_quantities(
+    quantities_to_decrease_by: dict[ProductID, int], *, commit: bool = True
+) -> None:
+    """Decrease the quantities of multiple products by the given values
+    in a single statement.
+
+    The products' rows are locked in order of their IDs so that
+    concurrent calls for overlapping sets of products cannot deadlock.
+    """
+    if not quantities_to_decrease_by:
+        return
+
+    locked_products = (
+        select(DbProduct.id)
+        .filter(DbProduct.id.in_(quantities_to_decrease_by.keys()))
+        .order_by(DbProduct.id)
+        .with_for_update()
+        .cte('locked_products')
+    )
+
+    quantity_to_decrease_by = case(
+        quantities_to_decrease_by, value=DbProduct.id
+    )
+
+    db.session.execute(
+        update(DbProduct)
+        .where(DbProduct.id == locked_products.c.id)
+        .values(quantity=DbProduct.quantity - quantity_to_decrease_by)
+    )
+
+    if commit:
+        db.session.commit()
+
+
 def delete_product(product_id: ProductID) -> None:
     """Delete a product."""
     db.session.execute(delete(DbProduct).filter_by(id=product_id))
@@ -6,11 +6,14 @@ byceps.services.shop.shop.shop_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from datetime import timedelta
+
 from moneyed import Currency
 from sqlalchemy import delete, select
 
 from byceps.database import db
 from byceps.services.brand.models import Brand, BrandID
+from byceps.util.cache import TtlCache
 
 from .dbmodels import DbShop
 from .models import Shop, ShopID
@@ -20,6 +23,9 @@ class UnknownShopIdError(ValueError):
     pass
 
 
+_shop_cache: TtlCache[ShopID, Shop] = TtlCache(timedelta(minutes=5))
+
+
 def create_shop(brand: Brand, currency: Currency) -> Shop:
     """Create a shop."""
     shop_id = ShopID(brand.id)
@@ -37,6 +43,8 @@ def delete_shop(shop_id: ShopID) -> None:
     db.session.execute(delete(DbShop).where(DbShop.id == shop_id))
     db.session.commit()
 
+    _shop_cache.delete(shop_id)
+
 
 def find_shop_for_brand(brand_id: BrandID) -> Shop | None:
     """Return the shop for that brand, or `None` if not found."""
@@ -77,6 +85,16 @@ def get_shop(shop_id: ShopID) -> Shop:
     return shop
 
 
+def get_shop_cached(shop_id: ShopID) -> Shop:
+    """Return the shop with that id, or raise an exception.
+
+    The shop is served from a short-lived, process-local cache if
+    possible. Meant for hot paths (like placing orders) that only need
+    the shop's rarely changing attributes.
+    """
+    return _shop_cache.get_or_set(shop_id, lambda: get_shop(shop_id))
+
+
 def _get_db_shop(shop_id: ShopID) -> DbShop:
     """Return the database entity for the shop with that id.
 
@@ -122,6 +140,8 @@ def set_extra_setting(shop_id: ShopID, key: str, value: str) -> None:
 
     db.session.commit()
 
+    _shop_cache.delete(shop_id)
+
 
 def remove_extra_setting(shop_id: ShopID, key: str) -> None:
     """Remove the entry with that key from the shop's extra settings."""
@@ -134,6 +154,8 @@ def remove_extra_setting(shop_id: ShopID, key: str) -> None:
 
     db.session.commit()
 
+    _shop_cache.delete(shop_id)
+
 
 def _db_entity_to_shop(db_shop: DbShop) -> Shop:
     settings = (
@@ -8,6 +8,7 @@ byceps.services.site.site_service
 
 from collections.abc import Callable
 import dataclasses
+from datetime import timedelta
 
 from sqlalchemy import delete, select
 
@@ -19,6 +20,7 @@ from byceps.services.news import news_channel_service
 from byceps.services.news.models import NewsChannelID
 from byceps.services.party.models import PartyID
 from byceps.services.shop.storefront.models import StorefrontID
+from byceps.util.cache import TtlCache
 
 from .dbmodels import DbSite, DbSiteSetting
 from .models import Site, SiteID, SiteWithBrand
@@ -28,6 +30,10 @@ class UnknownSiteIdError(Exception):
     pass
 
 
+# Sites, looked up on every request to a site application
+_site_cache: TtlCache[SiteID, Site] = TtlCache(timedelta(minutes=1))
+
+
 def create_site(
     site_id: SiteID,
     title: str,
@@ -96,6 +102,8 @@ def update_site(
 
     db.session.commit()
 
+    _site_cache.delete(site_id)
+
     return _db_entity_to_site(db_site)
 
 
@@ -105,6 +113,8 @@ def delete_site(site_id: SiteID) -> None:
     db.session.execute(delete(DbSite).filter_by(id=site_id))
     db.session.commit()
 
+    _site_cache.delete(site_id)
+
 
 def _find_db_site(site_id: SiteID) -> DbSite | None:
     return db.session.get(DbSite, site_id)
@@ -135,6 +145,15 @@ def get_site(site_id: SiteID) -> Site:
     return _db_entity_to_site(db_site)
 
 
+def get_site_cached(site_id: SiteID) -> Site:
+    """Return the site with that ID.
+
+    The site is served from a short-lived, process-local cache if
+    possible.
+    """
+    return _site_cache.get_or_set(site_id, lambda: get_site(site_id))
+
+
 def get_all_sites() -> set[Site]:
     """Return all sites."""
     db_sites = db.session.scalars(select(DbSite)).all()
@@ -250,6 +269,8 @@ def add_news_channel(site_id: SiteID, news_channel_id: NewsChannelID) -> None:
     db_site.news_channels.append(news_channel)
     db.session.commit()
 
+    _site_cache.delete(site_id)
+
 
 def remove_news_channel(
     site_id: SiteID, news_channel_id: NewsChannelID
@@ -263,3 +284,5 @@ def remove_news_channel(
 
     db_site.news_channels.remove(news_channel)
     db.session.commit()
+
+    _site_cache.delete(site_id)
@@ -0,0 +1,98 @@
+"""
+byceps.services.text_markup.rendered_html_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cache of texts rendered as HTML, stored in Redis
+
+Entries are keyed by renderer version, locale (quotes contain
+translated text), and a hash of the text. Thus an entry never has to be
+invalidated; edited texts just map to different entries, and unused
+ones expire.
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Sequence
+from datetime import timedelta
+from hashlib import sha256
+
+from flask import current_app
+
+from byceps.util.l10n import get_locale_str
+
+from . import text_markup_service
+
+
+# Increment whenever the rendered output changes (e.g. new formatters or
+# smileys) so that stale renderings are no longer used.
+RENDERER_VERSION = 1
+
+_CACHE_TTL = timedelta(days=30)
+_KEY_PREFIX = 'text_markup:html:'
+
+
+def get_html(text: str) -> str:
+    """Return the text rendered as HTML.
+
+    Render and cache it if it is not cached yet.
+    """
+    return get_htmls([text])[0]
+
+
+def get_htmls(texts: Sequence[str]) -> list[str]:
+    """Return the texts rendered as HTML, in the same order.
+
+    Cached renderings are fetched in one go. Only texts not cached yet
+    are rendered (and then cached).
+    """
+    if not texts:
+        return []
+
+    keys = [_get_key(text) for text in texts]
+
+    # Keep entries in use from expiring.
+    pipeline = current_app.redis_client.pipeline()
+    for key in keys:
+        pipeline.getex(key, ex=_CACHE_TTL)
+    cached_values = pipeline.execute()
+
+    htmls = []
+    htmls_to_store = {}
+
+    for text, key, cached_value in zip(texts, keys, cached_values, strict=True):
+        if cached_value is not None:
+            html = cached_value.decode()
+        else:
+            html = text_markup_service.render_html(text)
+            htmls_to_store[key] = html
+
+        htmls.append(html)
+
+    if htmls_to_store:
+        _store(htmls_to_store)
+
+    return htmls
+
+
+def populate(text: str) -> None:
+    """Render the text as HTML and cache the result.
+
+    Intended to be called when a text is created or edited so that it
+    does not have to be rendered when it is displayed.
+    """
+    html = text_markup_service.render_html(text)
+    _store({_get_key(text): html})
+
+
+def _store(htmls_by_key: dict[str, str]) -> None:
+    pipeline = current_app.redis_client.pipeline()
+    for key, html in htmls_by_key.items():
+        pipeline.set(key, html, ex=_CACHE_TTL)
+    pipeline.execute()
+
+
+def _get_key(text: str) -> str:
+    locale = get_locale_str() or ''
+    text_hash = sha256(text.encode()).hexdigest()
+    return f'{_KEY_PREFIX}v{RENDERER_VERSION}:{locale}:{text_hash}'
@@ -0,0 +1,59 @@
+"""
+byceps.services.ticketing.dbmodels.attendance_count
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from byceps.database import db
+from byceps.services.brand.models import BrandID
+from byceps.services.user.models.user import UserID
+from byceps.util.instances import ReprBuilder
+
+
+class DbBrandAttendanceCount(db.Model):
+    """The number of a brand's parties a user has attended.
+
+    Both parties attended with a ticket and archived attendances are
+    counted (each party just once).
+
+    This is derived data, kept up to date as tickets are assigned to
+    users or revoked and as archived attendances are created or
+    deleted.
+    """
+
+    __tablename__ = 'user_brand_attendance_counts'
+    __table_args__ = (
+        db.Index(
+            'ix_user_brand_attendance_counts_brand_id_attendance_count',
+            'brand_id',
+            'attendance_count',
+        ),
+    )
+
+    brand_id: Mapped[BrandID] = mapped_column(
+        db.UnicodeText, db.ForeignKey('brands.id'), primary_key=True
+    )
+    user_id: Mapped[UserID] = mapped_column(
+        db.Uuid, db.ForeignKey('users.id'), primary_key=True
+    )
+    attendance_count: Mapped[int]
+
+    def __init__(
+        self, brand_id: BrandID, user_id: UserID, attendance_count: int
+    ) -> None:
+        self.brand_id = brand_id
+        self.user_id = user_id
+        self.attendance_count = attendance_count
+
+    def __repr__(self) -> str:
+        return (
+            ReprBuilder(self)
+            .add('brand_id', self.brand_id)
+            .add('user_id', str(self.user_id))
+            .add('attendance_count', self.attendance_count)
+            .build()
+        )
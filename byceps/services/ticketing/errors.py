@@ -23,6 +23,20 @@ class TicketBelongsToDifferentPartyError(TicketingError):
     """
 
 
+@dataclass(frozen=True)
+class TicketCodeGenerationFailedError(TicketingError):
+    """Indicate that the requested number of distinct ticket codes
+    could not be generated.
+    """
+
+
+@dataclass(frozen=True)
+class TicketCodesInUseError(TicketCodeGenerationFailedError):
+    """Indicate that ticket code generation failed because the generated
+    codes are already in use by other tickets of the party.
+    """
+
+
 @dataclass(frozen=True)
 class TicketIsRevokedError(TicketingError):
     """Indicate an error caused by the ticket being revoked."""
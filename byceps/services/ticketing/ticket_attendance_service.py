@@ -6,14 +6,14 @@ byceps.services.ticketing.ticket_attendance_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections import Counter
-from collections.abc import Sequence
+from collections.abc import Iterable
 from datetime import datetime
 from itertools import chain
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, literal, select, union
+from sqlalchemy.dialects.postgresql import insert
 
-from byceps.database import db, insert_ignore_on_conflict
+from byceps.database import db
 from byceps.services.brand.models import BrandID
 from byceps.services.party import party_service
 from byceps.services.party.dbmodels import DbParty
@@ -21,6 +21,7 @@ from byceps.services.party.models import Party, PartyID
 from byceps.services.user.models.user import UserID
 
 from .dbmodels.archived_attendance import DbArchivedAttendance
+from .dbmodels.attendance_count import DbBrandAttendanceCount
 from .dbmodels.category import DbTicketCategory
 from .dbmodels.ticket import DbTicket
 
@@ -29,12 +30,15 @@ def create_archived_attendance(user_id: UserID, party_id: PartyID) -> None:
     """Create an archived attendance of the user at the party."""
     table = DbArchivedAttendance.__table__
 
-    values = {
-        'user_id': str(user_id),
-        'party_id': str(party_id),
-    }
+    db.session.execute(
+        insert(table)
+        .values(user_id=str(user_id), party_id=str(party_id))
+        .on_conflict_do_nothing(constraint=table.primary_key)
+    )
+
+    update_attendance_counts(party_id, {user_id})
 
-    insert_ignore_on_conflict(table, values)
+    db.session.commit()
 
 
 def delete_archived_attendance(user_id: UserID, party_id: PartyID) -> None:
@@ -44,6 +48,9 @@ def delete_archived_attendance(user_id: UserID, party_id: PartyID) -> None:
             user_id=user_id, party_id=party_id
         )
     )
+
+    update_attendance_counts(party_id, {user_id})
+
     db.session.commit()
 
 
@@ -128,90 +135,136 @@ def get_top_attendees_for_brand(brand_id: BrandID) -> list[tuple[UserID, int]]:
     """Return the attendees with the highest number of parties of this
     brand visited.
     """
-    top_ticket_attendance_counts = _get_top_ticket_attendees_for_parties(
-        brand_id
-    )
+    # Select top attendees with more than one attendance.
+    rows = db.session.execute(
+        select(
+            DbBrandAttendanceCount.user_id,
+            DbBrandAttendanceCount.attendance_count,
+        )
+        .filter_by(brand_id=brand_id)
+        .filter(DbBrandAttendanceCount.attendance_count > 1)
+        .order_by(DbBrandAttendanceCount.attendance_count.desc())
+        .limit(50)
+    ).tuples()
 
-    top_archived_attendance_counts = _get_top_archived_attendees_for_parties(
-        brand_id
-    )
+    return list(rows)
 
-    top_attendance_counts = _merge_top_attendance_counts(
-        [top_ticket_attendance_counts, top_archived_attendance_counts]
-    )
 
-    # Select top attendees with more than one attendance.
-    top_attendees = top_attendance_counts.most_common(50)
-    top_attendees = [
-        (user_id, attendance_count)
-        for user_id, attendance_count in top_attendees
-        if attendance_count > 1
-    ]
+def update_attendance_counts(
+    party_id: PartyID, user_ids: Iterable[UserID | None]
+) -> None:
+    """Recalculate the users' numbers of attended parties of the party's
+    brand, but do not commit.
+
+    To be called whenever the users' attendance of the party changes.
+    `None` values (i.e. tickets without user) are ignored.
+    """
+    actual_user_ids = {user_id for user_id in user_ids if user_id is not None}
+    if not actual_user_ids:
+        return
+
+    brand_id = party_service.get_party_cached(party_id).brand_id
 
-    return top_attendees
+    _recalculate_attendance_counts(brand_id, actual_user_ids)
 
 
-def _get_top_ticket_attendees_for_parties(
-    brand_id: BrandID,
-) -> Sequence[tuple[UserID, int]]:
-    user_id_column = db.aliased(DbTicket).used_by_id
+def recalculate_attendance_counts_for_brand(brand_id: BrandID) -> None:
+    """Recalculate the numbers of attended parties of the brand for all
+    users.
+    """
+    _recalculate_attendance_counts(brand_id, None)
+    db.session.commit()
+
 
-    attendance_count = (
+def _recalculate_attendance_counts(
+    brand_id: BrandID, user_ids: set[UserID] | None
+) -> None:
+    _lock_attendance_counts(brand_id, user_ids)
+
+    ticket_attendances_stmt = (
         select(
-            db.func.count(DbTicketCategory.party_id.distinct()),
+            DbTicket.used_by_id.label('user_id'),
+            DbTicket.party_id.label('party_id'),
         )
         .join(DbParty)
         .filter(DbParty.brand_id == brand_id)
-        .join(DbTicket)
         .filter(DbTicket.revoked == False)  # noqa: E712
-        .filter(DbTicket.used_by_id == user_id_column)
-        .scalar_subquery()
+        .filter(DbTicket.used_by_id.is_not(None))
     )
 
-    return (
-        db.session.execute(
-            select(
-                user_id_column.distinct(),
-                attendance_count,
-            )
-            .filter(user_id_column.is_not(None))
-            .filter(attendance_count > 0)
-            .order_by(attendance_count.desc())
-        )
-        .tuples()
-        .all()
+    archived_attendances_stmt = (
+        select(DbArchivedAttendance.user_id, DbArchivedAttendance.party_id)
+        .join(DbParty)
+        .filter(DbParty.brand_id == brand_id)
     )
 
+    delete_stmt = delete(DbBrandAttendanceCount).filter_by(brand_id=brand_id)
+
+    if user_ids is not None:
+        ticket_attendances_stmt = ticket_attendances_stmt.filter(
+            DbTicket.used_by_id.in_(user_ids)
+        )
+        archived_attendances_stmt = archived_attendances_stmt.filter(
+            DbArchivedAttendance.user_id.in_(user_ids)
+        )
+        delete_stmt = delete_stmt.filter(
+            DbBrandAttendanceCount.user_id.in_(user_ids)
+        )
+
+    # Unlike `UNION ALL`, `UNION` removes duplicates, so each party is
+    # only counted once per user.
+    attendances = union(
+        ticket_attendances_stmt, archived_attendances_stmt
+    ).subquery()
 
-def _get_top_archived_attendees_for_parties(
-    brand_id: BrandID,
-) -> Sequence[tuple[UserID, int]]:
-    attendance_count_column = db.func.count(DbArchivedAttendance.user_id).label(
-        'attendance_count'
+    # Upsert (instead of delete and insert) so that concurrent
+    # transactions updating the same user's count do not conflict.
+    upsert_stmt = insert(DbBrandAttendanceCount).from_select(
+        ['brand_id', 'user_id', 'attendance_count'],
+        select(
+            literal(brand_id, db.UnicodeText),
+            attendances.c.user_id,
+            db.func.count(),
+        ).group_by(attendances.c.user_id),
+    )
+    upsert_stmt = upsert_stmt.on_conflict_do_update(
+        index_elements=['brand_id', 'user_id'],
+        set_={'attendance_count': upsert_stmt.excluded.attendance_count},
     )
+    db.session.execute(upsert_stmt)
 
-    return (
-        db.session.execute(
-            select(
-                DbArchivedAttendance.user_id,
-                attendance_count_column,
-            )
-            .join(DbParty)
-            .filter(DbParty.brand_id == brand_id)
-            .group_by(DbArchivedAttendance.user_id)
-            .order_by(attendance_count_column.desc())
+    # Remove the counts of users who no longer attended any party.
+    db.session.execute(
+        delete_stmt.filter(
+            DbBrandAttendanceCount.user_id.not_in(select(attendances.c.user_id))
         )
-        .tuples()
-        .all()
     )
 
 
-def _merge_top_attendance_counts(
-    xs: list[Sequence[tuple[UserID, int]]],
-) -> Counter[UserID]:
-    counter: Counter = Counter()
+def _lock_attendance_counts(
+    brand_id: BrandID, user_ids: set[UserID] | None
+) -> None:
+    """Serialize recalculations of the same attendance counts until the
+    end of the transaction.
+
+    Otherwise, concurrent recalculations could each count attendances
+    without seeing the other's changes, and the last one to write would
+    store an outdated count.
 
-    for x in xs:
-        counter.update(dict(x))
+    A recalculation for the whole brand locks the brand exclusively,
+    one for certain users locks it shared and then each user (in a
+    fixed order, to avoid deadlocks).
+    """
+    brand_key = db.func.hashtext(f'ticket_attendance_counts:{brand_id}')
+
+    if user_ids is None:
+        db.session.execute(select(db.func.pg_advisory_xact_lock(brand_key)))
+        return
+
+    db.session.execute(select(db.func.pg_advisory_xact_lock_shared(brand_key)))
 
-    return counter
+    for user_id in sorted(user_ids):
+        user_key = db.func.hashtext(str(user_id))
+        db.session.execute(
+            select(db.func.pg_advisory_xact_lock(brand_key, user_key))
+        )
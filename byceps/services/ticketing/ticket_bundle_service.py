@@ -19,6 +19,7 @@ from byceps.services.shop.order.models.number import OrderNumber
 from byceps.services.user.models.user import User
 from byceps.util.uuid import generate_uuid7
 
+from . import ticket_attendance_service
 from .dbmodels.category import DbTicketCategory
 from .dbmodels.ticket import DbTicket
 from .dbmodels.ticket_bundle import DbTicketBundle
@@ -70,6 +71,11 @@ def create_bundle(
     )
     db.session.add_all(db_tickets)
 
+    if user is not None:
+        ticket_attendance_service.update_attendance_counts(
+            category.party_id, {user.id}
+        )
+
     db.session.commit()
 
     ticket_ids = {db_ticket.id for db_ticket in db_tickets}
@@ -123,15 +129,26 @@ def revoke_bundle(
         )
         db.session.add(db_log_entry)
 
+    ticket_attendance_service.update_attendance_counts(
+        db_bundle.party_id,
+        {db_ticket.used_by_id for db_ticket in db_bundle.tickets},
+    )
+
     db.session.commit()
 
 
 def delete_bundle(bundle_id: TicketBundleID) -> None:
     """Delete a bundle and the tickets assigned to it."""
     db_bundle = get_bundle(bundle_id)
+    user_ids = {db_ticket.used_by_id for db_ticket in db_bundle.tickets}
 
     db.session.execute(delete(DbTicket).filter_by(bundle_id=db_bundle.id))
     db.session.execute(delete(DbTicketBundle).filter_by(id=db_bundle.id))
+
+    ticket_attendance_service.update_attendance_counts(
+        db_bundle.party_id, user_ids
+    )
+
     db.session.commit()
 
 
@@ -9,19 +9,80 @@ byceps.services.ticketing.ticket_code_service
 from random import sample
 from string import ascii_uppercase, digits
 
+from sqlalchemy import select
+
+from byceps.database import db
+from byceps.services.party.models import PartyID
 from byceps.util.result import Err, Ok, Result
 
+from .dbmodels.ticket import DbTicket
+from .errors import TicketCodeGenerationFailedError, TicketCodesInUseError
 from .models.ticket import TicketCode
 
 
+def generate_ticket_codes_for_party(
+    party_id: PartyID, requested_quantity: int, *, max_rounds: int = 4
+) -> Result[set[TicketCode], TicketCodeGenerationFailedError]:
+    """Generate a number of ticket codes that are not yet in use by any
+    of the party's tickets.
+
+    Each round checks all candidate codes against the existing tickets
+    with a single query and replaces those already in use in the next
+    round.
+    """
+    codes: set[TicketCode] = set()
+
+    for _ in range(max_rounds):
+        missing_quantity = requested_quantity - len(codes)
+
+        generation_result = generate_ticket_codes(
+            missing_quantity, excluded_codes=codes
+        )
+        if generation_result.is_err():
+            return Err(
+                TicketCodeGenerationFailedError(generation_result.unwrap_err())
+            )
+
+        candidate_codes = generation_result.unwrap()
+
+        codes_in_use = _find_codes_in_use(party_id, candidate_codes)
+        codes.update(candidate_codes - codes_in_use)
+
+        if len(codes) == requested_quantity:
+            return Ok(codes)
+
+    return Err(
+        TicketCodesInUseError(
+            f'Could not generate {requested_quantity} ticket code(s) '
+            f'not yet in use after {max_rounds} rounds.'
+        )
+    )
+
+
+def _find_codes_in_use(
+    party_id: PartyID, codes: set[TicketCode]
+) -> set[TicketCode]:
+    """Return those of the codes that are in use by the party's tickets."""
+    codes_in_use = db.session.scalars(
+        select(DbTicket.code)
+        .filter_by(party_id=party_id)
+        .filter(DbTicket.code.in_(codes))
+    ).all()
+
+    return {TicketCode(code) for code in codes_in_use}
+
+
 def generate_ticket_codes(
-    requested_quantity: int,
+    requested_quantity: int, *, excluded_codes: set[TicketCode] | None = None
 ) -> Result[set[TicketCode], str]:
     """Generate a number of ticket codes."""
+    if excluded_codes is None:
+        excluded_codes = set()
+
     codes: set[TicketCode] = set()
 
     for _ in range(requested_quantity):
-        generation_result = _generate_ticket_code_not_in(codes)
+        generation_result = _generate_ticket_code_not_in(codes, excluded_codes)
 
         if generation_result.is_err():
             return Err(generation_result.unwrap_err())
@@ -41,12 +102,15 @@ def generate_ticket_codes(
 
 
 def _generate_ticket_code_not_in(
-    codes: set[TicketCode], *, max_attempts: int = 4
+    codes: set[TicketCode],
+    excluded_codes: set[TicketCode],
+    *,
+    max_attempts: int = 4,
 ) -> Result[TicketCode, str]:
-    """Generate ticket codes and return the first one not in the set."""
+    """Generate ticket codes and return the first one in neither set."""
     for _ in range(max_attempts):
         code = _generate_ticket_code()
-        if code not in codes:
+        if code not in codes and code not in excluded_codes:
             return Ok(code)
 
     return Err(
@@ -16,10 +16,12 @@ from byceps.database import db
 from byceps.services.shop.order.models.number import OrderNumber
 from byceps.services.ticketing.models.ticket import TicketID
 from byceps.services.user.models.user import User
+from byceps.util.result import Err
 from byceps.util.uuid import generate_uuid7
 
-from . import ticket_code_service
+from . import ticket_attendance_service, ticket_code_service
 from .dbmodels.ticket import DbTicket
+from .errors import TicketCodesInUseError
 from .models.ticket import TicketBundleID, TicketCategory
 
 
@@ -73,6 +75,13 @@ def create_tickets(
     db.session.add_all(db_tickets)
 
     try:
+        db.session.flush()
+
+        if user is not None:
+            ticket_attendance_service.update_attendance_counts(
+                category.party_id, {user.id}
+            )
+
         db.session.commit()
     except IntegrityError as exc:
         db.session.rollback()
@@ -95,10 +104,15 @@ def build_tickets(
 
     created_at = datetime.utcnow()
 
-    generation_result = ticket_code_service.generate_ticket_codes(quantity)
+    generation_result = ticket_code_service.generate_ticket_codes_for_party(
+        category.party_id, quantity
+    )
 
-    if generation_result.is_err():
-        raise TicketCreationFailedError(generation_result.unwrap_err())
+    match generation_result:
+        case Err(TicketCodesInUseError() as error):
+            raise TicketCreationFailedWithConflictError(error.message)
+        case Err(error):
+            raise TicketCreationFailedError(error.message)
 
     codes = generation_result.unwrap()
 
@@ -0,0 +1,95 @@
+"""
+byceps.services.ticketing.ticket_export_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterator
+from itertools import chain
+
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+
+from byceps.database import db
+from byceps.services.party.models import PartyID
+from byceps.services.seating.dbmodels.seat import DbSeat
+from byceps.services.user.dbmodels.user import DbUser
+from byceps.util.export import serialize_tuples_to_csv
+
+from .dbmodels.category import DbTicketCategory
+from .dbmodels.ticket import DbTicket
+
+
+_FETCH_CHUNK_SIZE = 1000
+
+
+def export_tickets_for_party_as_csv(party_id: PartyID) -> Iterator[str]:
+    """Export the party's tickets, including their owners, users, and
+    seats, as CSV.
+
+    Tickets are fetched in chunks (using a server-side cursor) as the
+    CSV is consumed.
+    """
+    header_row = (
+        'code',
+        'category',
+        'owner',
+        'user',
+        'seat',
+        'revoked',
+        'user_checked_in',
+    )
+
+    rows = _get_ticket_rows(party_id)
+
+    return serialize_tuples_to_csv(chain([header_row], rows))
+
+
+def _get_ticket_rows(party_id: PartyID) -> Iterator[tuple[str, ...]]:
+    owner = aliased(DbUser)
+    user = aliased(DbUser)
+
+    rows = db.session.execute(
+        select(
+            DbTicket.code,
+            DbTicketCategory.title,
+            owner.screen_name,
+            user.screen_name,
+            DbSeat.label,
+            DbTicket.revoked,
+            DbTicket.user_checked_in,
+        )
+        .select_from(DbTicket)
+        .join(DbTicketCategory, DbTicket.category_id == DbTicketCategory.id)
+        .join(owner, DbTicket.owned_by_id == owner.id)
+        .outerjoin(user, DbTicket.used_by_id == user.id)
+        .outerjoin(DbSeat, DbTicket.occupied_seat_id == DbSeat.id)
+        .filter(DbTicket.party_id == party_id)
+        .order_by(DbTicket.created_at, DbTicket.code)
+        .execution_options(yield_per=_FETCH_CHUNK_SIZE)
+    )
+
+    for (
+        code,
+        category_title,
+        owner_screen_name,
+        user_screen_name,
+        seat_label,
+        revoked,
+        user_checked_in,
+    ) in rows:
+        yield (
+            code,
+            category_title,
+            owner_screen_name or '',
+            user_screen_name or '',
+            seat_label or '',
+            _format_bool(revoked),
+            _format_bool(user_checked_in),
+        )
+
+
+def _format_bool(value: bool) -> str:
+    return 'yes' if value else 'no'
@@ -6,11 +6,20 @@ byceps.services.ticketing.ticket_revocation_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import defaultdict
+from collections.abc import Iterable
+
 from byceps.database import db
 from byceps.services.user.models.user import UserID
 
-from . import ticket_log_service, ticket_seat_management_service, ticket_service
+from . import (
+    ticket_attendance_service,
+    ticket_log_service,
+    ticket_seat_management_service,
+    ticket_service,
+)
 from .dbmodels.log import DbTicketLogEntry
+from .dbmodels.ticket import DbTicket
 from .models.ticket import TicketID
 
 
@@ -28,6 +37,10 @@ def revoke_ticket(
 
     db_ticket.revoked = True
 
+    ticket_attendance_service.update_attendance_counts(
+        db_ticket.party_id, {db_ticket.used_by_id}
+    )
+
     db_log_entry = build_ticket_revoked_log_entry(
         db_ticket.id, initiator_id, reason
     )
@@ -60,9 +73,21 @@ def revoke_tickets(
         )
         db.session.add(db_log_entry)
 
+    _update_attendance_counts(db_tickets)
+
     db.session.commit()
 
 
+def _update_attendance_counts(db_tickets: Iterable[DbTicket]) -> None:
+    """Update the attendance counts of the tickets' users."""
+    user_ids_by_party_id = defaultdict(set)
+    for db_ticket in db_tickets:
+        user_ids_by_party_id[db_ticket.party_id].add(db_ticket.used_by_id)
+
+    for party_id, user_ids in user_ids_by_party_id.items():
+        ticket_attendance_service.update_attendance_counts(party_id, user_ids)
+
+
 def build_ticket_revoked_log_entry(
     ticket_id: TicketID, initiator_id: UserID, reason: str | None = None
 ) -> DbTicketLogEntry:
@@ -19,7 +19,11 @@ from byceps.services.shop.order.models.number import OrderNumber
 from byceps.services.user.dbmodels.user import DbUser
 from byceps.services.user.models.user import UserID
 
-from . import ticket_code_service, ticket_log_service
+from . import (
+    ticket_attendance_service,
+    ticket_code_service,
+    ticket_log_service,
+)
 from .dbmodels.category import DbTicketCategory
 from .dbmodels.log import DbTicketLogEntry
 from .dbmodels.ticket import DbTicket
@@ -60,8 +64,18 @@ def update_ticket_code(
 
 def delete_ticket(ticket_id: TicketID) -> None:
     """Delete a ticket and its log entries."""
+    db_ticket = find_ticket(ticket_id)
+    if db_ticket is None:
+        return
+
+    party_id = db_ticket.party_id
+    user_id = db_ticket.used_by_id
+
     db.session.execute(delete(DbTicketLogEntry).filter_by(ticket_id=ticket_id))
     db.session.execute(delete(DbTicket).filter_by(id=ticket_id))
+
+    ticket_attendance_service.update_attendance_counts(party_id, {user_id})
+
     db.session.commit()
 
 
@@ -11,7 +11,7 @@ from byceps.services.user import user_service
 from byceps.services.user.models.user import UserID
 from byceps.util.result import Err, Ok, Result
 
-from . import ticket_log_service, ticket_service
+from . import ticket_attendance_service, ticket_log_service, ticket_service
 from .errors import (
     TicketingError,
     TicketIsRevokedError,
@@ -106,8 +106,14 @@ def appoint_user(
             )
         )
 
+    previous_user_id = db_ticket.used_by_id
+
     db_ticket.used_by_id = user_id
 
+    ticket_attendance_service.update_attendance_counts(
+        db_ticket.party_id, {user_id, previous_user_id}
+    )
+
     db_log_entry = ticket_log_service.build_db_entry(
         'user-appointed',
         db_ticket.id,
@@ -141,8 +147,14 @@ def withdraw_user(
             )
         )
 
+    previous_user_id = db_ticket.used_by_id
+
     db_ticket.used_by_id = None
 
+    ticket_attendance_service.update_attendance_counts(
+        db_ticket.party_id, {previous_user_id}
+    )
+
     db_log_entry = ticket_log_service.build_db_entry(
         'user-withdrawn',
         db_ticket.id,
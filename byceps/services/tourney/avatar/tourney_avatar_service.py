@@ -16,6 +16,7 @@ from byceps.services.user.models.user import User
 from byceps.util import upload
 from byceps.util.image import create_thumbnail
 from byceps.util.image.models import Dimensions, ImageType
+from byceps.util.jobqueue import enqueue
 from byceps.util.result import Err, Ok, Result
 
 from .dbmodels import DbTourneyAvatar
@@ -23,6 +24,9 @@ from .dbmodels import DbTourneyAvatar
 
 MAXIMUM_DIMENSIONS = Dimensions(512, 512)
 
+# Smaller versions to be created in addition to the main image
+VARIANT_DIMENSIONS = [Dimensions(128, 128)]
+
 
 def create_avatar_image(
     party_id: PartyID,
@@ -32,7 +36,11 @@ def create_avatar_image(
     *,
     maximum_dimensions: Dimensions = MAXIMUM_DIMENSIONS,
 ) -> Result[DbTourneyAvatar, str]:
-    """Create a new avatar image."""
+    """Create a new avatar image.
+
+    The image is shrunk and cropped right away as its URL is handed out
+    immediately. Variants of it are created in the background.
+    """
     image_type_result = image_service.determine_image_type(
         stream, allowed_types
     )
@@ -42,8 +50,13 @@ def create_avatar_image(
     image_type = image_type_result.unwrap()
     image_dimensions = image_service.determine_dimensions(stream)
 
-    image_too_large = image_dimensions > maximum_dimensions
-    if image_too_large or not image_dimensions.is_square:
+    pixel_count_result = image_service.check_pixel_count(image_dimensions)
+    if pixel_count_result.is_err():
+        return Err(pixel_count_result.unwrap_err())
+
+    if image_service.needs_thumbnail(
+        image_dimensions, maximum_dimensions, force_square=True
+    ):
         stream = create_thumbnail(
             stream, image_type.name, maximum_dimensions, force_square=True
         )
@@ -55,9 +68,29 @@ def create_avatar_image(
     # Might raise `FileExistsError`.
     upload.store(stream, avatar.path, create_parent_path_if_nonexistent=True)
 
+    enqueue(create_avatar_image_variants, avatar.id, maximum_dimensions)
+
     return Ok(avatar)
 
 
+def create_avatar_image_variants(
+    avatar_id: UUID, maximum_dimensions: Dimensions
+) -> None:
+    """Create smaller variants and WebP versions of the avatar image."""
+    avatar = db.session.get(DbTourneyAvatar, avatar_id)
+    if avatar is None:
+        return
+
+    image_service.create_thumbnail_files(
+        avatar.path,
+        avatar.path,
+        avatar.image_type,
+        maximum_dimensions,
+        VARIANT_DIMENSIONS,
+        force_square=True,
+    )
+
+
 def delete_avatar_image(avatar_id: UUID) -> Result[None, str]:
     """Delete the avatar image."""
     avatar = db.session.get(DbTourneyAvatar, avatar_id)
@@ -65,8 +98,9 @@ def delete_avatar_image(avatar_id: UUID) -> Result[None, str]:
     if avatar is None:
         return Err('Unknown avatar ID')
 
-    # Delete file.
+    # Delete files.
     upload.delete(avatar.path)
+    image_service.delete_thumbnail_files(avatar.path)
 
     # Delete database record.
     db.session.delete(avatar)
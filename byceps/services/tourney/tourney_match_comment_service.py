@@ -11,7 +11,7 @@ from datetime import datetime
 from sqlalchemy import select
 
 from byceps.database import db
-from byceps.services.text_markup import text_markup_service
+from byceps.services.text_markup import rendered_html_cache
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User, UserID
 
@@ -39,8 +39,11 @@ def find_comment(comment_id: MatchCommentID) -> MatchComment | None:
     if db_comment.hidden_by_id:
         moderator = _get_user(db_comment.hidden_by_id)
 
+    body_html = rendered_html_cache.get_html(db_comment.body)
+
     return _db_entity_to_comment(
         db_comment,
+        body_html,
         creator,
         last_editor=last_editor,
         moderator=moderator,
@@ -93,8 +96,12 @@ def get_comments(
     }
     moderators_by_id = _get_users_by_id(moderator_ids)
 
+    bodies_html = rendered_html_cache.get_htmls(
+        [db_comment.body for db_comment in db_comments]
+    )
+
     comments = []
-    for db_comment in db_comments:
+    for db_comment, body_html in zip(db_comments, bodies_html, strict=True):
         creator = creators_by_id[db_comment.created_by_id]
 
         last_editor = (
@@ -111,6 +118,7 @@ def get_comments(
 
         comment = _db_entity_to_comment(
             db_comment,
+            body_html,
             creator,
             last_editor=last_editor,
             moderator=moderator,
@@ -131,6 +139,8 @@ def create_comment(match_id: MatchID, creator: User, body: str) -> MatchComment:
     db.session.add(db_comment)
     db.session.commit()
 
+    rendered_html_cache.populate(db_comment.body)
+
     return get_comment(db_comment.id)
 
 
@@ -146,6 +156,8 @@ def update_comment(
 
     db.session.commit()
 
+    rendered_html_cache.populate(db_comment.body)
+
     return get_comment(db_comment.id)
 
 
@@ -190,13 +202,12 @@ def _get_user(user_id: UserID) -> User:
 
 def _db_entity_to_comment(
     db_comment: DbMatchComment,
+    body_html: str,
     creator: User,
     *,
     last_editor: User | None,
     moderator: User | None,
 ) -> MatchComment:
-    body_html = text_markup_service.render_html(db_comment.body)
-
     return MatchComment(
         id=db_comment.id,
         match_id=db_comment.match_id,
@@ -9,25 +9,33 @@ byceps.services.user.user_avatar_service
 from typing import BinaryIO
 
 from flask import current_app
+import structlog
 
 from byceps.database import db
 from byceps.events.user import (
     UserAvatarRemovedEvent,
     UserAvatarUpdatedEvent,
 )
+from byceps.services.authn.session import current_user_cache
 from byceps.services.image import image_service
 from byceps.util import upload
-from byceps.util.image import create_thumbnail
 from byceps.util.image.models import Dimensions, ImageType
+from byceps.util.jobqueue import enqueue
 from byceps.util.result import Err, Ok, Result
 
 from . import user_avatar_domain_service, user_log_service, user_service
 from .dbmodels.avatar import DbUserAvatar
-from .models.user import User, UserAvatar
+from .models.user import User, UserAvatar, UserAvatarID, UserID
+
+
+log = structlog.get_logger()
 
 
 MAXIMUM_DIMENSIONS = Dimensions(512, 512)
 
+# Smaller versions to be created in addition to the main image
+VARIANT_DIMENSIONS = [Dimensions(128, 128), Dimensions(48, 48)]
+
 
 def update_avatar_image(
     user: User,
@@ -36,10 +44,13 @@ def update_avatar_image(
     initiator: User,
     *,
     maximum_dimensions: Dimensions = MAXIMUM_DIMENSIONS,
-) -> Result[tuple[UserAvatar, UserAvatarUpdatedEvent], str]:
-    """Set a new avatar image for the user."""
-    db_user = user_service.get_db_user(user.id)
+) -> Result[UserAvatar, str]:
+    """Upload a new avatar image for the user.
 
+    The image is shrunk, cropped, and stored in multiple sizes and
+    formats in the background. Only then does it replace the user's
+    current avatar image.
+    """
     image_type_result = image_service.determine_image_type(
         stream, allowed_types
     )
@@ -49,11 +60,9 @@ def update_avatar_image(
     image_type = image_type_result.unwrap()
     image_dimensions = image_service.determine_dimensions(stream)
 
-    image_too_large = image_dimensions > maximum_dimensions
-    if image_too_large or not image_dimensions.is_square:
-        stream = create_thumbnail(
-            stream, image_type.name, maximum_dimensions, force_square=True
-        )
+    pixel_count_result = image_service.check_pixel_count(image_dimensions)
+    if pixel_count_result.is_err():
+        return Err(pixel_count_result.unwrap_err())
 
     db_avatar = DbUserAvatar(image_type)
     db.session.add(db_avatar)
@@ -62,7 +71,75 @@ def update_avatar_image(
     avatar = _db_entity_to_item(db_avatar)
 
     # Might raise `FileExistsError`.
-    upload.store(stream, avatar.path, create_parent_path_if_nonexistent=True)
+    upload.store(
+        stream,
+        image_service.get_unprocessed_path(avatar.path),
+        create_parent_path_if_nonexistent=True,
+    )
+
+    enqueue(
+        process_avatar_image,
+        avatar.id,
+        user.id,
+        initiator.id,
+        maximum_dimensions,
+    )
+
+    return Ok(avatar)
+
+
+def process_avatar_image(
+    avatar_id: UserAvatarID,
+    user_id: UserID,
+    initiator_id: UserID,
+    maximum_dimensions: Dimensions,
+) -> None:
+    """Shrink and crop the uploaded avatar image, create variants of it,
+    and then set it as the user's avatar image.
+
+    If the image cannot be processed, it is discarded and the user keeps
+    their current avatar image.
+    """
+    db_avatar = db.session.get(DbUserAvatar, avatar_id)
+    if db_avatar is None:
+        return
+
+    avatar = _db_entity_to_item(db_avatar)
+    unprocessed_path = image_service.get_unprocessed_path(avatar.path)
+
+    try:
+        image_service.create_thumbnail_files(
+            unprocessed_path,
+            avatar.path,
+            avatar.image_type,
+            maximum_dimensions,
+            VARIANT_DIMENSIONS,
+            force_square=True,
+        )
+    except Exception:
+        log.exception(
+            'Processing avatar image failed, discarding it',
+            avatar_id=str(avatar.id),
+            user_id=str(user_id),
+        )
+        upload.delete(avatar.path)
+        image_service.delete_thumbnail_files(avatar.path)
+        db.session.delete(db_avatar)
+        db.session.commit()
+        raise
+    finally:
+        upload.delete(unprocessed_path)
+
+    user = user_service.get_user(user_id)
+    initiator = user_service.get_user(initiator_id)
+
+    _set_avatar_image(user, avatar, initiator)
+
+
+def _set_avatar_image(
+    user: User, avatar: UserAvatar, initiator: User
+) -> UserAvatarUpdatedEvent:
+    db_user = user_service.get_db_user(user.id)
 
     db_user.avatar_id = avatar.id
 
@@ -75,7 +152,9 @@ def update_avatar_image(
 
     db.session.commit()
 
-    return Ok((avatar, event))
+    current_user_cache.invalidate_user(user.id)
+
+    return event
 
 
 def remove_avatar_image(
@@ -105,6 +184,8 @@ def remove_avatar_image(
 
     db.session.commit()
 
+    current_user_cache.invalidate_user(user.id)
+
     return event
 
 
@@ -19,6 +19,7 @@ from byceps.events.user import (
     UserEmailAddressChangedEvent,
     UserScreenNameChangedEvent,
 )
+from byceps.services.authn.session import current_user_cache
 from byceps.services.authz import authz_service
 from byceps.services.authz.models import RoleID
 
@@ -114,6 +115,8 @@ def _persist_account_suspension(
 
     db.session.commit()
 
+    current_user_cache.invalidate_user(event.user.id)
+
 
 def unsuspend_account(
     user: User, initiator: User, reason: str
@@ -170,6 +173,8 @@ def _persist_screen_name_change(
 
     db.session.commit()
 
+    current_user_cache.invalidate_user(event.user_id)
+
 
 def change_email_address(
     user: User,
@@ -221,6 +226,8 @@ def update_locale(user_id: UserID, locale: Locale | None) -> None:
     db_user.locale = locale.language if (locale is not None) else None
     db.session.commit()
 
+    current_user_cache.invalidate_user(user_id)
+
 
 def update_user_details(
     user_id: UserID,
@@ -11,7 +11,10 @@ User account anonymization and removal
 from byceps.database import db
 from byceps.events.user import UserAccountDeletedEvent
 from byceps.services.authn.password import authn_password_service
-from byceps.services.authn.session import authn_session_service
+from byceps.services.authn.session import (
+    authn_session_service,
+    current_user_cache,
+)
 from byceps.services.authz import authz_service
 from byceps.services.newsletter import newsletter_command_service
 from byceps.services.user import (
@@ -63,6 +66,8 @@ def _persist_account_deletion(
 
     db.session.commit()
 
+    current_user_cache.invalidate_user(user.id)
+
 
 def _anonymize_account(db_user: DbUser) -> None:
     """Remove user details from the account."""
@@ -6,16 +6,40 @@ byceps.services.user.user_import_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import date
 from io import TextIOBase
 import json
 import secrets
 
 from pydantic import BaseModel, ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import Mapped
+import structlog
 
-from . import user_creation_service
-from .models.user import User
+from byceps.database import db
+from byceps.services.authn.password import authn_password_domain_service
+from byceps.services.authn.password.dbmodels import DbCredential
+from byceps.services.authn.password.models import Credential
+
+from . import (
+    user_creation_domain_service,
+    user_creation_service,
+    user_log_service,
+)
+from .dbmodels.detail import DbUserDetail
+from .dbmodels.user import DbUser
+from .errors import InvalidEmailAddressError, InvalidScreenNameError
+from .models.log import UserLogEntry
+from .models.user import User, UserID
+
+
+log = structlog.get_logger()
+
+
+BATCH_IMPORT_CHUNK_SIZE = 500
 
 
 class UserToImport(BaseModel):
@@ -33,6 +57,27 @@ class UserToImport(BaseModel):
     internal_comment: str | None = None
 
 
+@dataclass(frozen=True)
+class UserImportError:
+    line_number: int
+    message: str
+
+
+@dataclass(frozen=True)
+class UserImportSummary:
+    imported_count: int
+    errors: list[UserImportError]
+
+
+@dataclass(frozen=True)
+class _PreparedUser:
+    line_number: int
+    user_to_import: UserToImport
+    user: User
+    normalized_email_address: str | None
+    log_entry: UserLogEntry
+
+
 def parse_lines(lines: TextIOBase) -> Iterator[str]:
     for line in lines:
         yield line.strip()
@@ -68,3 +113,255 @@ def import_user(user_to_import: UserToImport) -> User:
     ).unwrap()
 
     return user
+
+
+def import_users(
+    lines: Iterable[str],
+    *,
+    chunk_size: int = BATCH_IMPORT_CHUNK_SIZE,
+    hashing_worker_count: int | None = None,
+) -> UserImportSummary:
+    """Import user accounts from JSON lines, in batches.
+
+    All lines are parsed and validated first. Screen names and email
+    addresses are then checked for uniqueness, both among the records
+    and against existing accounts, with a few set-based queries.
+    Passwords are hashed in a pool of worker processes (as many as CPUs
+    unless specified). Finally, accounts are inserted, one transaction
+    per chunk.
+
+    Lines that cannot be imported are reported as errors (by line
+    number); they do not keep other lines from being imported.
+    """
+    errors: list[UserImportError] = []
+
+    prepared_users = list(_prepare_users(lines, errors))
+    prepared_users = _reject_duplicates(prepared_users, chunk_size, errors)
+
+    passwords = [secrets.token_urlsafe(24) for _ in prepared_users]
+    credentials = _create_password_hashes(
+        [prepared_user.user.id for prepared_user in prepared_users],
+        passwords,
+        hashing_worker_count,
+    )
+
+    imported_count = 0
+    for start in range(0, len(prepared_users), chunk_size):
+        chunk = prepared_users[start : start + chunk_size]
+        chunk_credentials = credentials[start : start + chunk_size]
+
+        try:
+            _insert_users(chunk, chunk_credentials)
+        except Exception as exc:
+            log.error('Batch user import failed', exc_info=exc)
+            db.session.rollback()
+            errors.extend(
+                UserImportError(
+                    prepared_user.line_number, f'Could not insert user: {exc}'
+                )
+                for prepared_user in chunk
+            )
+            continue
+
+        imported_count += len(chunk)
+
+    errors.sort(key=lambda error: error.line_number)
+
+    return UserImportSummary(imported_count=imported_count, errors=errors)
+
+
+def _prepare_users(
+    lines: Iterable[str], errors: list[UserImportError]
+) -> Iterator[_PreparedUser]:
+    """Parse and validate lines, collecting errors."""
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            user_to_import = parse_user_json(line)
+        except Exception as exc:
+            errors.append(UserImportError(line_number, str(exc)))
+            continue
+
+        creation_result = user_creation_domain_service.create_account(
+            user_to_import.screen_name,
+            user_to_import.email_address,
+            '',  # Passwords are hashed separately.
+            creation_method='import',
+        )
+
+        if creation_result.is_err():
+            match creation_result.unwrap_err():
+                case InvalidScreenNameError(value):
+                    message = f'Invalid screen name "{value}"'
+                case InvalidEmailAddressError(value):
+                    message = f'Invalid email address "{value}"'
+            errors.append(UserImportError(line_number, message))
+            continue
+
+        user, normalized_email_address, _, log_entry = creation_result.unwrap()
+
+        yield _PreparedUser(
+            line_number=line_number,
+            user_to_import=user_to_import,
+            user=user,
+            normalized_email_address=normalized_email_address,
+            log_entry=log_entry,
+        )
+
+
+def _reject_duplicates(
+    prepared_users: list[_PreparedUser],
+    chunk_size: int,
+    errors: list[UserImportError],
+) -> list[_PreparedUser]:
+    """Reject users whose screen name or email address is already
+    assigned to an existing account or to a user on a previous line.
+
+    Comparison is done case-insensitively.
+    """
+    screen_names = {
+        prepared_user.user.screen_name.lower()
+        for prepared_user in prepared_users
+        if prepared_user.user.screen_name is not None
+    }
+    email_addresses = {
+        prepared_user.normalized_email_address
+        for prepared_user in prepared_users
+        if prepared_user.normalized_email_address is not None
+    }
+
+    taken_screen_names = _get_assigned_values(
+        DbUser.screen_name, screen_names, chunk_size
+    )
+    taken_email_addresses = _get_assigned_values(
+        DbUser.email_address, email_addresses, chunk_size
+    )
+
+    unique_users = []
+
+    for prepared_user in prepared_users:
+        screen_name = prepared_user.user.screen_name
+        email_address = prepared_user.normalized_email_address
+
+        if screen_name is not None and (
+            screen_name.lower() in taken_screen_names
+        ):
+            errors.append(
+                UserImportError(
+                    prepared_user.line_number,
+                    f'Screen name "{screen_name}" is already assigned',
+                )
+            )
+            continue
+
+        if email_address is not None and (
+            email_address in taken_email_addresses
+        ):
+            errors.append(
+                UserImportError(
+                    prepared_user.line_number,
+                    f'Email address "{email_address}" is already assigned',
+                )
+            )
+            continue
+
+        if screen_name is not None:
+            taken_screen_names.add(screen_name.lower())
+
+        if email_address is not None:
+            taken_email_addresses.add(email_address)
+
+        unique_users.append(prepared_user)
+
+    return unique_users
+
+
+def _get_assigned_values(
+    model_attribute: Mapped[str | None], values: set[str], chunk_size: int
+) -> set[str]:
+    """Return those of the (lowercase) values that are already assigned
+    to existing accounts.
+    """
+    values_list = list(values)
+    assigned_values = set()
+
+    for start in range(0, len(values_list), chunk_size):
+        chunk = values_list[start : start + chunk_size]
+        assigned_values.update(
+            db.session.scalars(
+                select(db.func.lower(model_attribute)).filter(
+                    db.func.lower(model_attribute).in_(chunk)
+                )
+            ).all()
+        )
+
+    return assigned_values
+
+
+def _create_password_hashes(
+    user_ids: Sequence[UserID],
+    passwords: Sequence[str],
+    worker_count: int | None,
+) -> list[Credential]:
+    """Hash the passwords in a pool of worker processes."""
+    if not user_ids:
+        return []
+
+    with ProcessPoolExecutor(max_workers=worker_count) as executor:
+        return list(
+            executor.map(
+                authn_password_domain_service.create_password_hash,
+                user_ids,
+                passwords,
+                chunksize=16,
+            )
+        )
+
+
+def _insert_users(
+    prepared_users: Sequence[_PreparedUser], credentials: Sequence[Credential]
+) -> None:
+    """Insert users, their details, log entries, and credentials in a
+    single transaction.
+    """
+    for prepared_user in prepared_users:
+        user = prepared_user.user
+        user_to_import = prepared_user.user_to_import
+
+        db_user = DbUser(
+            user.id,
+            prepared_user.log_entry.occurred_at,
+            user.screen_name,
+            prepared_user.normalized_email_address,
+            locale=user.locale,
+            legacy_id=user_to_import.legacy_id,
+        )
+        db.session.add(db_user)
+
+        db_detail = DbUserDetail(
+            user=db_user,
+            first_name=user_to_import.first_name,
+            last_name=user_to_import.last_name,
+            date_of_birth=user_to_import.date_of_birth,
+            country=user_to_import.country,
+            zip_code=user_to_import.zip_code,
+            city=user_to_import.city,
+            street=user_to_import.street,
+            phone_number=user_to_import.phone_number,
+            internal_comment=user_to_import.internal_comment,
+        )
+        db.session.add(db_detail)
+
+    # Users have to exist before rows referencing them can be inserted.
+    db.session.flush()
+
+    for prepared_user in prepared_users:
+        db_log_entry = user_log_service.to_db_entry(prepared_user.log_entry)
+        db.session.add(db_log_entry)
+
+    for credential in credentials:
+        db_credential = DbCredential(
+            credential.user_id, credential.password_hash, credential.updated_at
+        )
+        db.session.add(db_credential)
+
+    db.session.commit()
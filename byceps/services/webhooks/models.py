@@ -44,3 +44,4 @@ class AnnouncementRequest:
     data: dict[str, Any]
     expected_response_status_code: int | None
     announce_at: datetime | None = None
+    format: str | None = None
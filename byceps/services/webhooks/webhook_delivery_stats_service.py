@@ -0,0 +1,119 @@
+"""
+byceps.services.webhooks.webhook_delivery_stats_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Number, duration, and failures of webhook calls per webhook, stored in
+Redis to be collected as metrics
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from uuid import UUID
+
+from flask import current_app
+
+from .models import WebhookID
+
+
+# Upper bounds (in seconds) of the call duration histogram buckets
+DURATION_BUCKET_BOUNDS = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    15.0,
+)
+
+_KEY_PREFIX = 'webhooks:delivery_stats:'
+
+_FIELD_COUNT = 'count'
+_FIELD_SUM = 'sum'
+_FIELD_FAILED_COUNT = 'failed'
+
+
+@dataclass(frozen=True)
+class WebhookDeliveryStats:
+    webhook_id: WebhookID
+    count: int
+    duration_sum: float
+    # cumulative call counts per bucket upper bound
+    duration_bucket_counts: list[tuple[float, int]]
+    failed_count: int
+
+
+def record_call(webhook_id: WebhookID, duration: float, failed: bool) -> None:
+    """Record a call of the webhook, its duration (in seconds), and
+    whether it failed.
+    """
+    key = _get_key(webhook_id)
+
+    pipeline = current_app.redis_client.pipeline(transaction=False)
+    pipeline.hincrby(key, _FIELD_COUNT, 1)
+    pipeline.hincrbyfloat(key, _FIELD_SUM, duration)
+
+    if failed:
+        pipeline.hincrby(key, _FIELD_FAILED_COUNT, 1)
+
+    # Only count the call in the first matching bucket; counts are
+    # accumulated when retrieved.
+    for bound in DURATION_BUCKET_BOUNDS:
+        if duration <= bound:
+            pipeline.hincrby(key, _get_bucket_field(bound), 1)
+            break
+
+    pipeline.execute()
+
+
+def get_stats() -> list[WebhookDeliveryStats]:
+    """Return the recorded statistics of all webhooks."""
+    redis_client = current_app.redis_client
+
+    keys = sorted(redis_client.scan_iter(match=f'{_KEY_PREFIX}*'))
+    if not keys:
+        return []
+
+    pipeline = redis_client.pipeline(transaction=False)
+    for key in keys:
+        pipeline.hgetall(key)
+    values = pipeline.execute()
+
+    return [
+        _to_stats(key.decode(), fields)
+        for key, fields in zip(keys, values, strict=True)
+        if fields
+    ]
+
+
+def _get_key(webhook_id: WebhookID) -> str:
+    return f'{_KEY_PREFIX}{webhook_id}'
+
+
+def _get_bucket_field(bound: float) -> str:
+    return f'le:{bound}'
+
+
+def _to_stats(key: str, fields: dict[bytes, bytes]) -> WebhookDeliveryStats:
+    webhook_id = WebhookID(UUID(key.removeprefix(_KEY_PREFIX)))
+
+    def get_field(name: str) -> bytes:
+        return fields.get(name.encode(), b'0')
+
+    duration_bucket_counts = []
+    cumulative_count = 0
+    for bound in DURATION_BUCKET_BOUNDS:
+        cumulative_count += int(get_field(_get_bucket_field(bound)))
+        duration_bucket_counts.append((bound, cumulative_count))
+
+    return WebhookDeliveryStats(
+        webhook_id=webhook_id,
+        count=int(get_field(_FIELD_COUNT)),
+        duration_sum=float(get_field(_FIELD_SUM)),
+        duration_bucket_counts=duration_bucket_counts,
+        failed_count=int(get_field(_FIELD_FAILED_COUNT)),
+    )
@@ -6,17 +6,29 @@ byceps.services.webhooks.webhook_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import defaultdict
+from datetime import timedelta
 from typing import Any
 
 from sqlalchemy import delete, select
 
 from byceps.database import db
+from byceps.util.cache import TtlCache
 from byceps.util.result import Err, Ok, Result
 
 from .dbmodels import DbOutgoingWebhook
 from .models import EventFilters, OutgoingWebhook, WebhookID
 
 
+RoutingTable = dict[str, list[OutgoingWebhook]]
+
+
+# Maps event types to the enabled webhooks subscribed to them.
+_routing_table_cache: TtlCache[None, RoutingTable] = TtlCache(
+    timedelta(minutes=1)
+)
+
+
 def create_outgoing_webhook(
     event_types: set[str],
     event_filters: EventFilters,
@@ -43,6 +55,8 @@ def create_outgoing_webhook(
     db.session.add(db_webhook)
     db.session.commit()
 
+    _routing_table_cache.clear()
+
     return _db_entity_to_outgoing_webhook(db_webhook)
 
 
@@ -73,6 +87,8 @@ def update_outgoing_webhook(
 
     db.session.commit()
 
+    _routing_table_cache.clear()
+
     return Ok(_db_entity_to_outgoing_webhook(db_webhook))
 
 
@@ -83,6 +99,8 @@ def delete_outgoing_webhook(webhook_id: WebhookID) -> None:
     )
     db.session.commit()
 
+    _routing_table_cache.clear()
+
 
 def find_webhook(webhook_id: WebhookID) -> OutgoingWebhook | None:
     """Return the webhook with that ID, if found."""
@@ -112,15 +130,23 @@ def get_enabled_outgoing_webhooks(event_type: str) -> list[OutgoingWebhook]:
     """Return the configurations for enabled outgoing webhooks for that
     event type.
     """
+    routing_table = _routing_table_cache.get_or_set(None, _build_routing_table)
+    return list(routing_table.get(event_type, []))
+
+
+def _build_routing_table() -> RoutingTable:
     db_webhooks = db.session.scalars(
-        select(DbOutgoingWebhook)
-        .filter(DbOutgoingWebhook._event_types.contains([event_type]))
-        .filter_by(enabled=True)
+        select(DbOutgoingWebhook).filter_by(enabled=True)
     ).all()
 
-    return [
-        _db_entity_to_outgoing_webhook(db_webhook) for db_webhook in db_webhooks
-    ]
+    routing_table: RoutingTable = defaultdict(list)
+
+    for db_webhook in db_webhooks:
+        webhook = _db_entity_to_outgoing_webhook(db_webhook)
+        for event_type in webhook.event_types:
+            routing_table[event_type].append(webhook)
+
+    return dict(routing_table)
 
 
 def _db_entity_to_outgoing_webhook(
@@ -0,0 +1,116 @@
+"""
+byceps.util.cache
+~~~~~~~~~~~~~~~~~
+
+In-process caching
+
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from datetime import timedelta
+from threading import Lock
+import time
+from typing import Generic, TypeVar
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+
+
+class TtlCache(Generic[K, V]):
+    """A thread-safe, process-local cache whose entries expire after a
+    fixed time to live.
+
+    If a maximum size is given, the least recently used entries are
+    evicted once it is exceeded.
+
+    Invalidating entries only affects the current process. Changes
+    made in other processes (e.g. the admin application) are picked up
+    once the entries have expired.
+    """
+
+    def __init__(self, ttl: timedelta, *, max_size: int | None = None):
+        self._ttl_seconds = ttl.total_seconds()
+        self._max_size = max_size
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K) -> V | None:
+        """Return the value cached for that key, or `None` if there is
+        none or it has expired.
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def get_or_set(self, key: K, compute: Callable[[], V]) -> V:
+        """Return the value cached for that key.
+
+        If it is missing or has expired, compute, cache, and return it.
+        """
+        value = self.get(key)
+
+        if value is None:
+            value = compute()
+            self.set(key, value)
+
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Cache the value for that key."""
+        expires_at = time.monotonic() + self._ttl_seconds
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            if self._max_size is not None:
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """Remove the value cached for that key, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> CacheStats:
+        """Return hit and miss counts as well as the current size."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+            )
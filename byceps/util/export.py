@@ -4,44 +4,88 @@ byceps.util.export
 
 Data export as CSV.
 
+Rows are serialized as they are consumed from the given iterable and
+emitted in chunks of multiple lines, so that exports can be streamed
+without holding the whole data in memory.
+
 :Copyright: 2014-2025 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 import csv
-import io
+from typing import Any
+
+
+DEFAULT_ROWS_PER_CHUNK = 100
+
+
+class _ChunkBuffer:
+    """A write-only text stream that hands out and discards what has
+    been written to it so far.
+    """
+
+    def __init__(self) -> None:
+        self._pieces: list[str] = []
+
+    def write(self, s: str) -> int:
+        self._pieces.append(s)
+        return len(s)
+
+    def pop(self) -> str:
+        chunk = ''.join(self._pieces)
+        self._pieces.clear()
+        return chunk
 
 
 def serialize_dicts_to_csv(
     field_names: Sequence[str],
-    rows: Sequence[dict[str, str]],
+    rows: Iterable[dict[str, Any]],
     *,
     delimiter=',',
+    rows_per_chunk: int = DEFAULT_ROWS_PER_CHUNK,
 ) -> Iterator[str]:
     """Serialize the rows (must be dictionary objects) to CSV."""
-    with io.StringIO(newline='') as f:
-        writer = csv.DictWriter(
-            f, field_names, dialect=csv.excel, delimiter=delimiter
-        )
+    buffer = _ChunkBuffer()
+    writer = csv.DictWriter(
+        buffer, field_names, dialect=csv.excel, delimiter=delimiter
+    )
 
-        writer.writeheader()
-        writer.writerows(rows)
+    writer.writeheader()
 
-        f.seek(0)
-        yield from f
+    yield from _write_rows_in_chunks(
+        writer.writerow, buffer, rows, rows_per_chunk
+    )
 
 
 def serialize_tuples_to_csv(
-    rows: Sequence[tuple[str, ...]],
+    rows: Iterable[tuple[Any, ...]],
     *,
     delimiter=',',
+    rows_per_chunk: int = DEFAULT_ROWS_PER_CHUNK,
 ) -> Iterator[str]:
     """Serialize the rows (must be tuples) to CSV."""
-    with io.StringIO(newline='') as f:
-        writer = csv.writer(f, delimiter=delimiter)
+    buffer = _ChunkBuffer()
+    writer = csv.writer(buffer, delimiter=delimiter)
+
+    yield from _write_rows_in_chunks(
+        writer.writerow, buffer, rows, rows_per_chunk
+    )
+
+
+def _write_rows_in_chunks(
+    write_row, buffer: _ChunkBuffer, rows: Iterable, rows_per_chunk: int
+) -> Iterator[str]:
+    row_count_in_chunk = 0
+
+    for row in rows:
+        write_row(row)
+        row_count_in_chunk += 1
 
-        writer.writerows(rows)
+        if row_count_in_chunk >= rows_per_chunk:
+            yield buffer.pop()
+            row_count_in_chunk = 0
 
-        f.seek(0)
-        yield from f
+    chunk = buffer.pop()
+    if chunk:
+        yield chunk
@@ -6,12 +6,14 @@ byceps.util.image
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Iterable
+from dataclasses import dataclass
 from io import BytesIO
 from typing import BinaryIO
 
 from PIL import Image, ImageFile
 
-from .models import Dimensions
+from .models import Dimensions, ImageType
 
 
 FilenameOrStream = str | BinaryIO
@@ -34,6 +36,7 @@ def create_thumbnail(
     output_stream = BytesIO()
 
     image = Image.open(filename_or_stream)
+    _decode_reduced(image, maximum_dimensions)
 
     if force_square:
         image = _crop_to_square(image)
@@ -46,6 +49,73 @@ def create_thumbnail(
     return output_stream
 
 
+@dataclass(frozen=True, slots=True)
+class Thumbnail:
+    maximum_dimensions: Dimensions
+    image_type: ImageType
+    stream: BinaryIO
+
+
+def create_thumbnails(
+    filename_or_stream: FilenameOrStream,
+    image_type: ImageType,
+    maximum_dimensions: Iterable[Dimensions],
+    *,
+    force_square: bool = False,
+    additional_image_types: Iterable[ImageType] = (),
+) -> list[Thumbnail]:
+    """Create thumbnails of multiple sizes, each in the image's type and
+    in the additional types, from the given image.
+
+    The image is decoded only once.
+    """
+    all_maximum_dimensions = sorted(
+        set(maximum_dimensions), key=lambda d: d.pixel_count, reverse=True
+    )
+    if not all_maximum_dimensions:
+        return []
+
+    image_types = [image_type, *additional_image_types]
+
+    image = Image.open(filename_or_stream)
+    _decode_reduced(image, all_maximum_dimensions[0])
+
+    if force_square:
+        image = _crop_to_square(image)
+
+    image.load()
+
+    thumbnails = []
+
+    for dimensions in all_maximum_dimensions:
+        thumbnail_image = image.copy()
+        thumbnail_image.thumbnail(dimensions, resample=Image.Resampling.LANCZOS)
+
+        for thumbnail_image_type in image_types:
+            output_stream = BytesIO()
+            thumbnail_image.save(
+                output_stream, format=thumbnail_image_type.name
+            )
+            output_stream.seek(0)
+
+            thumbnails.append(
+                Thumbnail(dimensions, thumbnail_image_type, output_stream)
+            )
+
+    return thumbnails
+
+
+def _decode_reduced(image: ImageFile, maximum_dimensions: Dimensions) -> None:
+    """Have JPEG images be scaled down while being decoded, close to (but
+    not below) the maximum dimensions.
+
+    This is much faster and uses less memory than decoding the image at
+    full size.
+    """
+    if image.format == 'JPEG':
+        image.draft(image.mode, maximum_dimensions)
+
+
 def _crop_to_square(image: ImageFile) -> ImageFile:
     """Crop image to be square."""
     dimensions = Dimensions(*image.size)
@@ -20,5 +20,9 @@ class Dimensions(NamedTuple):
     def is_square(self) -> bool:
         return self.width == self.height
 
+    @property
+    def pixel_count(self) -> int:
+        return self.width * self.height
+
 
 ImageType = Enum('ImageType', ['gif', 'jpeg', 'png', 'svg', 'webp'])
@@ -14,8 +14,9 @@ An asynchronously processed job queue based on Redis_ and RQ_.
 from collections.abc import Callable
 from datetime import datetime, UTC
 
-from flask import current_app
-from rq import Queue
+from flask import current_app, Flask
+from rq import Queue, SimpleWorker
+from rq.job import Job
 
 
 def get_queue(app):
@@ -40,3 +41,21 @@ def enqueue_at(dt: datetime, func: Callable, *args, **kwargs):
 
     queue = get_queue(current_app)
     queue.enqueue_at(dt, func, *args, **kwargs)
+
+
+class AppContextPerJobWorker(SimpleWorker):
+    """A worker that runs jobs in its own process (instead of forking a
+    process per job), each one in a fresh application context.
+
+    A fresh application context comes with a fresh database session,
+    so jobs neither see objects left over by previous jobs nor inherit
+    a failed transaction from one.
+    """
+
+    def __init__(self, app: Flask, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._app = app
+
+    def perform_job(self, job: Job, queue: Queue) -> bool:
+        with self._app.app_context():
+            return super().perform_job(job, queue)
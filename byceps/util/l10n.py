@@ -22,14 +22,15 @@ from byceps.services.user.models.user import User
 
 def get_current_user_locale() -> str | None:
     """Return the locale for the current user, if available."""
-    # Look for a locale on the current user object.
-    user = g.user
+    # Look for a locale on the current user object (which is not
+    # available outside of requests, e.g. in background jobs).
+    user = g.get('user')
     if (user is not None) and (user.locale is not None):
         return user.locale
 
     if request:
         # Try to match user agent's accepted languages.
-        languages = [locale.language for locale in g.locales]
+        languages = [locale.language for locale in g.get('locales', [])]
         return request.accept_languages.best_match(languages)
 
     return None
@@ -8,8 +8,11 @@ Templating utilities
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
+from datetime import timedelta
+from hashlib import sha256
 from pathlib import Path
+from threading import Lock
 from typing import Any
 
 from flask import g
@@ -23,20 +26,90 @@ from jinja2 import (
 )
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 
+from byceps.util.cache import CacheStats, TtlCache
+
 
 SITES_PATH = Path('sites')
 
 
+# Compiled templates, keyed by set of globals and hash of the source.
+# As the key covers the whole source, entries never become stale; they
+# expire only to free memory.
+_template_cache: TtlCache[tuple[Hashable, str], Template] = TtlCache(
+    timedelta(days=1), max_size=1000
+)
+
+# One environment per set of globals, reused across templates
+_environments: dict[Hashable, Environment] = {}
+_environments_lock = Lock()
+
+
 def load_template(
     source: str, *, template_globals: dict[str, Any] | None = None
 ) -> Template:
-    """Load a template from source, using the sandboxed environment."""
+    """Load a template from source, using the sandboxed environment.
+
+    Compiled templates are cached per source and set of globals.
+    """
+    globals_key = _get_globals_key(template_globals)
+    if globals_key is None:
+        # Globals are not hashable and thus cannot be part of a cache key.
+        return _create_environment(template_globals).from_string(source)
+
+    cache_key = (globals_key, sha256(source.encode()).hexdigest())
+
+    return _template_cache.get_or_set(
+        cache_key,
+        lambda: _get_environment(globals_key, template_globals).from_string(
+            source
+        ),
+    )
+
+
+def get_template_cache_stats() -> CacheStats:
+    """Return hit and miss counts as well as the current size of this
+    process' cache of compiled templates.
+    """
+    return _template_cache.get_stats()
+
+
+def _get_globals_key(
+    template_globals: dict[str, Any] | None,
+) -> Hashable | None:
+    if not template_globals:
+        return ()
+
+    key = tuple(sorted(template_globals.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+def _get_environment(
+    globals_key: Hashable, template_globals: dict[str, Any] | None
+) -> Environment:
+    with _environments_lock:
+        env = _environments.get(globals_key)
+
+        if env is None:
+            env = _create_environment(template_globals)
+            _environments[globals_key] = env
+
+        return env
+
+
+def _create_environment(
+    template_globals: dict[str, Any] | None,
+) -> Environment:
     env = create_sandboxed_environment()
 
     if template_globals is not None:
         env.globals.update(template_globals)
 
-    return env.from_string(source)
+    return env
 
 
 def create_sandboxed_environment(
@@ -28,6 +28,20 @@ def store(
         copyfileobj(source, f)
 
 
+def replace(source: IO[Any], target_path: Path) -> None:
+    """Replace the data at the target path with the source data.
+
+    The data is written to a temporary file first, which then replaces
+    the target path at once.
+    """
+    temporary_path = target_path.with_name(f'.{target_path.name}.tmp')
+
+    with temporary_path.open('wb') as f:
+        copyfileobj(source, f)
+
+    temporary_path.replace(target_path)
+
+
 def delete(path: Path) -> None:
     """Delete the path."""
     try:
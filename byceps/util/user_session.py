@@ -11,7 +11,10 @@ from uuid import UUID
 from babel import parse_locale
 from flask import session
 
-from byceps.services.authn.session import authn_session_service
+from byceps.services.authn.session import (
+    authn_session_service,
+    current_user_cache,
+)
 from byceps.services.authn.session.models import CurrentUser
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User, UserID
@@ -45,11 +48,11 @@ def end() -> None:
 def get_current_user(required_permissions: set[str]) -> CurrentUser:
     session_locale = _get_session_locale()
 
-    user = _find_user()
-    if user is None:
+    user_and_permissions = _find_user_and_permissions()
+    if user_and_permissions is None:
         return authn_session_service.get_anonymous_current_user(session_locale)
 
-    permissions = get_permissions_for_user(user.id)
+    user, permissions = user_and_permissions
     if not required_permissions.issubset(permissions):
         return authn_session_service.get_anonymous_current_user(session_locale)
 
@@ -60,8 +63,9 @@ def get_current_user(required_permissions: set[str]) -> CurrentUser:
     )
 
 
-def _find_user() -> User | None:
-    """Return the current user if authenticated, `None` if not.
+def _find_user_and_permissions() -> tuple[User, frozenset[str]] | None:
+    """Return the current user and their permissions if authenticated,
+    `None` if not.
 
     Return `None` if:
     - the ID is unknown.
@@ -71,7 +75,7 @@ def _find_user() -> User | None:
     user_id_str = session.get(KEY_USER_ID)
     auth_token = session.get(KEY_USER_AUTH_TOKEN)
 
-    if user_id_str is None:
+    if (user_id_str is None) or (auth_token is None):
         return None
 
     try:
@@ -79,19 +83,27 @@ def _find_user() -> User | None:
     except ValueError:
         return None
 
+    cached = current_user_cache.find(user_id, auth_token)
+    if cached is not None:
+        return cached.user, cached.permissions
+
+    cache_generation = current_user_cache.get_generation(user_id)
+
     user = user_service.find_active_user(user_id, include_avatar=True)
 
     if user is None:
         return None
 
     # Validate auth token.
-    if (auth_token is None) or not authn_session_service.is_session_valid(
-        user.id, auth_token
-    ):
+    if not authn_session_service.is_session_valid(user.id, auth_token):
         # Bad auth token, not logging in.
         return None
 
-    return user
+    permissions = get_permissions_for_user(user.id)
+
+    current_user_cache.store(auth_token, user, permissions, cache_generation)
+
+    return user, permissions
 
 
 def _get_session_locale() -> str | None:
@@ -9,7 +9,11 @@ import sys
 
 import structlog
 
-from byceps.app_dispatcher import create_dispatcher_app, get_apps_config
+from byceps.app_dispatcher import (
+    create_dispatcher_app,
+    get_apps_config,
+    get_warm_up_worker_count,
+)
 from byceps.config.integration import (
     read_configuration_from_file_given_in_env_var,
 )
@@ -24,10 +28,19 @@ configure_sentry_from_env('apps')
 
 config_overrides = read_configuration_from_file_given_in_env_var()
 
+match get_warm_up_worker_count():
+    case Ok(warm_up_worker_count):
+        pass
+    case Err(e):
+        log.error(e)
+        sys.exit(1)
+
 match get_apps_config():
     case Ok(apps_config):
         app = create_dispatcher_app(
-            apps_config, config_overrides=config_overrides
+            apps_config,
+            config_overrides=config_overrides,
+            warm_up_worker_count=warm_up_worker_count,
         )
     case Err(e):
         log.error(e)
@@ -0,0 +1,30 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import httpx
+import pytest
+
+from byceps.announce import delivery
+
+
+@pytest.fixture()
+def sent_requests(monkeypatch) -> list[httpx.Request]:
+    """Capture the requests sent to webhook endpoints instead of sending
+    them.
+
+    Requests to paths ending in `/broken` fail.
+    """
+    sent_requests = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        sent_requests.append(request)
+        if request.url.path.endswith('/broken'):
+            return httpx.Response(500)
+        return httpx.Response(204)
+
+    client = httpx.Client(transport=httpx.MockTransport(handle))
+    monkeypatch.setattr(delivery, '_get_http_client', lambda: client)
+
+    return sent_requests
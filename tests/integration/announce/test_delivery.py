@@ -0,0 +1,122 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import json
+import time
+
+import pytest
+
+from byceps.announce import delivery
+from byceps.services.webhooks import webhook_delivery_stats_service
+from byceps.services.webhooks.models import AnnouncementRequest, WebhookID
+
+from tests.helpers import generate_uuid
+
+
+def test_deliver(admin_app, sent_requests):
+    webhook_id1 = WebhookID(generate_uuid())
+    webhook_id2 = WebhookID(generate_uuid())
+
+    announcement_requests = [
+        build_request('one', webhook_id1, url='https://webhooks.test/one'),
+        build_request('two', webhook_id2, url='https://webhooks.test/two'),
+    ]
+
+    delivery.deliver(announcement_requests)
+
+    assert sorted(json.loads(r.content)['content'] for r in sent_requests) == [
+        'one',
+        'two',
+    ]
+
+    for webhook_id in webhook_id1, webhook_id2:
+        stats = find_stats(webhook_id)
+        assert stats is not None
+        assert stats.count == 1
+        assert stats.failed_count == 0
+
+
+def test_deliver_retries_only_failed_requests(
+    admin_app, sent_requests, monkeypatch
+):
+    scheduled_jobs = []
+    monkeypatch.setattr(
+        delivery,
+        'enqueue_at',
+        lambda dt, func, *args: scheduled_jobs.append((func, args)),
+    )
+
+    webhook_id = WebhookID(generate_uuid())
+
+    broken_request = build_request(
+        'one', webhook_id, url='https://webhooks.test/broken'
+    )
+    announcement_requests = [
+        broken_request,
+        build_request('two', webhook_id, url='https://webhooks.test/two'),
+    ]
+
+    delivery.deliver(announcement_requests)
+
+    assert len(sent_requests) == 2
+
+    stats = find_stats(webhook_id)
+    assert stats is not None
+    assert stats.count == 2
+    assert stats.failed_count == 1
+
+    assert scheduled_jobs == [(delivery.send, (broken_request,))]
+
+
+def test_send_failing_request(admin_app, sent_requests):
+    webhook_id = WebhookID(generate_uuid())
+
+    with pytest.raises(delivery.WebhookError):
+        delivery.deliver(
+            [
+                build_request(
+                    'one', webhook_id, url='https://webhooks.test/broken'
+                )
+            ]
+        )
+
+
+def test_requests_to_same_endpoint_are_rate_limited(
+    admin_app, sent_requests, monkeypatch
+):
+    monkeypatch.setattr(
+        delivery, '_MIN_SECONDS_BETWEEN_REQUESTS_PER_ENDPOINT', 0.2
+    )
+
+    webhook_id = WebhookID(generate_uuid())
+    url = f'https://webhooks.test/{generate_uuid()}'
+
+    started_at = time.monotonic()
+    delivery.send(build_request('one', webhook_id, url=url))
+    delivery.send(build_request('two', webhook_id, url=url))
+    duration = time.monotonic() - started_at
+
+    assert len(sent_requests) == 2
+    assert duration >= 0.2
+
+
+def build_request(
+    text: str, webhook_id: WebhookID, *, url: str
+) -> AnnouncementRequest:
+    return AnnouncementRequest(
+        webhook_id=webhook_id,
+        url=url,
+        data={'content': text},
+        expected_response_status_code=204,
+        format='discord',
+    )
+
+
+def find_stats(webhook_id: WebhookID):
+    for stats in webhook_delivery_stats_service.get_stats():
+        if stats.webhook_id == webhook_id:
+            return stats
+
+    return None
@@ -0,0 +1,47 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import json
+
+from byceps.announce import delivery
+from byceps.services.webhooks.models import AnnouncementRequest, WebhookID
+
+from tests.helpers import generate_uuid
+
+
+def test_defer_and_flush(admin_app, sent_requests, monkeypatch):
+    scheduled_jobs = []
+    monkeypatch.setattr(
+        delivery,
+        'enqueue_at',
+        lambda dt, func, *args: scheduled_jobs.append((func, args)),
+    )
+
+    webhook_id = WebhookID(generate_uuid())
+
+    # The first request is to be sent right away.
+    assert not delivery.defer_for_coalescing(build_request('one', webhook_id))
+
+    # Further requests within the coalescing window are deferred.
+    assert delivery.defer_for_coalescing(build_request('two', webhook_id))
+    assert delivery.defer_for_coalescing(build_request('three', webhook_id))
+
+    assert scheduled_jobs == [(delivery.flush_deferred, (webhook_id,))]
+
+    delivery.flush_deferred(webhook_id)
+
+    assert [json.loads(r.content) for r in sent_requests] == [
+        {'content': 'two\nthree'}
+    ]
+
+
+def build_request(text: str, webhook_id: WebhookID) -> AnnouncementRequest:
+    return AnnouncementRequest(
+        webhook_id=webhook_id,
+        url='https://webhooks.test/',
+        data={'content': text},
+        expected_response_status_code=204,
+        format='discord',
+    )
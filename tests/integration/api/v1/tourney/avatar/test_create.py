@@ -6,6 +6,8 @@
 from pathlib import Path
 
 from byceps.services.tourney.avatar import tourney_avatar_service
+from byceps.util.image import read_dimensions
+from byceps.util.image.models import Dimensions
 
 
 def test_create(api_client, api_client_authz_header, party, user):
@@ -18,6 +20,36 @@ def test_create(api_client, api_client_authz_header, party, user):
     tear_down_avatar(response)
 
 
+def test_create_with_variants(
+    api_client, api_client_authz_header, data_path, party, user
+):
+    response = send_request(
+        api_client, api_client_authz_header, party.id, user.id
+    )
+
+    avatar_id = extract_avatar_id(response)
+    avatars_path = data_path / 'parties' / party.id / 'tourney' / 'avatars'
+
+    def get_filenames() -> set[str]:
+        return {path.name for path in avatars_path.glob(f'{avatar_id}*')}
+
+    # The image is cropped to be square right away, variants are created
+    # in the background.
+    assert read_dimensions(avatars_path / f'{avatar_id}.png') == Dimensions(
+        8, 8
+    )
+    assert get_filenames() == {
+        f'{avatar_id}.png',
+        f'{avatar_id}-512x512.webp',
+        f'{avatar_id}-128x128.png',
+        f'{avatar_id}-128x128.webp',
+    }
+
+    tear_down_avatar(response)
+
+    assert get_filenames() == set()
+
+
 def test_create_fails_with_unknown_user_id(
     api_client, api_client_authz_header, party
 ):
@@ -0,0 +1,34 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from tests.helpers import log_in_user
+
+
+BASE_URL = 'http://admin.acmecon.test'
+
+
+def test_index(maintenance_admin_client):
+    url = f'{BASE_URL}/maintenance'
+    response = maintenance_admin_client.get(url)
+    assert response.status_code == 200
+    assert 'Template cache' in response.get_data(as_text=True)
+
+
+@pytest.fixture(scope='package')
+def maintenance_admin(make_admin):
+    permission_ids = {
+        'admin.access',
+        'admin.maintain',
+    }
+    admin = make_admin(permission_ids)
+    log_in_user(admin.id)
+    return admin
+
+
+@pytest.fixture(scope='package')
+def maintenance_admin_client(make_client, admin_app, maintenance_admin):
+    return make_client(admin_app, user_id=maintenance_admin.id)
@@ -5,6 +5,7 @@
 
 from datetime import datetime
 from decimal import Decimal
+import re
 
 from freezegun import freeze_time
 from moneyed import Money
@@ -155,3 +156,80 @@ def test_serialize_unknown_order(
     response = client.get(url)
 
     assert response.status_code == 404
+
+
+@pytest.fixture()
+def bulk_export_order(
+    shop: Shop,
+    make_product,
+    make_user,
+    make_orderer,
+    make_order_number_sequence,
+    make_storefront,
+) -> Order:
+    product = make_product(shop.id)
+
+    cart = Cart(shop.currency)
+    cart.add_item(product, 1)
+
+    orderer = make_orderer(make_user())
+
+    order_number_sequence = make_order_number_sequence(shop.id)
+    storefront = make_storefront(shop.id, order_number_sequence.id)
+
+    created_at = datetime(2015, 2, 26, 18, 3, 11)  # UTC
+
+    order, _ = order_checkout_service.place_order(
+        storefront, orderer, cart, created_at=created_at
+    ).unwrap()
+
+    return order
+
+
+@freeze_time('2015-04-15 07:54:18')  # UTC
+def test_serialize_orders_for_shop(
+    admin_app: BycepsApp,
+    shop_order_admin: User,
+    make_client,
+    shop: Shop,
+    bulk_export_order: Order,
+):
+    log_in_user(shop_order_admin.id)
+    client = make_client(admin_app, user_id=shop_order_admin.id)
+
+    url = f'{BASE_URL}/shop/orders/for_shop/{shop.id}/export'
+
+    response = client.get(
+        url,
+        query_string={
+            'created_from': '2015-02-26',
+            'created_before': '2015-02-27',
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.content_type == 'application/xml; charset=iso-8859-1'
+    assert response.is_streamed
+
+    order_numbers = get_exported_order_numbers(response.get_data())
+    assert bulk_export_order.order_number in order_numbers
+
+    response = client.get(url, query_string={'created_from': '2015-02-27'})
+
+    assert get_exported_order_numbers(response.get_data()) == []
+
+
+def test_serialize_orders_for_shop_with_invalid_date(
+    admin_app: BycepsApp, shop_order_admin: User, make_client, shop: Shop
+):
+    log_in_user(shop_order_admin.id)
+    client = make_client(admin_app, user_id=shop_order_admin.id)
+
+    url = f'{BASE_URL}/shop/orders/for_shop/{shop.id}/export'
+    response = client.get(url, query_string={'created_from': '2015-02-30'})
+
+    assert response.status_code == 400
+
+
+def get_exported_order_numbers(xml: bytes) -> list[str]:
+    return re.findall(r'<ORDER_ID>(.+?)</ORDER_ID>', xml.decode('utf-8'))
@@ -12,6 +12,21 @@ def test_ticket_index(party, ticketing_admin_client, ticket):
     assert response.status_code == 200
 
 
+def test_ticket_export(party, ticketing_admin_client, ticket, ticket_owner):
+    url = f'{BASE_URL}/ticketing/tickets/for_party/{party.id}/export'
+    response = ticketing_admin_client.get(url)
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/plain'
+
+    lines = response.get_data(as_text=True).splitlines()
+    assert lines[0] == 'code,category,owner,user,seat,revoked,user_checked_in'
+    assert (
+        f'{ticket.code},{ticket.category.title},{ticket_owner.screen_name},'
+        ',,no,no'
+    ) in lines[1:]
+
+
 def test_ticket_view(ticketing_admin_client, ticket):
     url = f'{BASE_URL}/ticketing/tickets/{ticket.id}'
     response = ticketing_admin_client.get(url)
@@ -43,6 +43,11 @@ def test_metrics(client):
     )
     assert regex.search(response.get_data(as_text=True)) is not None
 
+    assert 'metrics_collector_duration_seconds{collector="user"}' in (
+        response.get_data(as_text=True)
+    )
+    assert 'metrics_snapshot_age_seconds ' in response.get_data(as_text=True)
+
 
 @pytest.mark.parametrize('config_overrides', [{'METRICS_ENABLED': False}])
 def test_disabled_metrics(client):
@@ -0,0 +1,88 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.database import db
+from byceps.services.board import (
+    board_aggregation_service,
+    board_posting_command_service,
+    board_topic_command_service,
+)
+from byceps.services.board.dbmodels.category import DbBoardCategory
+from byceps.services.board.dbmodels.topic import DbTopic
+
+from .helpers import create_category, create_posting, create_topic
+
+
+def test_incremental_aggregation_matches_full_aggregation(
+    site_app, board, board_poster, moderator
+):
+    category1 = create_category(board.id, number=1)
+    category2 = create_category(board.id, number=2)
+    topic1 = create_topic(category1.id, board_poster, number=1)
+    topic2 = create_topic(category1.id, board_poster, number=2)
+    db_postings = [create_posting(topic1.id, board_poster) for _ in range(3)]
+    latest_posting_created_at = db_postings[-1].created_at
+
+    def assert_matches_full_aggregation() -> None:
+        aggregates = get_aggregates(topic1, topic2, category1, category2)
+        board_aggregation_service.aggregate_board(board.id)
+        assert get_aggregates(topic1, topic2, category1, category2) == (
+            aggregates
+        )
+
+    assert get_topic_aggregates(topic1) == (4, latest_posting_created_at)
+    assert_matches_full_aggregation()
+
+    # Hide and un-hide the category's latest posting.
+    board_posting_command_service.hide_posting(db_postings[-1].id, moderator)
+    assert_matches_full_aggregation()
+
+    board_posting_command_service.unhide_posting(db_postings[-1].id, moderator)
+    assert_matches_full_aggregation()
+
+    # Hide the topic containing the category's latest posting.
+    board_topic_command_service.hide_topic(topic1.id, moderator)
+    assert_matches_full_aggregation()
+
+    # Postings in hidden topics don't count for the category.
+    board_posting_command_service.hide_posting(db_postings[0].id, moderator)
+    assert_matches_full_aggregation()
+
+    board_topic_command_service.unhide_topic(topic1.id, moderator)
+    assert_matches_full_aggregation()
+
+    board_topic_command_service.move_topic(topic1.id, category2.id, moderator)
+    assert_matches_full_aggregation()
+
+    assert get_category_aggregates(category2) == (
+        1,
+        3,
+        latest_posting_created_at,
+    )
+
+
+def get_aggregates(topic1, topic2, category1, category2) -> list[tuple]:
+    db.session.expire_all()
+
+    return [
+        get_topic_aggregates(topic1),
+        get_topic_aggregates(topic2),
+        get_category_aggregates(category1),
+        get_category_aggregates(category2),
+    ]
+
+
+def get_topic_aggregates(topic) -> tuple:
+    db_topic = db.session.get(DbTopic, topic.id)
+    return db_topic.posting_count, db_topic.last_updated_at
+
+
+def get_category_aggregates(category) -> tuple:
+    db_category = db.session.get(DbBoardCategory, category.id)
+    return (
+        db_category.topic_count,
+        db_category.posting_count,
+        db_category.last_posting_updated_at,
+    )
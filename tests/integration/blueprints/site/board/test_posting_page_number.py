@@ -0,0 +1,38 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.board import (
+    board_posting_command_service,
+    board_posting_query_service,
+)
+
+from .helpers import create_posting
+
+
+def test_calculate_posting_page_number(
+    site_app, topic, board_poster, moderator
+):
+    # The topic's initial posting is the first one.
+    db_postings = [create_posting(topic.id, board_poster) for _ in range(4)]
+
+    board_posting_command_service.hide_posting(db_postings[0].id, moderator)
+
+    assert get_page_numbers(db_postings, include_hidden=True) == [1, 2, 2, 3]
+    assert get_page_numbers(db_postings[1:], include_hidden=False) == [
+        1,
+        2,
+        2,
+    ]
+
+
+def get_page_numbers(db_postings, *, include_hidden):
+    return [
+        board_posting_query_service.calculate_posting_page_number(
+            board_posting_query_service.get_db_posting(db_posting.id),
+            include_hidden,
+            2,
+        )
+        for db_posting in db_postings
+    ]
@@ -0,0 +1,100 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.board import (
+    board_last_view_service,
+    board_topic_query_service,
+)
+
+from .helpers import create_posting, create_topic
+
+
+def test_topics_with_unseen_postings(site_app, make_user, topic, board_poster):
+    user = make_user()
+
+    assert get_topics_with_unseen_postings(topic.id, user.id) == {topic.id}
+
+    board_last_view_service.mark_topic_as_just_viewed(topic.id, user.id)
+
+    assert get_topics_with_unseen_postings(topic.id, user.id) == set()
+
+    create_posting(topic.id, board_poster)
+
+    assert get_topics_with_unseen_postings(topic.id, user.id) == {topic.id}
+
+
+def test_mark_all_topics_as_viewed(site_app, make_user, topic, board_poster):
+    user = make_user()
+
+    assert get_topics_with_unseen_postings(topic.id, user.id) == {topic.id}
+
+    board_last_view_service.mark_all_topics_as_viewed(user.id)
+
+    assert get_topics_with_unseen_postings(topic.id, user.id) == set()
+
+    create_posting(topic.id, board_poster)
+
+    assert get_topics_with_unseen_postings(topic.id, user.id) == {topic.id}
+
+
+def test_mark_all_topics_in_category_as_viewed(
+    site_app, make_user, category, topic, board_poster
+):
+    user = make_user()
+
+    assert get_topics_with_unseen_postings(topic.id, user.id) == {topic.id}
+
+    board_last_view_service.mark_all_topics_in_category_as_viewed(
+        category.id, user.id
+    )
+
+    assert get_topics_with_unseen_postings(topic.id, user.id) == set()
+
+
+def test_cache_expiry_is_not_extended_by_filling_in_views(
+    site_app, make_user, category, topic, board_poster
+):
+    user = make_user()
+    other_topic = create_topic(category.id, board_poster)
+
+    redis_client = site_app.redis_client
+    key = f'board:last_views:topics:{user.id}'
+
+    get_topics_with_unseen_postings(topic.id, user.id)
+    assert 0 < redis_client.ttl(key) <= 3600
+
+    redis_client.expire(key, 60)
+
+    get_topics_with_unseen_postings(other_topic.id, user.id)
+    assert 0 < redis_client.ttl(key) <= 60
+
+
+def test_view_recorded_while_fetching_views_is_kept_in_cache(
+    site_app, make_user, topic, board_poster
+):
+    user = make_user()
+
+    def find_last_views_then_record_view(user_id, topic_ids):
+        # Fetch the (lack of a) last view, then have a view recorded
+        # before the fetched one gets cached.
+        last_views = board_last_view_service._find_last_topic_views(
+            user_id, topic_ids
+        )
+        board_last_view_service.mark_topic_as_just_viewed(topic.id, user_id)
+        return last_views
+
+    board_last_view_service._get_last_viewed_at(
+        'topics', user.id, {topic.id}, find_last_views_then_record_view
+    )
+
+    assert get_topics_with_unseen_postings(topic.id, user.id) == set()
+
+
+def get_topics_with_unseen_postings(topic_id, user_id):
+    db_topic = board_topic_query_service.get_db_topic(topic_id)
+
+    return board_last_view_service.get_topics_with_unseen_postings(
+        [db_topic], user_id
+    )
@@ -5,6 +5,10 @@
 
 import pytest
 
+from byceps.services.authn.password import password_hashing_executor
+from byceps.services.authn.password.password_hashing_executor import (
+    PasswordHashingOverloadedError,
+)
 from byceps.services.authn.session import authn_session_service
 from byceps.services.consent import (
     brand_requirements_service,
@@ -112,5 +116,35 @@ def test_login_fails_lacking_consent(client, brand, make_user):
     assert get_session_cookie(client) is None
 
 
+def test_login_fails_when_password_hashing_is_overloaded(
+    client, make_user, monkeypatch
+):
+    password = 'it takes too long'
+
+    user = make_user(password=password)
+
+    def reject(*args, **kwargs):
+        raise PasswordHashingOverloadedError
+
+    executor = password_hashing_executor.PasswordHashingExecutor(
+        worker_count=0, max_concurrency=1, queue_timeout=1
+    )
+    monkeypatch.setattr(executor, 'run', reject)
+    monkeypatch.setattr(
+        password_hashing_executor, 'get_executor', lambda: executor
+    )
+
+    form_data = {
+        'username': user.screen_name,
+        'password': password,
+    }
+
+    response = client.post(f'{BASE_URL}/authentication/log_in', data=form_data)
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '5'
+
+    assert get_session_cookie(client) is None
+
+
 def get_session_cookie(client):
     return client.get_cookie('session', domain='www.acmecon.test')
@@ -0,0 +1,62 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.authn.api import api_token_cache, authn_api_service
+from byceps.services.authz.models import PermissionID
+
+
+def test_cached_api_token_follows_changes(admin_app, admin_user):
+    api_token = authn_api_service.create_api_token(
+        admin_user.id, {PermissionID('orga_presence.update')}
+    )
+    token = api_token.token
+
+    assert api_token_cache.find(token) is None
+
+    assert authn_api_service.find_api_token_by_token_cached(token) == api_token
+    assert api_token_cache.find(token) == api_token
+
+    # Suspension invalidates the cached entry.
+    authn_api_service.suspend_api_token(api_token.id)
+    assert api_token_cache.find(token) is None
+
+    actual = authn_api_service.find_api_token_by_token_cached(token)
+    assert actual is not None
+    assert actual.suspended
+
+    # So does deletion.
+    authn_api_service.delete_api_token(api_token.id)
+    assert api_token_cache.find(token) is None
+    assert authn_api_service.find_api_token_by_token_cached(token) is None
+
+
+def test_unknown_token_is_not_cached(admin_app):
+    token = 'unknown-token'
+
+    assert authn_api_service.find_api_token_by_token_cached(token) is None
+    assert api_token_cache.find(token) is None
+
+
+def test_api_token_loaded_before_suspension_is_not_cached(
+    admin_app, admin_user
+):
+    api_token = authn_api_service.create_api_token(
+        admin_user.id, {PermissionID('orga_presence.update')}
+    )
+    token = api_token.token
+
+    # Load the token, but have it suspended before it gets stored.
+    generation = api_token_cache.get_generation(token)
+    loaded_api_token = authn_api_service.find_api_token_by_token(token)
+    authn_api_service.suspend_api_token(api_token.id)
+    api_token_cache.store(loaded_api_token, generation)
+
+    assert api_token_cache.find(token) is None
+
+    actual = authn_api_service.find_api_token_by_token_cached(token)
+    assert actual is not None
+    assert actual.suspended
+
+    authn_api_service.delete_api_token(api_token.id)
@@ -0,0 +1,40 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from uuid import UUID
+
+from byceps.services.authn.api import api_token_usage_service
+from byceps.util.uuid import generate_uuid7
+
+
+def test_record_request(admin_app):
+    api_token_id = generate_uuid7()
+
+    api_token_usage_service.record_request(api_token_id, 0.003)
+    api_token_usage_service.record_request(api_token_id, 0.02)
+    api_token_usage_service.record_request(api_token_id, 0.02)
+    api_token_usage_service.record_request(api_token_id, 30.0)
+
+    usage = find_usage(api_token_id)
+    assert usage is not None
+    assert usage.request_count == 4
+    assert round(usage.duration_sum, 3) == 30.043
+
+    bucket_counts = dict(usage.duration_bucket_counts)
+    assert bucket_counts[0.005] == 1
+    assert bucket_counts[0.01] == 1
+    assert bucket_counts[0.025] == 3
+    assert bucket_counts[10.0] == 3
+
+    api_token_usage_service.delete_usage(api_token_id)
+    assert find_usage(api_token_id) is None
+
+
+def find_usage(api_token_id: UUID):
+    for usage in api_token_usage_service.get_usages():
+        if usage.api_token_id == api_token_id:
+            return usage
+
+    return None
@@ -0,0 +1,127 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import threading
+
+import pytest
+
+from byceps.services.authn.password import (
+    authn_password_domain_service,
+    password_hashing_stats_service,
+)
+from byceps.services.authn.password.password_hashing_executor import (
+    PasswordHashingExecutor,
+    PasswordHashingOverloadedError,
+)
+
+from tests.helpers import generate_token
+
+
+def test_run_in_calling_thread(admin_app):
+    operation = generate_token()
+    executor = PasswordHashingExecutor(
+        worker_count=0, max_concurrency=1, queue_timeout=1
+    )
+
+    actual = executor.run(operation, max, 1, 3, 2)
+
+    assert actual == 3
+
+    stats = find_stats(operation)
+    assert stats is not None
+    assert stats.count == 1
+    assert stats.rejected_count == 0
+
+
+def test_run_in_worker_process(admin_app):
+    operation = generate_token()
+    executor = PasswordHashingExecutor(
+        worker_count=1, max_concurrency=1, queue_timeout=10
+    )
+
+    try:
+        password_hash = executor.run(
+            operation,
+            authn_password_domain_service._generate_password_hash,
+            'Passw0rd',
+        )
+    finally:
+        executor.shutdown()
+
+    assert authn_password_domain_service.check_password_hash(
+        password_hash, 'Passw0rd'
+    )
+
+    stats = find_stats(operation)
+    assert stats is not None
+    assert stats.count == 1
+
+
+def test_replace_broken_worker_pool(admin_app):
+    operation = generate_token()
+    executor = PasswordHashingExecutor(
+        worker_count=1, max_concurrency=1, queue_timeout=10
+    )
+
+    try:
+        assert executor.run(operation, max, 1, 2) == 2
+
+        # Kill the worker process to break the pool.
+        for process in list(executor._pool._processes.values()):
+            process.kill()
+            process.join()
+
+        assert executor.run(operation, max, 1, 3) == 3
+    finally:
+        executor.shutdown()
+
+    stats = find_stats(operation)
+    assert stats is not None
+    assert stats.count == 2
+
+
+def test_reject_when_overloaded(admin_app):
+    operation = generate_token()
+    executor = PasswordHashingExecutor(
+        worker_count=0, max_concurrency=1, queue_timeout=0.1
+    )
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def block() -> None:
+        started.set()
+        release.wait(timeout=5)
+
+    def occupy_capacity() -> None:
+        with admin_app.app_context():
+            executor.run(operation, block)
+
+    thread = threading.Thread(target=occupy_capacity)
+    thread.start()
+    started.wait(timeout=5)
+
+    try:
+        with pytest.raises(PasswordHashingOverloadedError):
+            executor.run(operation, max, 1, 2)
+    finally:
+        release.set()
+        thread.join()
+
+    # Capacity is available again.
+    assert executor.run(operation, max, 1, 2) == 2
+
+    stats = find_stats(operation)
+    assert stats is not None
+    assert stats.count == 2
+    assert stats.rejected_count == 1
+
+
+def find_stats(operation: str):
+    for stats in password_hashing_stats_service.get_stats():
+        if stats.operation == operation:
+            return stats
+
+    return None
@@ -0,0 +1,32 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.party import party_service
+
+
+def test_get_party_cached_follows_changes(make_party, brand):
+    party = make_party(brand, title='Old title')
+
+    assert party_service.get_party_cached(party.id).title == 'Old title'
+
+    party_service.update_party(
+        party.id,
+        'New title',
+        party.starts_at,
+        party.ends_at,
+        party.max_ticket_quantity,
+        party.ticket_management_enabled,
+        party.seat_management_enabled,
+        party.hidden,
+        party.canceled,
+        party.archived,
+    )
+    assert party_service.get_party_cached(party.id).title == 'New title'
+
+    party_service.delete_party(party.id)
+    with pytest.raises(party_service.UnknownPartyIdError):
+        party_service.get_party_cached(party.id)
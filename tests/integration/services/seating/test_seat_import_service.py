@@ -0,0 +1,101 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.seating import (
+    seat_group_service,
+    seat_import_service,
+    seat_service,
+    seating_area_service,
+)
+from byceps.services.seating.models import SeatToImport
+
+from tests.helpers import generate_token
+
+
+@pytest.fixture()
+def party(make_party, brand):
+    return make_party(brand)
+
+
+@pytest.fixture()
+def area(party):
+    token = generate_token()
+    return seating_area_service.create_area(party.id, token, token)
+
+
+@pytest.fixture()
+def category(make_ticket_category, party):
+    return make_ticket_category(party.id, 'Premium')
+
+
+@pytest.fixture()
+def another_category(make_ticket_category, party):
+    return make_ticket_category(party.id, 'Economy')
+
+
+def test_import_seats(party, area, category):
+    seats_to_import = [
+        SeatToImport(
+            area_id=area.id,
+            coord_x=x,
+            coord_y=10,
+            category_id=category.id,
+            label=f'Seat A-{x}',
+            group_title='Row A' if x <= 3 else None,
+        )
+        for x in range(1, 6)
+    ]
+
+    result = seat_import_service.import_seats(
+        party.id, seats_to_import, chunk_size=2
+    )
+
+    assert result.is_ok()
+    summary = result.unwrap()
+    assert summary.seat_count == 5
+    assert summary.seat_group_count == 1
+
+    assert seat_service.count_seats_for_party(party.id) == 5
+
+    groups = seat_group_service.get_all_seat_groups_for_party(party.id)
+    assert len(groups) == 1
+    group = groups[0]
+    assert group.title == 'Row A'
+    assert group.ticket_category_id == category.id
+    assert group.seat_quantity == 3
+    assert {seat.label for seat in group.seats} == {
+        'Seat A-1',
+        'Seat A-2',
+        'Seat A-3',
+    }
+
+
+def test_import_seats_with_mixed_group_categories(
+    party, area, category, another_category
+):
+    seats_to_import = [
+        SeatToImport(
+            area_id=area.id,
+            coord_x=1,
+            coord_y=10,
+            category_id=category.id,
+            group_title='Row A',
+        ),
+        SeatToImport(
+            area_id=area.id,
+            coord_x=2,
+            coord_y=10,
+            category_id=another_category.id,
+            group_title='Row A',
+        ),
+    ]
+
+    result = seat_import_service.import_seats(party.id, seats_to_import)
+
+    assert result.is_err()
+    assert seat_service.count_seats_for_party(party.id) == 0
+    assert seat_group_service.count_seat_groups_for_party(party.id) == 0
@@ -20,6 +20,12 @@ def shop2(make_brand, make_shop):
     return make_shop(brand)
 
 
+@pytest.fixture(scope='module')
+def shop3(make_brand, make_shop):
+    brand = make_brand()
+    return make_shop(brand)
+
+
 def test_generate_order_number_default(admin_app, shop1):
     shop = shop1
 
@@ -44,3 +50,41 @@ def test_generate_order_number_custom(admin_app, shop2):
     actual = order_sequence_service.generate_order_number(sequence.id).unwrap()
 
     assert actual == 'LOL-03-B00207'
+
+
+def test_generate_order_number_from_reserved_block(admin_app, shop3):
+    shop = shop3
+
+    sequence = order_sequence_service.create_order_number_sequence(
+        shop.id, 'BLK-01-B', value=10
+    ).unwrap()
+
+    actual = [
+        order_sequence_service.generate_order_number_from_reserved_block(
+            sequence.id, 3
+        ).unwrap()
+        for _ in range(4)
+    ]
+
+    assert actual == [
+        'BLK-01-B00011',
+        'BLK-01-B00012',
+        'BLK-01-B00013',
+        'BLK-01-B00014',
+    ]
+
+    # Two blocks of three numbers each have been reserved.
+    sequence = order_sequence_service.get_order_number_sequence(sequence.id)
+    assert sequence.value == 16
+
+    # No orders have been placed, so all reserved numbers are unused.
+    assert order_sequence_service.get_unused_order_numbers(sequence.id) == [
+        'BLK-01-B00011',
+        'BLK-01-B00012',
+        'BLK-01-B00013',
+        'BLK-01-B00014',
+        'BLK-01-B00015',
+        'BLK-01-B00016',
+    ]
+
+    order_sequence_service.delete_order_number_sequence(sequence.id)
@@ -0,0 +1,63 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.shop.order import order_sequence_service
+from byceps.services.shop.order.models.order import Orderer
+from byceps.services.shop.product import product_service
+from byceps.services.shop.shop.models import Shop
+from byceps.services.shop.storefront.models import Storefront
+
+from tests.helpers.shop import place_order
+
+
+@pytest.fixture()
+def shop(make_brand, make_shop) -> Shop:
+    brand = make_brand()
+    return make_shop(brand)
+
+
+@pytest.fixture()
+def storefront(
+    shop: Shop, make_order_number_sequence, make_storefront
+) -> Storefront:
+    order_number_sequence = make_order_number_sequence(
+        shop.id, prefix='PO-01-B', value=41
+    )
+
+    return make_storefront(shop.id, order_number_sequence.id)
+
+
+@pytest.fixture(scope='module')
+def orderer(make_user, make_orderer) -> Orderer:
+    user = make_user()
+    return make_orderer(user)
+
+
+def test_place_order(
+    make_product,
+    admin_app,
+    shop: Shop,
+    storefront: Storefront,
+    orderer: Orderer,
+):
+    product1 = make_product(shop.id, total_quantity=100)
+    product2 = make_product(shop.id, total_quantity=50)
+
+    order = place_order(
+        shop, storefront, orderer, [(product1, 3), (product2, 1)]
+    )
+
+    assert order.order_number == 'PO-01-B00042'
+    assert len(order.line_items) == 2
+
+    assert product_service.get_product(product1.id).quantity == 97
+    assert product_service.get_product(product2.id).quantity == 49
+
+    sequence = order_sequence_service.get_order_number_sequence(
+        storefront.order_number_sequence_id
+    )
+    assert sequence.value == 42
@@ -0,0 +1,41 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.site import site_service
+
+from tests.helpers import create_site, generate_token
+
+
+def test_get_site_cached_follows_changes(admin_app, brand):
+    site_id = generate_token()
+    site = create_site(site_id, brand.id, title='Old title')
+
+    assert site_service.get_site_cached(site.id).title == 'Old title'
+
+    update_site_title(site, 'New title')
+    assert site_service.get_site_cached(site.id).title == 'New title'
+
+    site_service.delete_site(site.id)
+    with pytest.raises(site_service.UnknownSiteIdError):
+        site_service.get_site_cached(site.id)
+
+
+def update_site_title(site, title: str) -> None:
+    site_service.update_site(
+        site.id,
+        title,
+        site.server_name,
+        site.party_id,
+        site.enabled,
+        site.user_account_creation_enabled,
+        site.login_enabled,
+        site.board_id,
+        site.storefront_id,
+        site.is_intranet,
+        site.check_in_on_login,
+        site.archived,
+    )
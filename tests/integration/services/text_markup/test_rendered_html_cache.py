@@ -0,0 +1,54 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from unittest.mock import patch
+
+from byceps.services.text_markup import rendered_html_cache
+
+from tests.helpers import generate_token
+
+
+def test_get_htmls_renders_only_uncached_texts(site_app):
+    token = generate_token()
+    text1 = f'[b]{token}[/b]'
+    text2 = f'[i]{token}[/i]'
+
+    with site_app.app_context():
+        rendered_html_cache.populate(text1)
+
+        with patch(
+            'byceps.services.text_markup.text_markup_service.render_html',
+            wraps=rendered_html_cache.text_markup_service.render_html,
+        ) as render_html:
+            actual = rendered_html_cache.get_htmls([text1, text2])
+
+            assert actual == [
+                f'<strong>{token}</strong>',
+                f'<em>{token}</em>',
+            ]
+            render_html.assert_called_once_with(text2)
+
+            render_html.reset_mock()
+
+            # Now both are cached.
+            assert rendered_html_cache.get_htmls([text2, text1]) == [
+                f'<em>{token}</em>',
+                f'<strong>{token}</strong>',
+            ]
+            render_html.assert_not_called()
+
+
+def test_get_html(site_app):
+    token = generate_token()
+
+    with site_app.app_context():
+        assert rendered_html_cache.get_html(f'[u]{token}[/u]') == (
+            f'<u>{token}</u>'
+        )
+
+
+def test_get_htmls_without_texts(site_app):
+    with site_app.app_context():
+        assert rendered_html_cache.get_htmls([]) == []
@@ -0,0 +1,139 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy import select
+
+from byceps.database import db
+from byceps.services.ticketing import (
+    ticket_attendance_service,
+    ticket_creation_service,
+    ticket_revocation_service,
+    ticket_user_management_service,
+)
+from byceps.services.ticketing.dbmodels.attendance_count import (
+    DbBrandAttendanceCount,
+)
+
+
+def test_top_attendees_follow_changes(
+    admin_app, make_brand, make_party, make_ticket_category, make_user
+):
+    brand = make_brand()
+    party1 = make_party(brand)
+    party2 = make_party(brand)
+    party3 = make_party(brand)
+    category1 = make_ticket_category(party1.id, 'Standard')
+    category2 = make_ticket_category(party2.id, 'Standard')
+
+    owner = make_user()
+    user1 = make_user()
+    user2 = make_user()
+
+    def get_top_attendees():
+        return ticket_attendance_service.get_top_attendees_for_brand(brand.id)
+
+    assert get_top_attendees() == []
+
+    # Attendances with tickets
+
+    ticket_creation_service.create_ticket(category1, owner, user=user1)
+    ticket2 = ticket_creation_service.create_ticket(category2, owner)
+
+    # Only attendees with more than one attendance are listed.
+    assert get_top_attendees() == []
+
+    ticket_user_management_service.appoint_user(
+        ticket2.id, user1.id, owner.id
+    ).unwrap()
+    assert get_top_attendees() == [(user1.id, 2)]
+
+    ticket_user_management_service.appoint_user(
+        ticket2.id, user2.id, owner.id
+    ).unwrap()
+    assert get_top_attendees() == []
+
+    ticket_user_management_service.appoint_user(
+        ticket2.id, user1.id, owner.id
+    ).unwrap()
+    assert get_top_attendees() == [(user1.id, 2)]
+
+    # Archived attendances
+
+    ticket_attendance_service.create_archived_attendance(user1.id, party3.id)
+    assert get_top_attendees() == [(user1.id, 3)]
+
+    # A party is counted only once, even if attended multiple ways.
+    ticket_attendance_service.create_archived_attendance(user1.id, party1.id)
+    assert get_top_attendees() == [(user1.id, 3)]
+
+    ticket_attendance_service.delete_archived_attendance(user1.id, party3.id)
+    assert get_top_attendees() == [(user1.id, 2)]
+
+    # Revocation
+
+    ticket_revocation_service.revoke_ticket(ticket2.id, owner.id)
+    assert get_top_attendees() == []
+
+    # Full recalculation yields the same result.
+    ticket_attendance_service.create_archived_attendance(user2.id, party2.id)
+    ticket_attendance_service.create_archived_attendance(user2.id, party3.id)
+    expected = [(user2.id, 2)]
+    assert get_top_attendees() == expected
+
+    ticket_attendance_service.recalculate_attendance_counts_for_brand(brand.id)
+    assert get_top_attendees() == expected
+
+
+def test_count_is_removed_when_no_attendance_remains(
+    admin_app, make_brand, make_party, make_ticket_category, make_user
+):
+    brand = make_brand()
+    party = make_party(brand)
+    category = make_ticket_category(party.id, 'Standard')
+    owner = make_user()
+    user = make_user()
+
+    def get_attendance_count():
+        return db.session.scalar(
+            select(DbBrandAttendanceCount.attendance_count).filter_by(
+                brand_id=brand.id, user_id=user.id
+            )
+        )
+
+    ticket = ticket_creation_service.create_ticket(category, owner, user=user)
+    assert get_attendance_count() == 1
+
+    ticket_attendance_service.create_archived_attendance(user.id, party.id)
+    assert get_attendance_count() == 1
+
+    ticket_revocation_service.revoke_ticket(ticket.id, owner.id)
+    assert get_attendance_count() == 1
+
+    ticket_attendance_service.delete_archived_attendance(user.id, party.id)
+    assert get_attendance_count() is None
+
+
+def test_recalculation_locks_user_count_until_commit(
+    admin_app, make_brand, make_party, make_user
+):
+    brand = make_brand()
+    party = make_party(brand)
+    user = make_user()
+
+    def is_locked_elsewhere():
+        brand_key = db.func.hashtext(f'ticket_attendance_counts:{brand.id}')
+        user_key = db.func.hashtext(str(user.id))
+        with db.engine.connect() as connection:
+            acquired = connection.scalar(
+                select(db.func.pg_try_advisory_xact_lock(brand_key, user_key))
+            )
+            connection.rollback()
+        return not acquired
+
+    ticket_attendance_service.update_attendance_counts(party.id, {user.id})
+    assert is_locked_elsewhere()
+
+    db.session.commit()
+    assert not is_locked_elsewhere()
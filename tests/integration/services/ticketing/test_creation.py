@@ -36,6 +36,24 @@ def test_create_ticket_with_existing_code(
         ticket_creation_service.create_ticket(category, ticket_owner)
 
 
+@patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
+def test_create_ticket_avoids_existing_code(
+    generate_ticket_code_mock, admin_app, category, ticket_owner
+):
+    generate_ticket_code_mock.return_value = 'INUSE'
+
+    existing_ticket = ticket_creation_service.create_ticket(
+        category, ticket_owner
+    )
+    assert existing_ticket.code == 'INUSE'
+
+    generate_ticket_code_mock.return_value = None
+    generate_ticket_code_mock.side_effect = ['INUSE', 'UNUSD']
+
+    ticket = ticket_creation_service.create_ticket(category, ticket_owner)
+    assert ticket.code == 'UNUSD'
+
+
 def test_create_tickets(admin_app, category, ticket_owner):
     quantity = 3
     tickets = ticket_creation_service.create_tickets(
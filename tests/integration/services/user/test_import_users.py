@@ -0,0 +1,61 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import json
+
+from byceps.services.authn.password import authn_password_service
+from byceps.services.user import (
+    user_import_service,
+    user_log_service,
+    user_service,
+)
+
+from tests.helpers import generate_token
+
+
+def test_import_users(database, make_user):
+    existing_user = make_user()
+
+    token = generate_token()
+    screen_name1 = f'Imported1-{token}'
+    screen_name2 = f'Imported2-{token}'
+    email_address1 = f'imported1-{token}@users.test'
+
+    records = [
+        {
+            'screen_name': screen_name1,
+            'email_address': email_address1.upper(),
+            'first_name': 'Alice',
+        },
+        {'bad': 'data'},
+        {'screen_name': existing_user.screen_name.upper()},
+        {'screen_name': screen_name2, 'legacy_id': 'L-2'},
+        {'screen_name': f'Other-{token}', 'email_address': email_address1},
+        {'screen_name': 'has space'},
+    ]
+    lines = [json.dumps(record) for record in records]
+
+    summary = user_import_service.import_users(
+        lines, chunk_size=1, hashing_worker_count=2
+    )
+
+    assert summary.imported_count == 2
+    assert [error.line_number for error in summary.errors] == [2, 3, 5, 6]
+    assert 'already assigned' in summary.errors[1].message
+    assert 'already assigned' in summary.errors[2].message
+    assert summary.errors[3].message == 'Invalid screen name "has space"'
+
+    user1 = user_service.find_user_by_screen_name(screen_name1)
+    assert user1 is not None
+    assert user_service.get_email_address(user1.id) == email_address1
+    assert user_service.get_detail(user1.id).first_name == 'Alice'
+    assert authn_password_service._find_credential_for_user(user1.id)
+
+    log_entries = user_log_service.get_entries_for_user(user1.id)
+    assert [entry.event_type for entry in log_entries] == ['user-created']
+    assert log_entries[0].data == {'creation_method': 'import'}
+
+    user2 = user_service.find_user_by_screen_name(screen_name2)
+    assert user2 is not None
@@ -3,12 +3,14 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from io import BytesIO
 from pathlib import Path
 
 import pytest
 
-from byceps.services.user import user_avatar_service
-from byceps.util.image.models import ImageType
+from byceps.services.user import user_avatar_service, user_service
+from byceps.util.image import read_dimensions
+from byceps.util.image.models import Dimensions, ImageType
 
 
 @pytest.mark.parametrize(
@@ -20,7 +22,7 @@ from byceps.util.image.models import ImageType
 )
 def test_path(data_path, database, user, image_extension, image_type):
     with Path(f'tests/fixtures/images/image.{image_extension}').open('rb') as f:
-        avatar, _ = user_avatar_service.update_avatar_image(
+        avatar = user_avatar_service.update_avatar_image(
             user, f, {image_type}, user
         ).unwrap()
 
@@ -28,3 +30,57 @@ def test_path(data_path, database, user, image_extension, image_type):
     expected = data_path / 'global' / 'users' / 'avatars' / expected_filename
 
     assert avatar.path == expected
+
+
+def test_image_is_processed(data_path, database, make_user):
+    user = make_user()
+
+    with Path('tests/fixtures/images/image.png').open('rb') as f:
+        avatar = user_avatar_service.update_avatar_image(
+            user, f, {ImageType.png}, user
+        ).unwrap()
+
+    # The image is cropped to be square (in the background).
+    assert read_dimensions(avatar.path) == Dimensions(8, 8)
+
+    assert {
+        path.name for path in avatar.path.parent.glob(f'*{avatar.id}*')
+    } == {
+        f'{avatar.id}.png',
+        f'{avatar.id}-512x512.webp',
+        f'{avatar.id}-128x128.png',
+        f'{avatar.id}-128x128.webp',
+        f'{avatar.id}-48x48.png',
+        f'{avatar.id}-48x48.webp',
+    }
+
+    # Only then is it set as the user's avatar.
+    assert user_service.get_user(user.id, include_avatar=True).avatar_url == (
+        avatar.url
+    )
+
+
+def test_current_avatar_is_kept_if_processing_fails(
+    data_path, database, make_user
+):
+    user = make_user()
+
+    with Path('tests/fixtures/images/image.png').open('rb') as f:
+        current_avatar = user_avatar_service.update_avatar_image(
+            user, f, {ImageType.png}, user
+        ).unwrap()
+
+    # Keep the header (so that type and dimensions can be determined),
+    # but cut off the image data.
+    image_data = Path('tests/fixtures/images/image.png').read_bytes()
+    image_data_offset = image_data.index(b'IDAT') + 4
+    truncated_stream = BytesIO(image_data[: image_data_offset + 2])
+
+    avatar = user_avatar_service.update_avatar_image(
+        user, truncated_stream, {ImageType.png}, user
+    ).unwrap()
+
+    assert user_service.get_user(user.id, include_avatar=True).avatar_url == (
+        current_avatar.url
+    )
+    assert list(avatar.path.parent.glob(f'*{avatar.id}*')) == []
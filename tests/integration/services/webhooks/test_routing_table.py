@@ -0,0 +1,46 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.webhooks import webhook_service
+
+
+EVENT_TYPE = 'routing-table-test-event'
+
+
+def test_routing_table_follows_changes(admin_app):
+    assert get_enabled_webhook_ids() == set()
+
+    webhook = webhook_service.create_outgoing_webhook(
+        {EVENT_TYPE}, {}, 'discord', 'https://webhooks.test/', True
+    )
+    assert get_enabled_webhook_ids() == {webhook.id}
+
+    update_webhook(webhook, enabled=False)
+    assert get_enabled_webhook_ids() == set()
+
+    update_webhook(webhook, enabled=True)
+    assert get_enabled_webhook_ids() == {webhook.id}
+
+    webhook_service.delete_outgoing_webhook(webhook.id)
+    assert get_enabled_webhook_ids() == set()
+
+
+def get_enabled_webhook_ids():
+    webhooks = webhook_service.get_enabled_outgoing_webhooks(EVENT_TYPE)
+    return {webhook.id for webhook in webhooks}
+
+
+def update_webhook(webhook, *, enabled: bool) -> None:
+    webhook_service.update_outgoing_webhook(
+        webhook.id,
+        webhook.event_types,
+        webhook.event_filters,
+        webhook.format,
+        webhook.text_prefix,
+        webhook.extra_fields,
+        webhook.url,
+        webhook.description,
+        enabled,
+    ).unwrap()
@@ -0,0 +1,68 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from pathlib import Path
+
+from werkzeug.exceptions import NotFound
+
+from byceps.app_dispatcher import (
+    AppDispatcher,
+    create_dispatcher_app,
+    parse_apps_config,
+)
+from byceps.byceps_app import BycepsApp
+
+from .conftest import _merge_config_overrides
+
+
+APPS_CONFIG = """
+[admin]
+server_name = "admin.warm-up.test"
+
+[[sites]]
+server_name = "site1.warm-up.test"
+site_id = "warm-up-site-1"
+
+[[sites]]
+server_name = "site2.warm-up.test"
+site_id = "warm-up-site-2"
+"""
+
+
+def test_warm_up_mounts_all_apps(database, data_path: Path):
+    app = create_dispatcher(data_path, warm_up_worker_count=2)
+    dispatcher = app.wsgi_app
+
+    assert set(dispatcher.apps_by_host) == {
+        'admin.warm-up.test',
+        'site1.warm-up.test',
+        'site2.warm-up.test',
+    }
+
+    # Mounted applications are served as they are.
+    admin_app = dispatcher.apps_by_host['admin.warm-up.test']
+    assert isinstance(admin_app, BycepsApp)
+    assert dispatcher.get_application('admin.warm-up.test:80') is admin_app
+
+
+def test_apps_are_mounted_lazily_by_default(database, data_path: Path):
+    app = create_dispatcher(data_path)
+    dispatcher: AppDispatcher = app.wsgi_app
+
+    assert dispatcher.apps_by_host == {}
+
+    site_app = dispatcher.get_application('site1.warm-up.test')
+    assert isinstance(site_app, BycepsApp)
+    assert set(dispatcher.apps_by_host) == {'site1.warm-up.test'}
+
+    assert isinstance(dispatcher.get_application('unknown.test'), NotFound)
+
+
+def create_dispatcher(data_path: Path, **kwargs):
+    apps_config = parse_apps_config(APPS_CONFIG).unwrap()
+    config_overrides = _merge_config_overrides({}, data_path, None)
+    return create_dispatcher_app(
+        apps_config, config_overrides=config_overrides, **kwargs
+    )
@@ -0,0 +1,37 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from rq import Queue
+from rq.job import JobStatus
+from sqlalchemy import text
+
+from byceps.database import db
+from byceps.util.jobqueue import AppContextPerJobWorker
+
+from tests.helpers import generate_token
+
+
+def fail_mid_transaction() -> None:
+    db.session.execute(text('SELECT 1 / 0'))
+
+
+def query_database() -> int:
+    return db.session.scalar(text('SELECT 1'))
+
+
+def test_failed_job_does_not_affect_next_job(admin_app):
+    queue = Queue(generate_token(), connection=admin_app.redis_client)
+
+    failing_job = queue.enqueue(fail_mid_transaction)
+    next_job = queue.enqueue(query_database)
+
+    worker = AppContextPerJobWorker(
+        admin_app, [queue], connection=admin_app.redis_client
+    )
+    worker.work(burst=True)
+
+    assert failing_job.get_status() == JobStatus.FAILED
+    assert next_job.get_status() == JobStatus.FINISHED
+    assert next_job.return_value() == 1
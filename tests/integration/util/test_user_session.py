@@ -0,0 +1,83 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.authn.session import (
+    authn_session_service,
+    current_user_cache,
+)
+from byceps.services.authz import authz_service
+from byceps.services.user import user_command_service
+from byceps.util import user_session
+
+from tests.helpers import generate_token
+
+
+def test_get_current_user_is_cached_until_changes(
+    site_app, make_user, make_role, admin_user
+):
+    user = make_user()
+    auth_token = str(authn_session_service.get_session_token(user.id).token)
+
+    with site_app.test_request_context():
+        user_session.start(user.id, auth_token)
+
+        current_user = user_session.get_current_user(set())
+        assert current_user.authenticated
+        assert current_user_cache.find(user.id, auth_token) is not None
+
+        # Changes to the account invalidate the cached entry.
+        new_screen_name = generate_token()
+        user_command_service.change_screen_name(
+            user, new_screen_name, admin_user
+        )
+        assert current_user_cache.find(user.id, auth_token) is None
+
+        current_user = user_session.get_current_user(set())
+        assert current_user.screen_name == new_screen_name
+
+        # So do role assignments.
+        role = make_role()
+        authz_service.assign_permission_to_role('admin.access', role.id)
+        authz_service.assign_role_to_user(role.id, user)
+        assert current_user_cache.find(user.id, auth_token) is None
+
+        current_user = user_session.get_current_user(set())
+        assert 'admin.access' in current_user.permissions
+
+        # So does deleting the user's session token.
+        authn_session_service.delete_session_tokens_for_user(user.id)
+        assert current_user_cache.find(user.id, auth_token) is None
+
+        current_user = user_session.get_current_user(set())
+        assert not current_user.authenticated
+
+
+def test_data_loaded_before_invalidation_is_not_cached(site_app, make_user):
+    user = make_user()
+    auth_token = generate_token()
+    permissions = frozenset({'admin.access'})
+
+    with site_app.app_context():
+        generation = current_user_cache.get_generation(user.id)
+
+        # The user's roles change (and the cache is invalidated) while
+        # the user's permissions are being loaded.
+        current_user_cache.invalidate_user(user.id)
+
+        current_user_cache.store(auth_token, user, permissions, generation)
+        assert current_user_cache.find(user.id, auth_token) is None
+
+        # The same goes for invalidating all entries.
+        generation = current_user_cache.get_generation(user.id)
+        current_user_cache.invalidate_all()
+
+        current_user_cache.store(auth_token, user, permissions, generation)
+        assert current_user_cache.find(user.id, auth_token) is None
+
+        # Without invalidation in between, data is stored.
+        generation = current_user_cache.get_generation(user.id)
+
+        current_user_cache.store(auth_token, user, permissions, generation)
+        assert current_user_cache.find(user.id, auth_token) is not None
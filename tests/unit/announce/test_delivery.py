@@ -0,0 +1,66 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.announce import delivery
+from byceps.services.webhooks.models import AnnouncementRequest, WebhookID
+
+from tests.helpers import generate_uuid
+
+
+WEBHOOK_ID = WebhookID(generate_uuid())
+
+
+def test_coalesce():
+    other_webhook_id = WebhookID(generate_uuid())
+
+    announcement_requests = [
+        build_request('one'),
+        build_request('two'),
+        build_request('three', webhook_id=other_webhook_id),
+        build_request('four'),
+        build_request('five', format='weitersager'),
+        build_request('six', format='weitersager'),
+    ]
+
+    actual = delivery.coalesce(announcement_requests)
+
+    assert [r.data['content'] for r in actual] == [
+        'one\ntwo',
+        'three',
+        'four',
+        'five',
+        'six',
+    ]
+
+
+def test_coalesce_respects_maximum_text_length():
+    # Discord accepts up to 2000 characters.
+    texts = ['a' * 900, 'b' * 900, 'c' * 900, 'd' * 199, 'e' * 2000]
+    announcement_requests = [build_request(text) for text in texts]
+
+    actual = delivery.coalesce(announcement_requests)
+
+    assert [r.data['content'] for r in actual] == [
+        texts[0] + '\n' + texts[1],
+        texts[2] + '\n' + texts[3],
+        texts[4],
+    ]
+    assert all(len(r.data['content']) <= 2000 for r in actual)
+
+
+def build_request(
+    text: str,
+    *,
+    webhook_id: WebhookID = WEBHOOK_ID,
+    url: str = 'https://webhooks.test/',
+    format: str = 'discord',
+) -> AnnouncementRequest:
+    return AnnouncementRequest(
+        webhook_id=webhook_id,
+        url=url,
+        data={'content': text},
+        expected_response_status_code=204,
+        format=format,
+    )
@@ -11,6 +11,7 @@ from byceps.config.models import (
     DebugConfig,
     JobsConfig,
     MetricsConfig,
+    PasswordHashingConfig,
     RedisConfig,
     SmtpConfig,
     StyleguideConfig,
@@ -31,6 +32,9 @@ def test_convert_config():
         'MAIL_USE_SSL': False,
         'MAIL_USERNAME': 'smtpuser',
         'METRICS_ENABLED': True,
+        'PASSWORD_HASHING_MAX_CONCURRENCY': 8,
+        'PASSWORD_HASHING_QUEUE_TIMEOUT': 5,
+        'PASSWORD_HASHING_WORKERS': 2,
         'PROPAGATE_EXCEPTIONS': True,
         'REDIS_URL': 'redis://127.0.0.1:6379/0',
         'SECRET_KEY': '<RANDOM-BYTES>',
@@ -68,6 +72,11 @@ def test_convert_config():
         metrics=MetricsConfig(
             enabled=True,
         ),
+        password_hashing=PasswordHashingConfig(
+            workers=2,
+            max_concurrency=8,
+            queue_timeout=5,
+        ),
         payment_gateways={},
         redis=RedisConfig(
             url='redis://127.0.0.1:6379/0',
@@ -14,6 +14,7 @@ from byceps.config.models import (
     DiscordConfig,
     JobsConfig,
     MetricsConfig,
+    PasswordHashingConfig,
     PaymentGatewaysConfig,
     PaypalConfig,
     RedisConfig,
@@ -72,6 +73,11 @@ def test_parse_config():
             metrics=MetricsConfig(
                 enabled=True,
             ),
+            password_hashing=PasswordHashingConfig(
+                workers=2,
+                max_concurrency=8,
+                queue_timeout=5,
+            ),
             payment_gateways=PaymentGatewaysConfig(
                 paypal=PaypalConfig(
                     enabled=True,
@@ -140,6 +146,11 @@ def test_parse_config():
     [metrics]
     enabled = true
 
+    [password_hashing]
+    workers = 2
+    max_concurrency = 8
+    queue_timeout = 5
+
     [payment_gateways.paypal]
     enabled = true
     client_id = "paypal-client-id"
@@ -201,6 +212,11 @@ def test_parse_config_defaults():
             metrics=MetricsConfig(
                 enabled=False,
             ),
+            password_hashing=PasswordHashingConfig(
+                workers=0,
+                max_concurrency=4,
+                queue_timeout=10,
+            ),
             payment_gateways=None,
             redis=RedisConfig(
                 url='redis://127.0.0.1:6379/0',
@@ -263,3 +279,34 @@ def test_parse_incomplete_config():
     """
 
     assert parse_config(toml) == expected
+
+
+def test_parse_config_with_value_below_minimum():
+    expected = Err(
+        [
+            'Value "0" for key "max_concurrency" in section "password_hashing" must be at least 1',
+        ]
+    )
+
+    toml = """\
+    locale = "en"
+    secret_key = "<RANDOM-BYTES>"
+    timezone = "Europe/London"
+
+    [apps]
+
+    [database]
+    username = "db-user"
+    password = "db-password"
+    database = "db-database"
+
+    [password_hashing]
+    max_concurrency = 0
+
+    [redis]
+    url = "redis://127.0.0.1:6379/0"
+
+    [smtp]
+    """
+
+    assert parse_config(toml) == expected
@@ -0,0 +1,36 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.email import email_service
+from byceps.services.email.models import Message, NameAndAddress
+
+
+def test_enqueue_messages_in_batches(monkeypatch):
+    enqueued_jobs = []
+    monkeypatch.setattr(
+        email_service,
+        'enqueue',
+        lambda func, *args: enqueued_jobs.append((func, args)),
+    )
+    monkeypatch.setattr(email_service, 'BATCH_SIZE', 2)
+
+    sender = NameAndAddress('ACME', 'noreply@acmecon.test')
+    messages = [
+        Message(sender, [f'user{i}@users.test'], 'Hi', 'Hello!')
+        for i in range(5)
+    ]
+
+    email_service.enqueue_messages(messages)
+
+    assert [func for func, _ in enqueued_jobs] == [
+        email_service.send_emails
+    ] * 3
+    assert [len(args[0]) for _, args in enqueued_jobs] == [2, 2, 1]
+    assert enqueued_jobs[0][1][0][0] == (
+        'ACME <noreply@acmecon.test>',
+        ['user0@users.test'],
+        'Hi',
+        'Hello!',
+    )
@@ -0,0 +1,102 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from email.message import EmailMessage
+from smtplib import SMTPServerDisconnected
+
+import pytest
+
+from byceps.services.email import smtp_client
+from byceps.services.email.smtp_client import SmtpClient, SmtpConfig
+
+
+CONFIG = SmtpConfig(
+    host='smtp.acmecon.test',
+    port=587,
+    starttls=True,
+    use_ssl=False,
+    username='mailer',
+    password='secret',
+    suppress_send=False,
+)
+
+
+class FakeSmtp:
+    instances: list['FakeSmtp'] = []
+
+    def __init__(self, host, port):
+        self.sent_messages = []
+        self.logged_in = False
+        self.disconnected = False
+        self.closed = False
+        FakeSmtp.instances.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        self.logged_in = True
+
+    def send_message(self, message):
+        if self.disconnected:
+            raise SMTPServerDisconnected
+        self.sent_messages.append(message)
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture()
+def fake_smtp(monkeypatch):
+    FakeSmtp.instances = []
+    monkeypatch.setattr(smtp_client, 'SMTP', FakeSmtp)
+    return FakeSmtp
+
+
+def test_connection_is_reused(fake_smtp):
+    client = SmtpClient(CONFIG)
+
+    client.send_message(build_message('one'))
+    client.send_message(build_message('two'))
+
+    assert len(fake_smtp.instances) == 1
+    connection = fake_smtp.instances[0]
+    assert connection.logged_in
+    assert [m['Subject'] for m in connection.sent_messages] == ['one', 'two']
+
+
+def test_reconnect_on_lost_connection(fake_smtp):
+    client = SmtpClient(CONFIG)
+
+    client.send_message(build_message('one'))
+    fake_smtp.instances[0].disconnected = True
+    client.send_message(build_message('two'))
+
+    assert len(fake_smtp.instances) == 2
+    assert fake_smtp.instances[0].closed
+    assert [m['Subject'] for m in fake_smtp.instances[1].sent_messages] == [
+        'two'
+    ]
+
+
+def test_reconnect_after_idling(fake_smtp, monkeypatch):
+    client = SmtpClient(CONFIG)
+
+    client.send_message(build_message('one'))
+    monkeypatch.setattr(smtp_client, 'MAXIMUM_IDLE_SECONDS', -1)
+    client.send_message(build_message('two'))
+
+    assert len(fake_smtp.instances) == 2
+    assert fake_smtp.instances[0].closed
+
+
+def build_message(subject: str) -> EmailMessage:
+    message = EmailMessage()
+    message['Subject'] = subject
+    message.set_content('Hi!')
+    return message
@@ -43,7 +43,7 @@ def test_export_addresses_for_netbox(party, make_user, make_server):
         servers, setting
     )
 
-    assert list(actual) == [
+    assert ''.join(actual).splitlines(keepends=True) == [
         'address,status,dns_name,description\r\n',
         '10.0.100.104/24,active,hundertvier.lan,Owner A\r\n',
         '10.0.100.106/24,active,hundertsechs.lan,Owner B\r\n',
@@ -0,0 +1,26 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.image import image_service
+from byceps.util.image.models import Dimensions
+
+
+@pytest.mark.parametrize(
+    ('dimensions', 'expected_ok'),
+    [
+        (Dimensions(10, 10), True),
+        (Dimensions(10, 20), True),
+        (Dimensions(10, 21), False),
+        (Dimensions(201, 1), False),
+    ],
+)
+def test_check_pixel_count(dimensions, expected_ok):
+    result = image_service.check_pixel_count(
+        dimensions, maximum_pixel_count=200
+    )
+
+    assert result.is_ok() == expected_ok
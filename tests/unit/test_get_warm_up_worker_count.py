@@ -0,0 +1,41 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.app_dispatcher import get_warm_up_worker_count
+from byceps.util.result import Err, Ok
+
+
+ENV_VAR_NAME = 'BYCEPS_APPS_WARM_UP_WORKERS'
+
+
+def test_get_warm_up_worker_count_without_env_var(monkeypatch):
+    monkeypatch.delenv(ENV_VAR_NAME, raising=False)
+
+    assert get_warm_up_worker_count() == Ok(0)
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('', Ok(0)),
+        ('0', Ok(0)),
+        ('4', Ok(4)),
+    ],
+)
+def test_get_warm_up_worker_count_with_valid_value(
+    monkeypatch, value, expected
+):
+    monkeypatch.setenv(ENV_VAR_NAME, value)
+
+    assert get_warm_up_worker_count() == expected
+
+
+@pytest.mark.parametrize('value', ['-1', 'many'])
+def test_get_warm_up_worker_count_with_invalid_value(monkeypatch, value):
+    monkeypatch.setenv(ENV_VAR_NAME, value)
+
+    assert isinstance(get_warm_up_worker_count(), Err)
@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from byceps.util.image import read_dimensions
+from byceps.util.image import create_thumbnails, read_dimensions
 from byceps.util.image.models import Dimensions, ImageType
 from byceps.util.image.typeguess import guess_type
 
@@ -53,6 +53,32 @@ def test_read_dimensions(filename_suffix, expected_width, expected_height):
     assert actual == expected
 
 
+def test_create_thumbnails():
+    with open_image_with_suffix('jpeg') as f:
+        thumbnails = create_thumbnails(
+            f,
+            ImageType.jpeg,
+            [Dimensions(4, 4), Dimensions(6, 6)],
+            force_square=True,
+            additional_image_types=[ImageType.webp],
+        )
+
+    assert [
+        (
+            thumbnail.maximum_dimensions,
+            thumbnail.image_type,
+            guess_type(thumbnail.stream),
+            read_dimensions(thumbnail.stream),
+        )
+        for thumbnail in thumbnails
+    ] == [
+        (Dimensions(6, 6), ImageType.jpeg, ImageType.jpeg, Dimensions(6, 6)),
+        (Dimensions(6, 6), ImageType.webp, ImageType.webp, Dimensions(6, 6)),
+        (Dimensions(4, 4), ImageType.jpeg, ImageType.jpeg, Dimensions(4, 4)),
+        (Dimensions(4, 4), ImageType.webp, ImageType.webp, Dimensions(4, 4)),
+    ]
+
+
 def open_image_with_suffix(suffix):
     filename = Path('image').with_suffix('.' + suffix)
     return open_image(filename)
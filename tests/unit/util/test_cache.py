@@ -0,0 +1,96 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import timedelta
+
+from freezegun import freeze_time
+
+from byceps.util.cache import CacheStats, TtlCache
+
+
+def test_get_missing():
+    cache = TtlCache(timedelta(minutes=1))
+
+    assert cache.get('key') is None
+
+
+def test_set_and_get():
+    cache = TtlCache(timedelta(minutes=1))
+
+    cache.set('key', 'value')
+
+    assert cache.get('key') == 'value'
+
+
+def test_expiry():
+    cache = TtlCache(timedelta(minutes=1))
+
+    with freeze_time('2025-03-14 12:00:00') as frozen_time:
+        cache.set('key', 'value')
+
+        frozen_time.tick(timedelta(seconds=59))
+        assert cache.get('key') == 'value'
+
+        frozen_time.tick(timedelta(seconds=1))
+        assert cache.get('key') is None
+
+
+def test_get_or_set():
+    cache = TtlCache(timedelta(minutes=1))
+    calls = []
+
+    def compute():
+        calls.append(None)
+        return 'value'
+
+    assert cache.get_or_set('key', compute) == 'value'
+    assert cache.get_or_set('key', compute) == 'value'
+    assert len(calls) == 1
+
+
+def test_delete():
+    cache = TtlCache(timedelta(minutes=1))
+    cache.set('key1', 'value1')
+    cache.set('key2', 'value2')
+
+    cache.delete('key1')
+
+    assert cache.get('key1') is None
+    assert cache.get('key2') == 'value2'
+
+
+def test_clear():
+    cache = TtlCache(timedelta(minutes=1))
+    cache.set('key1', 'value1')
+    cache.set('key2', 'value2')
+
+    cache.clear()
+
+    assert cache.get('key1') is None
+    assert cache.get('key2') is None
+
+
+def test_eviction_of_least_recently_used_entry():
+    cache = TtlCache(timedelta(minutes=1), max_size=2)
+    cache.set('key1', 'value1')
+    cache.set('key2', 'value2')
+    cache.get('key1')
+
+    cache.set('key3', 'value3')
+
+    assert cache.get('key1') == 'value1'
+    assert cache.get('key2') is None
+    assert cache.get('key3') == 'value3'
+
+
+def test_stats():
+    cache = TtlCache(timedelta(minutes=1))
+    cache.set('key', 'value')
+
+    cache.get('key')
+    cache.get('key')
+    cache.get('other key')
+
+    assert cache.get_stats() == CacheStats(hits=2, misses=1, size=1)
@@ -16,12 +16,12 @@ def test_serialize_dicts_to_csv():
 
     actual = serialize_dicts_to_csv(field_names, rows, delimiter=';')
 
-    assert list(actual) == [
-        'name;color\r\n',
-        'Sonic the Hedgehog;blue\r\n',
-        'Pac-Man;yellow\r\n',
-        'Ultraman;white/red\r\n',
-    ]
+    assert ''.join(actual) == (
+        'name;color\r\n'
+        'Sonic the Hedgehog;blue\r\n'
+        'Pac-Man;yellow\r\n'
+        'Ultraman;white/red\r\n'
+    )
 
 
 def test_serialize_tuples_to_csv():
@@ -34,9 +34,35 @@ def test_serialize_tuples_to_csv():
 
     actual = serialize_tuples_to_csv(rows)
 
+    assert ''.join(actual) == (
+        'name,color\r\n'
+        'Sonic the Hedgehog,blue\r\n'
+        'Pac-Man,yellow\r\n'
+        'Ultraman,white/red\r\n'
+    )
+
+
+def test_serialize_tuples_to_csv_in_chunks():
+    rows = (('item', str(i)) for i in range(5))
+
+    actual = serialize_tuples_to_csv(rows, rows_per_chunk=2)
+
     assert list(actual) == [
-        'name,color\r\n',
-        'Sonic the Hedgehog,blue\r\n',
-        'Pac-Man,yellow\r\n',
-        'Ultraman,white/red\r\n',
+        'item,0\r\nitem,1\r\n',
+        'item,2\r\nitem,3\r\n',
+        'item,4\r\n',
     ]
+
+
+def test_serialize_consumes_rows_lazily():
+    consumed_rows = []
+
+    def generate_rows():
+        for i in range(4):
+            consumed_rows.append(i)
+            yield ('item', str(i))
+
+    chunks = serialize_tuples_to_csv(generate_rows(), rows_per_chunk=2)
+
+    assert next(chunks) == 'item,0\r\nitem,1\r\n'
+    assert consumed_rows == [0, 1]
@@ -0,0 +1,52 @@
+"""
+:Copyright: 2014-2025 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.util.templating import get_template_cache_stats, load_template
+
+from tests.helpers import generate_token
+
+
+def test_load_template_reuses_compiled_template():
+    source = f'Hello, {{{{ name }}}}! ({generate_token()})'
+
+    stats_before = get_template_cache_stats()
+
+    template1 = load_template(source)
+    template2 = load_template(source)
+
+    assert template2 is template1
+    assert template1.render(name='World').startswith('Hello, World!')
+
+    stats_after = get_template_cache_stats()
+    assert stats_after.misses == stats_before.misses + 1
+    assert stats_after.hits == stats_before.hits + 1
+
+
+def test_load_template_caches_per_set_of_globals():
+    source = f'{{{{ greeting }}}}, {{{{ name }}}}! ({generate_token()})'
+
+    template_hello = load_template(
+        source, template_globals={'greeting': 'Hello'}
+    )
+    template_hi = load_template(source, template_globals={'greeting': 'Hi'})
+
+    assert template_hi is not template_hello
+    assert template_hello.render(name='World').startswith('Hello, World!')
+    assert template_hi.render(name='World').startswith('Hi, World!')
+
+    assert (
+        load_template(source, template_globals={'greeting': 'Hello'})
+        is template_hello
+    )
+
+
+def test_load_template_with_unhashable_globals():
+    source = '{{ names|join(", ") }}'
+
+    template = load_template(
+        source, template_globals={'names': ['Alice', 'Bob']}
+    )
+
+    assert template.render() == 'Alice, Bob'